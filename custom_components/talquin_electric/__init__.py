@@ -10,24 +10,35 @@ from __future__ import annotations
 from typing import TYPE_CHECKING
 
 from homeassistant.const import CONF_PASSWORD, CONF_USERNAME, Platform
-from homeassistant.helpers.aiohttp_client import async_get_clientsession
+from homeassistant.helpers import config_validation as cv
 from homeassistant.loader import async_get_loaded_integration
 
 from .api import TalquinElectricApiClient
+from .const import DOMAIN, USAGE_CACHE_TTL
 from .coordinator import BlueprintDataUpdateCoordinator
 from .data import TalquinElectricData
+from .services import async_setup_services
+from .store import TalquinElectricUsageStore
 
 if TYPE_CHECKING:
     from homeassistant.core import HomeAssistant
+    from homeassistant.helpers.typing import ConfigType
 
     from .data import TalquinElectricConfigEntry
 
 PLATFORMS: list[Platform] = [
     Platform.SENSOR,
     Platform.BINARY_SENSOR,
-    Platform.SWITCH,
 ]
 
+CONFIG_SCHEMA = cv.config_entry_only_config_schema(DOMAIN)
+
+
+async def async_setup(hass: HomeAssistant, config: ConfigType) -> bool:  # noqa: ARG001
+    """Set up the integration's services."""
+    async_setup_services(hass)
+    return True
+
 
 # https://developers.home-assistant.io/docs/config_entries_index/#setting-up-an-entry
 async def async_setup_entry(
@@ -37,21 +48,33 @@ async def async_setup_entry(
     """Set up this integration using UI."""
     coordinator = BlueprintDataUpdateCoordinator(
         hass=hass,
+        store=TalquinElectricUsageStore(hass, entry.entry_id),
     )
     entry.runtime_data = TalquinElectricData(
         client=TalquinElectricApiClient(
             username=entry.data[CONF_USERNAME],
             password=entry.data[CONF_PASSWORD],
-            session=async_get_clientsession(hass),
+            usage_cache_ttl=USAGE_CACHE_TTL,
         ),
         integration=async_get_loaded_integration(hass, entry.domain),
         coordinator=coordinator,
     )
 
-    # https://developers.home-assistant.io/docs/integration_fetching_data#coordinated-single-api-poll-for-data-for-all-entities
-    await coordinator.async_config_entry_first_refresh()
+    # Resume from the stored usage so the first refresh only fetches the delta.
+    await coordinator.async_load_stored_usage()
+
+    # With a stored snapshot, entities start from it (marked stale) and the
+    # first refresh runs in the background, so a slow or challenged API does
+    # not hold up Home Assistant startup.
+    if coordinator.data is None:
+        # https://developers.home-assistant.io/docs/integration_fetching_data#coordinated-single-api-poll-for-data-for-all-entities
+        await coordinator.async_config_entry_first_refresh()
 
     await hass.config_entries.async_forward_entry_setups(entry, PLATFORMS)
+    if coordinator.stale:
+        entry.async_create_background_task(
+            hass, coordinator.async_refresh(), f"{DOMAIN} first refresh"
+        )
     entry.async_on_unload(entry.add_update_listener(async_reload_entry))
 
     return True
@@ -62,7 +85,20 @@ async def async_unload_entry(
     entry: TalquinElectricConfigEntry,
 ) -> bool:
     """Handle removal of an entry."""
-    return await hass.config_entries.async_unload_platforms(entry, PLATFORMS)
+    unload_ok = await hass.config_entries.async_unload_platforms(entry, PLATFORMS)
+    if unload_ok:
+        # A reload creates a new store, so don't leave a delayed save behind
+        await entry.runtime_data.coordinator.async_flush_stored_usage()
+        await entry.runtime_data.client.async_close()
+    return unload_ok
+
+
+async def async_remove_entry(
+    hass: HomeAssistant,
+    entry: TalquinElectricConfigEntry,
+) -> None:
+    """Remove the stored usage of a deleted entry."""
+    await TalquinElectricUsageStore(hass, entry.entry_id).async_remove()
 
 
 async def async_reload_entry(
@@ -2,16 +2,55 @@
 
 from __future__ import annotations
 
+import asyncio
+import importlib
+import json
 import socket
-from datetime import datetime
 import ssl
-from typing import Any
+import sys
+import time
+from datetime import datetime
+from functools import cache, partial
+from http import HTTPStatus
+from typing import TYPE_CHECKING, Any
 
 import async_timeout
-import httpx
 
-from custom_components.talquin_electric.const import BASE_URL, TOKEN_URL, USER_AGENT
-from custom_components.talquin_electric.usage_entry import TalquinElectricUsageEntry
+from custom_components.talquin_electric.const import (
+    BASE_URL,
+    COMPRESSION_REJECTED_STATUS_CODES,
+    HTTP_KEEPALIVE_EXPIRY,
+    HTTP_MAX_CONNECTIONS,
+    HTTP_MAX_KEEPALIVE_CONNECTIONS,
+    HTTP_MODULES,
+    LOGGER,
+    RETRY_AFTER_STATUS_CODES,
+    RETRY_STATUS_CODES,
+    TOKEN_DEFAULT_EXPIRES_IN,
+    TOKEN_PATH,
+    TOKEN_REFRESH_MARGIN,
+    USAGE_STREAM_BATCH_SIZE,
+    USER_AGENT,
+    UsageInterval,
+)
+from custom_components.talquin_electric.metrics import ApiMetrics
+from custom_components.talquin_electric.resilience import (
+    CircuitBreaker,
+    CircuitState,
+    RetryPolicy,
+    parse_retry_after,
+)
+from custom_components.talquin_electric.timestamps import parse_timestamps
+from custom_components.talquin_electric.tracing import Tracer
+from custom_components.talquin_electric.usage_series import UsageSeries
+
+if TYPE_CHECKING:
+    from collections.abc import AsyncIterator
+
+    import httpx
+
+# Usage queries are identified by (account ID, start, end, interval, conditional)
+type _UsageQuery = tuple[str, datetime, datetime, str, bool]
 
 
 class TalquinElectricApiClientError(Exception):
@@ -30,20 +69,65 @@ class TalquinElectricApiClientAuthenticationError(
     """Exception to indicate an authentication error."""
 
 
+class TalquinElectricApiClientChallengeError(
+    TalquinElectricApiClientCommunicationError,
+):
+    """Exception to indicate a Cloudflare challenge instead of an API response."""
+
+
+class TalquinElectricApiClientCircuitOpenError(
+    TalquinElectricApiClientCommunicationError,
+):
+    """Exception to indicate the API is not called after repeated failures."""
+
+
+class TalquinElectricApiClientNotModifiedError(Exception):
+    """Exception to indicate a conditional request found the data unchanged."""
+
+
 def _verify_response_or_raise(response: httpx.Response) -> None:
     """Verify that the response is valid."""
     if response.status_code in (401, 403):
         if response.headers.get("cf-mitigated") == "challenge":
             msg = "Cloudflare challenge received"
-        else:
-            msg = "Invalid credentials"
+            raise TalquinElectricApiClientChallengeError(
+                msg,
+            )
+        msg = "Invalid credentials"
         raise TalquinElectricApiClientAuthenticationError(
             msg,
         )
     response.raise_for_status()
 
 
+def _is_retryable(exception: Exception) -> bool:
+    """Return True if a failed request is worth retrying."""
+    import httpx
+
+    match exception:
+        case TimeoutError() | httpx.TransportError():
+            return True
+        case httpx.HTTPStatusError():
+            return exception.response.status_code in RETRY_STATUS_CODES
+        case _:
+            return False
+
+
+def _retry_after(exception: Exception) -> float | None:
+    """Get the wait the server asked for before retrying, if any."""
+    import httpx
+
+    if (
+        isinstance(exception, httpx.HTTPStatusError)
+        and exception.response.status_code in RETRY_AFTER_STATUS_CODES
+    ):
+        return parse_retry_after(exception.response.headers.get("retry-after"))
+    return None
+
+
 def _handle_exception(exception: Exception) -> None:
+    import httpx
+
     match exception:
         case TimeoutError():
             msg = f"Timeout error fetching information - {exception}"
@@ -56,9 +140,12 @@ def _handle_exception(exception: Exception) -> None:
                 msg,
             ) from exception
         case (
-            TalquinElectricApiClientCommunicationError()
+            TalquinElectricApiClientChallengeError()
+            | TalquinElectricApiClientCircuitOpenError()
+            | TalquinElectricApiClientCommunicationError()
             | TalquinElectricApiClientAuthenticationError()
             | TalquinElectricApiClientError()
+            | TalquinElectricApiClientNotModifiedError()
         ):
             raise exception
         case _:
@@ -68,6 +155,7 @@ def _handle_exception(exception: Exception) -> None:
             ) from exception
 
 
+@cache
 def _ssl_context() -> ssl.SSLContext:
     """Get a Cloudflare-friendly SSL context."""
     context = ssl.create_default_context()
@@ -75,13 +163,129 @@ def _ssl_context() -> ssl.SSLContext:
     return context
 
 
+async def async_get_ssl_context() -> ssl.SSLContext:
+    """
+    Get the shared Cloudflare-friendly SSL context.
+
+    Loading the CA bundle does blocking disk I/O, so the context is built once
+    in an executor and reused by every client in the process.
+    """
+    if _ssl_context.cache_info().currsize:
+        return _ssl_context()
+    return await asyncio.get_running_loop().run_in_executor(None, _ssl_context)
+
+
+def _import_http_modules() -> None:
+    """Import httpx and the h2 protocol it speaks, which blocks for a while."""
+    for name in HTTP_MODULES:
+        importlib.import_module(name)
+
+
+async def async_import_http_modules() -> None:
+    """Import httpx and h2 in an executor unless they are already loaded."""
+    if all(name in sys.modules for name in HTTP_MODULES):
+        return
+    await asyncio.get_running_loop().run_in_executor(None, _import_http_modules)
+
+
+def invalidate_ssl_context() -> None:
+    """Drop the shared SSL context so the next request reloads the CA store."""
+    _ssl_context.cache_clear()
+
+
 class TalquinElectricApiClient:
     """Very simple API client for Talquin Electric energy data."""
 
-    def __init__(self, username: str, password: str) -> None:
-        """Talquin Electric API Client."""
+    def __init__(  # noqa: PLR0913
+        self,
+        username: str,
+        password: str,
+        *,
+        max_connections: int = HTTP_MAX_CONNECTIONS,
+        max_keepalive_connections: int = HTTP_MAX_KEEPALIVE_CONNECTIONS,
+        keepalive_expiry: float = HTTP_KEEPALIVE_EXPIRY,
+        compression: bool = False,
+        retry_policy: RetryPolicy | None = None,
+        circuit_breaker: CircuitBreaker | None = None,
+        usage_cache_ttl: float = 0.0,
+        base_url: str = BASE_URL,
+        ssl_context: ssl.SSLContext | None = None,
+        transport: httpx.AsyncBaseTransport | None = None,
+    ) -> None:
+        """
+        Talquin Electric API Client.
+
+        With `compression`, responses are requested gzip/deflate (or br)
+        encoded; if the edge rejects that, the client falls back to
+        uncompressed responses for the rest of its lifetime.
+
+        Timeouts, transport errors, 429 and 5xx responses are retried per
+        `retry_policy`; repeated failures or a Cloudflare challenge open
+        `circuit_breaker`, and requests then fail fast until it cools down.
+
+        Concurrent identical usage queries share one upstream call, and with
+        `usage_cache_ttl` its result is reused for that many seconds.
+
+        `base_url` and `ssl_context` point the client at another server, such
+        as a local stand-in for tests and benchmarks.
+        """
         self._username = username
         self._password = password
+        self._limits = {
+            "max_connections": max_connections,
+            "max_keepalive_connections": max_keepalive_connections,
+            "keepalive_expiry": keepalive_expiry,
+        }
+        self._compression = compression
+        self._retry_policy = retry_policy or RetryPolicy()
+        self._circuit_breaker = circuit_breaker or CircuitBreaker()
+        self._retry_count = 0
+        self._metrics = ApiMetrics()
+        self._tracer = Tracer()
+        self._usage_cache_ttl = usage_cache_ttl
+        self._usage_in_flight: dict[_UsageQuery, asyncio.Task[UsageSeries | None]] = {}
+        self._usage_cache: dict[_UsageQuery, tuple[float, UsageSeries | None]] = {}
+        self._base_url = base_url
+        self._ssl_context = ssl_context
+        self._transport = transport
+        self._client: httpx.AsyncClient | None = None
+        # Validators of the last response per URL path, for conditional requests
+        self._validators: dict[str, tuple[str, str | None, str | None]] = {}
+        self._client_ssl_context: ssl.SSLContext | None = None
+        self._access_token: str | None = None
+        self._access_token_expires_at = 0.0
+        self._access_token_lock = asyncio.Lock()
+
+    async def _async_get_client(self) -> httpx.AsyncClient:
+        """
+        Get the pooled HTTP/2 client, creating it on first use.
+
+        httpx and h2 are imported here rather than with the module, so they
+        add nothing to Home Assistant startup before the first request, and
+        in an executor, so the import doesn't block the event loop.
+        """
+        await async_import_http_modules()
+        import httpx
+
+        ssl_context = self._ssl_context or await async_get_ssl_context()
+        if self._client is not None and self._client_ssl_context is not ssl_context:
+            # The shared context was invalidated; reconnect with the new one.
+            await self.async_close()
+        if self._client is None or self._client.is_closed:
+            self._client = httpx.AsyncClient(
+                http2=True,
+                verify=ssl_context,
+                limits=httpx.Limits(**self._limits),
+                transport=self._transport,
+            )
+            self._client_ssl_context = ssl_context
+        return self._client
+
+    async def async_close(self) -> None:
+        """Close the pooled HTTP/2 client and its connections."""
+        if self._client is not None:
+            await self._client.aclose()
+            self._client = None
 
     def _default_headers(self) -> dict:
         """Get the default headers."""
@@ -91,44 +295,507 @@ class TalquinElectricApiClient:
             "Accept": "application/json",
         }
 
+    def _cached_access_token(self) -> str | None:
+        """Get the cached access token if it is not about to expire."""
+        if time.monotonic() < self._access_token_expires_at:
+            return self._access_token
+        return None
+
+    def _invalidate_access_token(self, access_token: str) -> None:
+        """Forget a rejected access token, unless it was already replaced."""
+        if self._access_token == access_token:
+            self._access_token = None
+            self._access_token_expires_at = 0.0
+
     async def async_get_access_token(self) -> str:
-        """Get an access token."""
-        return await self._api_wrapper(
-            method="post",
-            headers=self._default_headers(),
-            url=TOKEN_URL,
-            data={
-                "grant_type": "password",
-                "username": self._username,
-                "password": self._password,
-            },
-        )
+        """
+        Get an access token.
 
-    async def async_get_usage_data(
-        self, account_id: str, start_date: datetime, end_date: datetime
-    ) -> list[TalquinElectricUsageEntry]:
-        """Get the usage data."""
+        Tokens are cached until shortly before they expire, and concurrent
+        callers share a single login request.
+        """
+        if (access_token := self._cached_access_token()) is not None:
+            return access_token
+        async with self._access_token_lock:
+            # Another caller may have logged in while we waited for the lock.
+            if (access_token := self._cached_access_token()) is not None:
+                return access_token
+            self._metrics.token_fetches += 1
+            with self._tracer.span("login"):
+                response = await self._api_wrapper(
+                    method="post",
+                    headers=self._default_headers(),
+                    url=f"{self._base_url}{TOKEN_PATH}",
+                    data={
+                        "grant_type": "password",
+                        "username": self._username,
+                        "password": self._password,
+                    },
+                )
+            if not isinstance(response, dict) or not isinstance(
+                response.get("access_token"), str
+            ):
+                msg = "Token response has no access token"
+                raise TalquinElectricApiClientError(msg)
+            try:
+                expires_in = float(response.get("expires_in", TOKEN_DEFAULT_EXPIRES_IN))
+            except (TypeError, ValueError):
+                expires_in = TOKEN_DEFAULT_EXPIRES_IN
+            self._access_token = response["access_token"]
+            self._access_token_expires_at = (
+                time.monotonic() + expires_in - TOKEN_REFRESH_MARGIN
+            )
+            return self._access_token
+
+    def _authorized_headers(self, access_token: str) -> dict:
+        """Get the default headers with a bearer token."""
+        return {
+            **self._default_headers(),
+            "Authorization": f"Bearer {access_token}",
+        }
+
+    async def _authorized_send(self, **kwargs: Any) -> httpx.Response:
+        """Send an API request with a bearer token, logging in again on a 401."""
         access_token = await self.async_get_access_token()
-        response = await self._api_wrapper(
+        try:
+            return await self._api_send(
+                **kwargs, headers=self._authorized_headers(access_token)
+            )
+        except TalquinElectricApiClientChallengeError:
+            raise
+        except TalquinElectricApiClientAuthenticationError:
+            # The token was rejected before it expired; refresh it once.
+            self._invalidate_access_token(access_token)
+            access_token = await self.async_get_access_token()
+            return await self._api_send(
+                **kwargs, headers=self._authorized_headers(access_token)
+            )
+
+    async def _authorized_api_wrapper(self, **kwargs: Any) -> Any:
+        """Make an API request with a bearer token and decode the JSON body."""
+        try:
+            response = await self._authorized_send(**kwargs)
+            return response.json()
+        except Exception as exception:  # pylint: disable=broad-except # noqa: BLE001
+            _handle_exception(exception)
+
+    async def async_get_accounts(self) -> list[str]:
+        """Get the IDs of every account the login has access to."""
+        response = await self._authorized_api_wrapper(
             method="get",
-            headers={
-                **self._default_headers(),
-                "Authorization": f"Bearer {access_token}",
-            },
-            url=f"{BASE_URL}accounts/{account_id}/usage",
-            params={
-                "start_date": start_date.strftime("%Y-%m-%dT%H:%M:%SZ"),
-                "end_date": end_date.strftime("%Y-%m-%dT%H:%M:%SZ"),
-                "interval": "DAILY",
-            },
+            url=f"{self._base_url}accounts",
+        )
+        return [str(account["id"]) for account in response]
+
+    async def async_iter_usage(  # noqa: PLR0913
+        self,
+        account_id: str,
+        start_date: datetime,
+        end_date: datetime,
+        *,
+        interval: UsageInterval = UsageInterval.DAILY,
+        batch_size: int = USAGE_STREAM_BATCH_SIZE,
+        conditional: bool = False,
+    ) -> AsyncIterator[UsageSeries]:
+        """
+        Stream the usage data in batches of at most `batch_size` entries.
+
+        The response body is decoded incrementally, so memory use is bounded
+        by the batch size rather than the length of the requested range.
+        With `conditional`, the range is revalidated against the last response
+        and TalquinElectricApiClientNotModifiedError is raised if unchanged.
+        A compressed body that fails to decode turns compression off; the
+        request is re-issued uncompressed if nothing was yielded yet.
+        """
+        await async_import_http_modules()
+        import httpx
+
+        try:
+            while True:
+                response = await self._authorized_send(
+                    method="get",
+                    url=f"{self._base_url}accounts/{account_id}/usage",
+                    params={
+                        "start_date": start_date.strftime("%Y-%m-%dT%H:%M:%SZ"),
+                        "end_date": end_date.strftime("%Y-%m-%dT%H:%M:%SZ"),
+                        "interval": interval.name,
+                    },
+                    stream=True,
+                    conditional=conditional,
+                )
+                yielded = False
+                try:
+                    if response.status_code == HTTPStatus.NOT_MODIFIED:
+                        msg = "Usage has not changed since the last request"
+                        raise TalquinElectricApiClientNotModifiedError(msg)
+                    date_times: list[str] = []
+                    values: list[float] = []
+                    with self._tracer.span("usage_body"):
+                        async for entry in _iter_json_array(response.aiter_text()):
+                            date_times.append(entry["date_time"])
+                            values.append(entry["value"])
+                            if len(date_times) >= batch_size:
+                                yielded = True
+                                yield self._usage_batch(date_times, values)
+                                date_times, values = [], []
+                    if date_times:
+                        yield self._usage_batch(date_times, values)
+                except httpx.DecodingError as exception:
+                    if "accept-encoding" not in response.request.headers:
+                        raise
+                    self._disable_compression(exception)
+                    if yielded:
+                        raise
+                else:
+                    return
+                finally:
+                    await response.aclose()
+                    self._metrics.record_bytes("usage", response.num_bytes_downloaded)
+        except Exception as exception:  # pylint: disable=broad-except # noqa: BLE001
+            _handle_exception(exception)
+
+    def _usage_batch(self, date_times: list[str], values: list[float]) -> UsageSeries:
+        """Convert a batch of decoded usage rows into a series."""
+        with self._tracer.span("usage_parse"):
+            return UsageSeries.from_unsorted(parse_timestamps(date_times), values)
+
+    async def async_get_usage_data(
+        self,
+        account_id: str,
+        start_date: datetime,
+        end_date: datetime,
+        interval: UsageInterval = UsageInterval.DAILY,
+        *,
+        conditional: bool = False,
+    ) -> UsageSeries | None:
+        """
+        Get the usage data.
+
+        Identical concurrent queries await the same in-flight fetch; the
+        result is immutable, so every caller can share it. With `conditional`,
+        None is returned if the usage has not changed since the last request.
+        """
+        query = (account_id, start_date, end_date, interval, conditional)
+        cached = self._usage_cache.get(query)
+        if cached is not None and time.monotonic() < cached[0]:
+            return cached[1]
+        task = self._usage_in_flight.get(query)
+        if task is None:
+            task = asyncio.get_running_loop().create_task(
+                self._async_fetch_usage_data(
+                    account_id, start_date, end_date, interval, conditional=conditional
+                )
+            )
+            self._usage_in_flight[query] = task
+            task.add_done_callback(partial(self._usage_fetched, query))
+        # Shielded so one caller giving up doesn't cancel the others' fetch.
+        return await asyncio.shield(task)
+
+    def _usage_fetched(
+        self, query: _UsageQuery, task: asyncio.Task[UsageSeries | None]
+    ) -> None:
+        """Retire a finished usage fetch, caching its result."""
+        del self._usage_in_flight[query]
+        if task.cancelled() or task.exception() is not None:
+            return
+        if self._usage_cache_ttl > 0:
+            now = time.monotonic()
+            self._usage_cache = {
+                key: value for key, value in self._usage_cache.items() if now < value[0]
+            }
+            self._usage_cache[query] = (now + self._usage_cache_ttl, task.result())
+
+    async def _async_fetch_usage_data(
+        self,
+        account_id: str,
+        start_date: datetime,
+        end_date: datetime,
+        interval: UsageInterval,
+        *,
+        conditional: bool,
+    ) -> UsageSeries | None:
+        """Fetch the usage data from the API, or None if it has not changed."""
+        try:
+            return UsageSeries.concat(
+                [
+                    batch
+                    async for batch in self.async_iter_usage(
+                        account_id=account_id,
+                        start_date=start_date,
+                        end_date=end_date,
+                        interval=interval,
+                        conditional=conditional,
+                    )
+                ]
+            )
+        except TalquinElectricApiClientNotModifiedError:
+            return None
+
+    @property
+    def compression(self) -> bool:
+        """Return True if responses are currently requested compressed."""
+        return self._compression
+
+    @property
+    def circuit_breaker(self) -> CircuitBreaker:
+        """Get the circuit breaker guarding API calls."""
+        return self._circuit_breaker
+
+    @property
+    def metrics(self) -> ApiMetrics:
+        """Get the request metrics of this client."""
+        return self._metrics
+
+    @property
+    def tracer(self) -> Tracer:
+        """Get the tracer timing the phases of requests."""
+        return self._tracer
+
+    @property
+    def retry_count(self) -> int:
+        """Get the number of requests retried over the client's lifetime."""
+        return self._retry_count
+
+    async def _api_send(  # noqa: PLR0913
+        self,
+        method: str,
+        url: str,
+        data: dict | None = None,
+        params: dict | None = None,
+        headers: dict | None = None,
+        *,
+        stream: bool = False,
+        conditional: bool = False,
+    ) -> httpx.Response:
+        """
+        Send an API request and verify the response status.
+
+        Transient failures are retried with backoff, honoring Retry-After.
+        With `conditional`, the request is revalidated against the last
+        response for the same URL and may come back as 304 Not Modified.
+        """
+        breaker = self._circuit_breaker
+        trial = breaker.state is CircuitState.HALF_OPEN
+        if not breaker.allow_request():
+            if trial:
+                msg = "Not calling the API while a trial call is in flight"
+            else:
+                msg = (
+                    "Not calling the API for another "
+                    f"{breaker.cooldown_remaining:.0f}s after repeated failures"
+                )
+            raise TalquinElectricApiClientCircuitOpenError(msg)
+        try:
+            return await self._api_send_with_retries(
+                method,
+                url,
+                data,
+                params,
+                headers,
+                stream=stream,
+                conditional=conditional,
+            )
+        finally:
+            if trial:
+                # Cancelled or not retryable: let the next call be the trial.
+                breaker.end_trial()
+
+    async def _api_send_with_retries(  # noqa: PLR0913
+        self,
+        method: str,
+        url: str,
+        data: dict | None,
+        params: dict | None,
+        headers: dict | None,
+        *,
+        stream: bool,
+        conditional: bool,
+    ) -> httpx.Response:
+        """Send an API request, retrying transient failures with backoff."""
+        breaker = self._circuit_breaker
+        policy = self._retry_policy
+        attempt = 1
+        while True:
+            try:
+                response = await self._api_send_negotiated(
+                    method,
+                    url,
+                    data,
+                    params,
+                    headers,
+                    stream=stream,
+                    conditional=conditional,
+                )
+            except TalquinElectricApiClientChallengeError as exception:
+                # Hammering a challenge only prolongs it.
+                breaker.trip(exception)
+                raise
+            except TalquinElectricApiClientAuthenticationError:
+                raise
+            except Exception as exception:
+                if not _is_retryable(exception):
+                    raise
+                delay = policy.delay(attempt)
+                retry_after = _retry_after(exception)
+                if retry_after is not None:
+                    if retry_after > policy.max_delay:
+                        # Don't block a poll that long; stay away until then.
+                        breaker.trip(exception, retry_after)
+                        raise
+                    delay = max(delay, retry_after)
+                if attempt >= policy.attempts:
+                    breaker.record_failure(exception)
+                    raise
+                LOGGER.debug(
+                    "Request failed (attempt %s of %s), retrying in %.1fs: %s",
+                    attempt,
+                    policy.attempts,
+                    delay,
+                    exception,
+                )
+                self._retry_count += 1
+                attempt += 1
+                await asyncio.sleep(delay)
+            else:
+                breaker.record_success()
+                return response
+
+    async def _api_send_negotiated(  # noqa: PLR0913
+        self,
+        method: str,
+        url: str,
+        data: dict | None,
+        params: dict | None,
+        headers: dict | None,
+        *,
+        stream: bool,
+        conditional: bool,
+    ) -> httpx.Response:
+        """Send an API request, falling back to uncompressed responses."""
+        await async_import_http_modules()
+        import httpx
+
+        if self._compression:
+            try:
+                return await self._api_send_once(
+                    method,
+                    url,
+                    data,
+                    params,
+                    headers,
+                    stream=stream,
+                    conditional=conditional,
+                    compressed=True,
+                )
+            except (httpx.DecodingError, httpx.HTTPStatusError) as exception:
+                if isinstance(exception, httpx.HTTPStatusError) and (
+                    exception.response.status_code
+                    not in COMPRESSION_REJECTED_STATUS_CODES
+                ):
+                    raise
+                self._disable_compression(exception)
+        return await self._api_send_once(
+            method,
+            url,
+            data,
+            params,
+            headers,
+            stream=stream,
+            conditional=conditional,
+            compressed=False,
+        )
+
+    def _disable_compression(self, exception: Exception) -> None:
+        """Request uncompressed responses from now on."""
+        LOGGER.debug(
+            "Compressed request rejected, using uncompressed responses: %s",
+            exception,
         )
-        return [
-            TalquinElectricUsageEntry(
-                date=datetime.fromisoformat(entry["date_time"]),
-                usage=entry["value"],
+        self._compression = False
+
+    async def _api_send_once(  # noqa: PLR0913
+        self,
+        method: str,
+        url: str,
+        data: dict | None,
+        params: dict | None,
+        headers: dict | None,
+        *,
+        stream: bool,
+        conditional: bool,
+        compressed: bool,
+    ) -> httpx.Response:
+        """Send a single API request and verify the response status."""
+        client = await self._async_get_client()
+        request = client.build_request(
+            method=method,
+            url=url,
+            headers=headers,
+            data=data,
+            params=params,
+        )
+        if not compressed:
+            request.headers.__delitem__("accept-encoding")
+        if conditional:
+            self._add_validators(request)
+        endpoint = _endpoint_name(request.url)
+        started = time.monotonic()
+        try:
+            async with async_timeout.timeout(10):
+                with self._tracer.span(f"request_{endpoint}"):
+                    response = await client.send(request, stream=stream)
+        except Exception as exception:
+            self._metrics.record_request(
+                endpoint, time.monotonic() - started, type(exception).__name__
+            )
+            raise
+        duration = time.monotonic() - started
+        if not stream:
+            self._metrics.record_bytes(endpoint, response.num_bytes_downloaded)
+        if conditional and response.status_code == HTTPStatus.NOT_MODIFIED:
+            self._metrics.record_request(endpoint, duration, str(response.status_code))
+            return response
+        try:
+            _verify_response_or_raise(response)
+        except TalquinElectricApiClientChallengeError:
+            self._metrics.record_request(endpoint, duration, "challenge")
+            await response.aclose()
+            raise
+        except Exception:
+            self._metrics.record_request(endpoint, duration, str(response.status_code))
+            await response.aclose()
+            raise
+        self._metrics.record_request(endpoint, duration, str(response.status_code))
+        if conditional:
+            self._remember_validators(request, response)
+        return response
+
+    def _add_validators(self, request: httpx.Request) -> None:
+        """Add the validators of the last response for the same URL."""
+        url, etag, last_modified = self._validators.get(
+            request.url.path, ("", None, None)
+        )
+        if url != str(request.url):
+            return
+        if etag is not None:
+            request.headers["If-None-Match"] = etag
+        if last_modified is not None:
+            request.headers["If-Modified-Since"] = last_modified
+
+    def _remember_validators(
+        self, request: httpx.Request, response: httpx.Response
+    ) -> None:
+        """Remember a response's ETag and Last-Modified for its URL."""
+        etag = response.headers.get("ETag")
+        last_modified = response.headers.get("Last-Modified")
+        if etag is None and last_modified is None:
+            self._validators.pop(request.url.path, None)
+        else:
+            self._validators[request.url.path] = (
+                str(request.url),
+                etag,
+                last_modified,
             )
-            for entry in response
-        ]
 
     async def _api_wrapper(
         self,
@@ -140,18 +807,60 @@ class TalquinElectricApiClient:
     ) -> Any:
         """Make an actual API request."""
         try:
-            async with httpx.AsyncClient(http2=True, verify=_ssl_context()) as client:
-                async with async_timeout.timeout(10):
-                    request = client.build_request(
-                        method=method,
-                        url=url,
-                        headers=headers,
-                        data=data,
-                        params=params,
-                    )
-                    request.headers.__delitem__("accept-encoding")
-                    response = await client.send(request)
-                _verify_response_or_raise(response)
-                return await response.json()
+            response = await self._api_send(
+                method=method,
+                url=url,
+                data=data,
+                params=params,
+                headers=headers,
+            )
+            return response.json()
         except Exception as exception:  # pylint: disable=broad-except # noqa: BLE001
             _handle_exception(exception)
+
+
+def _endpoint_name(url: httpx.URL) -> str:
+    """Return the metrics label of an API URL, without account IDs."""
+    if url.path.endswith(f"/{TOKEN_PATH}"):
+        return "token"
+    if url.path.endswith("/usage"):
+        return "usage"
+    return url.path.rstrip("/").rsplit("/", 1)[-1] or "/"
+
+
+async def _iter_json_array(chunks: AsyncIterator[str]) -> AsyncIterator[Any]:
+    """Decode the items of a top-level JSON array as its text arrives."""
+    decoder = json.JSONDecoder()
+    buffer = ""
+    in_array = False
+    async for chunk in chunks:
+        buffer += chunk
+        position = 0
+        while True:
+            while position < len(buffer) and buffer[position] in " \t\r\n,":
+                position += 1
+            if position == len(buffer):
+                break
+            if not in_array:
+                if buffer[position] != "[":
+                    msg = "Expected a JSON array"
+                    raise ValueError(msg)
+                in_array = True
+                position += 1
+                continue
+            if buffer[position] == "]":
+                # Let the stream finish rather than abandoning it half-read.
+                async for _ in chunks:
+                    pass
+                return
+            try:
+                item, end = decoder.raw_decode(buffer, position)
+            except json.JSONDecodeError:
+                break  # The item is incomplete; wait for the next chunk.
+            if end == len(buffer) and not isinstance(item, dict | list):
+                break  # A number may continue in the next chunk.
+            yield item
+            position = end
+        buffer = buffer[position:]
+    msg = "Truncated JSON array"
+    raise ValueError(msg)
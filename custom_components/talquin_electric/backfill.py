@@ -0,0 +1,165 @@
+"""Chunked, concurrent usage backfill for talquin_electric."""
+
+from __future__ import annotations
+
+import asyncio
+from dataclasses import dataclass
+from typing import TYPE_CHECKING
+
+from .api import (
+    TalquinElectricApiClientAuthenticationError,
+    TalquinElectricApiClientChallengeError,
+    TalquinElectricApiClientCircuitOpenError,
+    TalquinElectricApiClientError,
+)
+from .const import (
+    BACKFILL_MAX_CONCURRENCY,
+    BACKFILL_RETRY_DELAY,
+    BACKFILL_WINDOW,
+    BACKFILL_WINDOW_ATTEMPTS,
+    LOGGER,
+    UsageInterval,
+)
+from .usage_series import UsageSeries
+
+if TYPE_CHECKING:
+    from collections.abc import Mapping
+    from datetime import datetime, timedelta
+
+    from .api import TalquinElectricApiClient
+
+
+@dataclass
+class BackfillResult:
+    """Usage fetched by a backfill."""
+
+    usage: UsageSeries
+    # False if a window still failed after retrying. `usage` then only covers
+    # the windows before it, so a later backfill can resume from its end.
+    complete: bool
+
+
+def split_windows(
+    start_date: datetime, end_date: datetime, window: timedelta
+) -> list[tuple[datetime, datetime]]:
+    """Split a date range into consecutive windows of at most `window`."""
+    windows = []
+    while start_date < end_date:
+        window_end = min(start_date + window, end_date)
+        windows.append((start_date, window_end))
+        start_date = window_end
+    return windows
+
+
+async def async_backfill_usage(  # noqa: PLR0913
+    client: TalquinElectricApiClient,
+    account_id: str,
+    start_date: datetime,
+    end_date: datetime,
+    *,
+    interval: UsageInterval = UsageInterval.DAILY,
+    window: timedelta = BACKFILL_WINDOW,
+    max_concurrency: int = BACKFILL_MAX_CONCURRENCY,
+    attempts: int = BACKFILL_WINDOW_ATTEMPTS,
+    conditional: bool = False,
+) -> BackfillResult:
+    """
+    Fetch usage for a long date range as concurrent fixed-size windows.
+
+    Windows are fetched under a semaphore and retried individually, then
+    reassembled in date order with duplicate dates removed. With
+    `conditional`, windows unchanged since the last backfill contribute
+    nothing.
+    """
+    semaphore = asyncio.Semaphore(max_concurrency)
+
+    async def _async_fetch_window(
+        window_start: datetime, window_end: datetime
+    ) -> UsageSeries:
+        for attempt in range(1, attempts + 1):
+            try:
+                async with semaphore:
+                    usage = await client.async_get_usage_data(
+                        account_id=account_id,
+                        start_date=window_start,
+                        end_date=window_end,
+                        interval=interval,
+                        conditional=conditional,
+                    )
+                return usage if usage is not None else UsageSeries()
+            except (
+                TalquinElectricApiClientAuthenticationError,
+                # The circuit breaker decides when to call the API again.
+                TalquinElectricApiClientChallengeError,
+                TalquinElectricApiClientCircuitOpenError,
+            ):
+                raise
+            except TalquinElectricApiClientError as exception:
+                if attempt == attempts:
+                    raise
+                LOGGER.debug(
+                    "Retrying usage for %s from %s to %s (attempt %s): %s",
+                    account_id,
+                    window_start,
+                    window_end,
+                    attempt,
+                    exception,
+                )
+                await asyncio.sleep(BACKFILL_RETRY_DELAY * 2 ** (attempt - 1))
+        return UsageSeries()
+
+    results = await asyncio.gather(
+        *(
+            _async_fetch_window(window_start, window_end)
+            for window_start, window_end in split_windows(start_date, end_date, window)
+        ),
+        return_exceptions=True,
+    )
+    for result in results:
+        if isinstance(result, TalquinElectricApiClientAuthenticationError):
+            raise result
+
+    usage = UsageSeries()
+    for result in results:
+        if isinstance(result, BaseException):
+            if not usage:
+                raise result
+            LOGGER.warning(
+                "Usage backfill for %s stopped after %s: %s",
+                account_id,
+                usage.last_date,
+                result,
+            )
+            return BackfillResult(usage=usage, complete=False)
+        usage = usage.merge(result)
+    return BackfillResult(usage=usage, complete=True)
+
+
+async def async_backfill_accounts(
+    client: TalquinElectricApiClient,
+    start_dates: Mapping[str, datetime],
+    end_date: datetime,
+    *,
+    interval: UsageInterval = UsageInterval.DAILY,
+    conditional: bool = False,
+) -> dict[str, BackfillResult | BaseException]:
+    """
+    Backfill several accounts concurrently over the client's one login.
+
+    An account that fails maps to its exception, so the others still sync.
+    """
+    results = await asyncio.gather(
+        *(
+            async_backfill_usage(
+                client,
+                account_id=account_id,
+                start_date=start_date,
+                end_date=end_date,
+                interval=interval,
+                conditional=conditional,
+            )
+            for account_id, start_date in start_dates.items()
+        ),
+        return_exceptions=True,
+    )
+    return dict(zip(start_dates, results, strict=True))
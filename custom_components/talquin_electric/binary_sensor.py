@@ -2,6 +2,7 @@
 
 from __future__ import annotations
 
+from dataclasses import dataclass
 from typing import TYPE_CHECKING
 
 from homeassistant.components.binary_sensor import (
@@ -13,17 +14,31 @@ from homeassistant.components.binary_sensor import (
 from .entity import TalquinElectricEntity
 
 if TYPE_CHECKING:
+    from collections.abc import Callable
+
     from homeassistant.core import HomeAssistant
     from homeassistant.helpers.entity_platform import AddEntitiesCallback
 
     from .coordinator import BlueprintDataUpdateCoordinator
     from .data import TalquinElectricConfigEntry
+    from .estimators import UsageEstimator
+
+
+@dataclass(frozen=True, kw_only=True)
+class TalquinElectricEstimatorBinarySensorEntityDescription(
+    BinarySensorEntityDescription
+):
+    """Describes a talquin_electric binary sensor read from the estimators."""
 
-ENTITY_DESCRIPTIONS = (
-    BinarySensorEntityDescription(
-        key="talquin_electric",
-        name="Talquin Electric Binary Sensor",
-        device_class=BinarySensorDeviceClass.CONNECTIVITY,
+    is_on_fn: Callable[[UsageEstimator], bool | None]
+
+
+ESTIMATOR_ENTITY_DESCRIPTIONS = (
+    TalquinElectricEstimatorBinarySensorEntityDescription(
+        key="unusual_day",
+        name="Unusual day",
+        device_class=BinarySensorDeviceClass.PROBLEM,
+        is_on_fn=lambda estimator: estimator.last_day_unusual,
     ),
 )
 
@@ -34,28 +49,34 @@ async def async_setup_entry(
     async_add_entities: AddEntitiesCallback,
 ) -> None:
     """Set up the binary_sensor platform."""
+    coordinator = entry.runtime_data.coordinator
     async_add_entities(
-        TalquinElectricBinarySensor(
-            coordinator=entry.runtime_data.coordinator,
+        TalquinElectricEstimatorBinarySensor(
+            coordinator=coordinator,
+            account_id=account_id,
             entity_description=entity_description,
         )
-        for entity_description in ENTITY_DESCRIPTIONS
+        for account_id in coordinator.account_ids
+        for entity_description in ESTIMATOR_ENTITY_DESCRIPTIONS
     )
 
 
-class TalquinElectricBinarySensor(TalquinElectricEntity, BinarySensorEntity):
-    """talquin_electric binary_sensor class."""
+class TalquinElectricEstimatorBinarySensor(TalquinElectricEntity, BinarySensorEntity):
+    """talquin_electric binary_sensor estimated incrementally from new readings."""
+
+    entity_description: TalquinElectricEstimatorBinarySensorEntityDescription
 
     def __init__(
         self,
         coordinator: BlueprintDataUpdateCoordinator,
-        entity_description: BinarySensorEntityDescription,
+        account_id: str,
+        entity_description: TalquinElectricEstimatorBinarySensorEntityDescription,
     ) -> None:
         """Initialize the binary_sensor class."""
-        super().__init__(coordinator)
+        super().__init__(coordinator, account_id, entity_description.key)
         self.entity_description = entity_description
 
     @property
-    def is_on(self) -> bool:
+    def is_on(self) -> bool | None:
         """Return true if the binary_sensor is on."""
-        return self.coordinator.data.get("title", "") == "foo"
+        return self.entity_description.is_on_fn(self.estimator)
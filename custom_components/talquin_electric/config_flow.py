@@ -5,8 +5,8 @@ from __future__ import annotations
 import voluptuous as vol
 from homeassistant import config_entries, data_entry_flow
 from homeassistant.const import CONF_PASSWORD, CONF_USERNAME
+from homeassistant.core import callback
 from homeassistant.helpers import selector
-from homeassistant.helpers.aiohttp_client import async_create_clientsession
 
 from .api import (
     TalquinElectricApiClient,
@@ -14,7 +14,23 @@ from .api import (
     TalquinElectricApiClientCommunicationError,
     TalquinElectricApiClientError,
 )
-from .const import DOMAIN, LOGGER
+from .const import (
+    CONF_ACCOUNT_ID,
+    CONF_BILLING_CYCLE_DAY,
+    CONF_CUSTOMER_CHARGE,
+    CONF_ENERGY_RATE,
+    CONF_SUMMER_ENERGY_RATE,
+    CONF_SUMMER_TIER_RATE,
+    CONF_TIER_RATE,
+    CONF_TIER_THRESHOLD,
+    CONF_USAGE_INTERVAL,
+    DEFAULT_BILLING_CYCLE_DAY,
+    DEFAULT_CUSTOMER_CHARGE,
+    DEFAULT_USAGE_INTERVAL,
+    DOMAIN,
+    LOGGER,
+    UsageInterval,
+)
 
 
 class BlueprintFlowHandler(config_entries.ConfigFlow, domain=DOMAIN):
@@ -22,6 +38,14 @@ class BlueprintFlowHandler(config_entries.ConfigFlow, domain=DOMAIN):
 
     VERSION = 1
 
+    @staticmethod
+    @callback
+    def async_get_options_flow(
+        config_entry: config_entries.ConfigEntry,  # noqa: ARG004
+    ) -> BlueprintOptionsFlowHandler:
+        """Get the options flow for this handler."""
+        return BlueprintOptionsFlowHandler()
+
     async def async_step_user(
         self,
         user_input: dict | None = None,
@@ -66,6 +90,14 @@ class BlueprintFlowHandler(config_entries.ConfigFlow, domain=DOMAIN):
                             type=selector.TextSelectorType.PASSWORD,
                         ),
                     ),
+                    vol.Optional(
+                        CONF_ACCOUNT_ID,
+                        default=(user_input or {}).get(CONF_ACCOUNT_ID, vol.UNDEFINED),
+                    ): selector.TextSelector(
+                        selector.TextSelectorConfig(
+                            type=selector.TextSelectorType.TEXT,
+                        ),
+                    ),
                 },
             ),
             errors=_errors,
@@ -76,6 +108,83 @@ class BlueprintFlowHandler(config_entries.ConfigFlow, domain=DOMAIN):
         client = TalquinElectricApiClient(
             username=username,
             password=password,
-            session=async_create_clientsession(self.hass),
         )
-        await client.async_get_data()
+        try:
+            await client.async_get_access_token()
+        finally:
+            await client.async_close()
+
+
+class BlueprintOptionsFlowHandler(config_entries.OptionsFlow):
+    """Options flow for Blueprint."""
+
+    async def async_step_init(
+        self,
+        user_input: dict | None = None,
+    ) -> data_entry_flow.FlowResult:
+        """Manage the usage interval, billing cycle and tariff."""
+        if user_input is not None:
+            user_input[CONF_BILLING_CYCLE_DAY] = int(user_input[CONF_BILLING_CYCLE_DAY])
+            return self.async_create_entry(data=user_input)
+
+        options = self.config_entry.options
+        return self.async_show_form(
+            step_id="init",
+            data_schema=vol.Schema(
+                {
+                    vol.Required(
+                        CONF_USAGE_INTERVAL,
+                        default=options.get(
+                            CONF_USAGE_INTERVAL, DEFAULT_USAGE_INTERVAL
+                        ),
+                    ): selector.SelectSelector(
+                        selector.SelectSelectorConfig(
+                            options=list(UsageInterval),
+                            translation_key=CONF_USAGE_INTERVAL,
+                        ),
+                    ),
+                    vol.Required(
+                        CONF_BILLING_CYCLE_DAY,
+                        default=options.get(
+                            CONF_BILLING_CYCLE_DAY, DEFAULT_BILLING_CYCLE_DAY
+                        ),
+                    ): selector.NumberSelector(
+                        selector.NumberSelectorConfig(
+                            min=1,
+                            max=31,
+                            mode=selector.NumberSelectorMode.BOX,
+                        ),
+                    ),
+                    vol.Required(
+                        CONF_CUSTOMER_CHARGE,
+                        default=options.get(
+                            CONF_CUSTOMER_CHARGE, DEFAULT_CUSTOMER_CHARGE
+                        ),
+                    ): _price_selector(),
+                    # Rates can be cleared, so they are suggested, not defaulted
+                    **{
+                        vol.Optional(
+                            key, description={"suggested_value": options.get(key)}
+                        ): _price_selector()
+                        for key in (
+                            CONF_ENERGY_RATE,
+                            CONF_TIER_THRESHOLD,
+                            CONF_TIER_RATE,
+                            CONF_SUMMER_ENERGY_RATE,
+                            CONF_SUMMER_TIER_RATE,
+                        )
+                    },
+                },
+            ),
+        )
+
+
+def _price_selector() -> selector.NumberSelector:
+    """Return a selector for a non-negative rate, charge or threshold."""
+    return selector.NumberSelector(
+        selector.NumberSelectorConfig(
+            min=0,
+            step="any",
+            mode=selector.NumberSelectorMode.BOX,
+        ),
+    )
@@ -1,5 +1,7 @@
 """Constants for talquin_electric."""
 
+from datetime import timedelta
+from enum import StrEnum
 from logging import Logger, getLogger
 
 LOGGER: Logger = getLogger(__package__)
@@ -7,7 +9,121 @@ LOGGER: Logger = getLogger(__package__)
 DOMAIN = "talquin_electric"
 ATTRIBUTION = "Data provided by https://talquinelectric.com/"
 
+CONF_ACCOUNT_ID = "account_id"
+CONF_USAGE_INTERVAL = "usage_interval"
+CONF_BILLING_CYCLE_DAY = "billing_cycle_day"
+CONF_CUSTOMER_CHARGE = "customer_charge"
+CONF_ENERGY_RATE = "energy_rate"
+CONF_TIER_THRESHOLD = "tier_threshold"
+CONF_TIER_RATE = "tier_rate"
+CONF_SUMMER_ENERGY_RATE = "summer_energy_rate"
+CONF_SUMMER_TIER_RATE = "summer_tier_rate"
+
+
+class UsageInterval(StrEnum):
+    """Granularity of the usage readings requested from the API."""
+
+    # The API takes the member name; the value is the stored option
+    DAILY = "daily"
+    HOURLY = "hourly"
+    FIFTEEN_MINUTE = "fifteen_minute"
+
+    @property
+    def step(self) -> timedelta:
+        """Return the time between two readings."""
+        match self:
+            case UsageInterval.DAILY:
+                return timedelta(days=1)
+            case UsageInterval.HOURLY:
+                return timedelta(hours=1)
+        return timedelta(minutes=15)
+
+
+DEFAULT_USAGE_INTERVAL = UsageInterval.DAILY
+DEFAULT_BILLING_CYCLE_DAY = 1
+DEFAULT_CUSTOMER_CHARGE = 0.0
+
+# Months (by the start of the billing cycle) that summer rates apply to
+TARIFF_SUMMER_MONTHS = frozenset(range(5, 11))
+
 # Common URLs
 BASE_URL = "https://api.talquinelectric.com/v1/"
-TOKEN_URL = f"{BASE_URL}oauth2/token"
+TOKEN_PATH = "oauth2/token"  # noqa: S105
 USER_AGENT = "Home Assistant - Talquin Electric Integration"
+
+# Connection pooling for the shared HTTP/2 client
+HTTP_MAX_CONNECTIONS = 10
+HTTP_MAX_KEEPALIVE_CONNECTIONS = 5
+HTTP_KEEPALIVE_EXPIRY = 60.0
+# Imported in an executor before the first request; they take a while
+HTTP_MODULES = ("httpx", "h2.connection")
+
+# Upper bounds (in seconds) of the request latency histogram buckets, and the
+# trailing window that request rates are reported over
+METRICS_LATENCY_BUCKETS = (0.1, 0.25, 0.5, 1.0, 2.5, 5.0, 10.0)
+METRICS_REQUEST_WINDOW = timedelta(days=1)
+
+# Transient failures are retried with exponential backoff and jitter; 429 and
+# 503 responses may ask for a longer wait with Retry-After
+RETRY_ATTEMPTS = 3
+RETRY_BASE_DELAY = 1.0
+RETRY_MAX_DELAY = 30.0
+RETRY_JITTER = 0.2
+RETRY_STATUS_CODES = (429, 500, 502, 503, 504)
+RETRY_AFTER_STATUS_CODES = (429, 503)
+
+# The API is not called for a cooldown (in seconds) after repeated failures
+# or a Cloudflare challenge
+CIRCUIT_FAILURE_THRESHOLD = 5
+CIRCUIT_COOLDOWN = 300.0
+
+# Statuses that mean the edge won't serve a compressed response
+COMPRESSION_REJECTED_STATUS_CODES = (406, 415)
+
+# OAuth tokens are refreshed this many seconds before they expire
+TOKEN_REFRESH_MARGIN = 60
+TOKEN_DEFAULT_EXPIRES_IN = 300
+
+# Incremental usage sync: how far back to look on the first poll, and how much
+# already-synced history to re-request so late corrections are picked up
+USAGE_INITIAL_HISTORY = timedelta(days=3 * 365)
+USAGE_SYNC_OVERLAP = timedelta(days=2)
+
+# Persistent usage store; writes are batched for this many seconds
+STORAGE_VERSION = 1
+STORAGE_SAVE_DELAY = 30
+
+# Backfills are split into windows that are fetched concurrently
+BACKFILL_WINDOW = timedelta(days=31)
+BACKFILL_MAX_CONCURRENCY = 4
+BACKFILL_WINDOW_ATTEMPTS = 3
+BACKFILL_RETRY_DELAY = 1.0
+
+# Long-term statistics are imported in batches of this many rows
+STATISTICS_IMPORT_BATCH_SIZE = 5000
+STATISTICS_SUM_LOOKBACK = timedelta(days=7)
+
+# Usage responses are streamed and parsed in batches of this many rows
+USAGE_STREAM_BATCH_SIZE = 1000
+
+# Identical usage queries within this many seconds share one response
+USAGE_CACHE_TTL = 30.0
+
+# Usage exports are written in chunks of this many rows
+EXPORT_CHUNK_SIZE = 10_000
+
+# Online usage estimators: weight of the newest day in the weekday baselines,
+# and how far (in standard deviations of daily usage) from its baseline a day
+# must be, once this many days were seen, to count as unusual
+ESTIMATOR_EWMA_ALPHA = 0.2
+ESTIMATOR_UNUSUAL_STDDEVS = 2.5
+ESTIMATOR_MIN_DAYS = 14
+
+# Adaptive polling: dense polls around the learned publication hours,
+# exponential backoff with jitter otherwise
+POLL_INTERVAL_DEFAULT = timedelta(hours=1)
+POLL_INTERVAL_DENSE = timedelta(minutes=15)
+POLL_INTERVAL_MAX = timedelta(hours=6)
+POLL_JITTER = 0.1
+POLL_MIN_OBSERVATIONS = 3
+POLL_PUBLICATION_SHARE = 0.2
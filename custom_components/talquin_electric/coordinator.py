@@ -2,26 +2,53 @@
 
 from __future__ import annotations
 
-from datetime import timedelta
+import asyncio
+import cProfile
+import time
+from datetime import datetime, timedelta
 from typing import TYPE_CHECKING, Any
 
+from homeassistant.core import callback
 from homeassistant.exceptions import ConfigEntryAuthFailed
 from homeassistant.helpers.update_coordinator import DataUpdateCoordinator, UpdateFailed
+from homeassistant.util import dt as dt_util
 
 from .api import (
     TalquinElectricApiClientAuthenticationError,
     TalquinElectricApiClientError,
 )
-from .const import DOMAIN, LOGGER
+from .backfill import BackfillResult, async_backfill_accounts
+from .const import (
+    CONF_ACCOUNT_ID,
+    CONF_BILLING_CYCLE_DAY,
+    CONF_USAGE_INTERVAL,
+    DEFAULT_BILLING_CYCLE_DAY,
+    DEFAULT_USAGE_INTERVAL,
+    DOMAIN,
+    LOGGER,
+    POLL_INTERVAL_DEFAULT,
+    USAGE_INITIAL_HISTORY,
+    USAGE_SYNC_OVERLAP,
+    UsageInterval,
+)
+from .estimators import UsageEstimator
+from .rollups import UsageRollup
+from .scheduler import PollScheduler
+from .statistics import async_import_usage_statistics
+from .store import StoredUsage
+from .tariff import Tariff, UsageCost
+from .usage_series import UsageSeries
 
 if TYPE_CHECKING:
     from homeassistant.core import HomeAssistant
 
     from .data import TalquinElectricConfigEntry
+    from .store import TalquinElectricUsageStore
+    from .tracing import Tracer
 
 
 # https://developers.home-assistant.io/docs/integration_fetching_data#coordinated-single-api-poll-for-data-for-all-entities
-class BlueprintDataUpdateCoordinator(DataUpdateCoordinator):
+class BlueprintDataUpdateCoordinator(DataUpdateCoordinator[dict[str, UsageSeries]]):
     """Class to manage fetching data from the API."""
 
     config_entry: TalquinElectricConfigEntry
@@ -29,20 +56,291 @@ class BlueprintDataUpdateCoordinator(DataUpdateCoordinator):
     def __init__(
         self,
         hass: HomeAssistant,
+        store: TalquinElectricUsageStore,
     ) -> None:
         """Initialize."""
         super().__init__(
             hass=hass,
             logger=LOGGER,
             name=DOMAIN,
-            update_interval=timedelta(hours=1),
+            update_interval=POLL_INTERVAL_DEFAULT,
+        )
+        self._store = store
+        self._scheduler = PollScheduler()
+        self._account_ids: list[str] | None = None
+        self._rollups: dict[str, UsageRollup] = {}
+        self._costs: dict[str, UsageCost] = {}
+        self._estimators: dict[str, UsageEstimator] = {}
+        self._estimator_states: dict[str, dict[str, Any]] = {}
+        # Seconds the last successful refresh took, for the diagnostic sensor
+        self.last_refresh_duration: float | None = None
+        # True while the data is the stored snapshot of a previous run
+        self.stale = False
+        # Accounts whose usage changed in the last refresh
+        self._changed_accounts: set[str] = set()
+        # (last_update_success, stale) when listeners were last updated
+        self._notified_status: tuple[bool, bool] | None = None
+
+    async def async_load_stored_usage(self) -> None:
+        """Seed the coordinator with usage and poll state from a previous run."""
+        stored = await self._store.async_load()
+        self._scheduler = PollScheduler(stored.scheduler)
+        if stored.interval != self.usage_interval:
+            LOGGER.debug(
+                "Usage interval changed from %s to %s, refetching usage",
+                stored.interval,
+                self.usage_interval,
+            )
+        elif stored.usage:
+            self.data = stored.usage
+            self._estimator_states = stored.estimators
+            self.stale = True
+
+    async def async_flush_stored_usage(self) -> None:
+        """Write usage waiting for a delayed save, before the entry unloads."""
+        await self._store.async_flush()
+
+    @property
+    def usage_interval(self) -> UsageInterval:
+        """Return the granularity of the usage being synced."""
+        return UsageInterval(
+            self.config_entry.options.get(CONF_USAGE_INTERVAL, DEFAULT_USAGE_INTERVAL)
+        )
+
+    def rollup(self, account_id: str) -> UsageRollup:
+        """
+        Return the rollups of an account's usage.
+
+        They are computed once per synced series and shared by every entity.
+        """
+        usage = (self.data or {}).get(account_id, UsageSeries())
+        rollup = self._rollups.get(account_id)
+        if rollup is None or rollup.usage is not usage:
+            rollup = self._rollups[account_id] = UsageRollup(
+                usage,
+                tz=dt_util.get_default_time_zone(),
+                billing_cycle_day=self.billing_cycle_day,
+            )
+        return rollup
+
+    @property
+    def billing_cycle_day(self) -> int:
+        """Return the day of the month billing cycles start on."""
+        return self.config_entry.options.get(
+            CONF_BILLING_CYCLE_DAY, DEFAULT_BILLING_CYCLE_DAY
         )
 
-    async def _async_update_data(self) -> Any:
-        """Update data via library."""
+    def estimator(self, account_id: str) -> UsageEstimator:
+        """
+        Return the online estimators of an account's usage.
+
+        They resume from the stored state, catching up on any readings it
+        has not seen (all of them if there is no state).
+        """
+        if (estimator := self._estimators.get(account_id)) is None:
+            estimator = self._estimators[account_id] = UsageEstimator(
+                self._estimator_states.get(account_id),
+                tz=dt_util.get_default_time_zone(),
+                billing_cycle_day=self.billing_cycle_day,
+                interval=self.usage_interval,
+            )
+            estimator.update((self.data or {}).get(account_id, UsageSeries()))
+        return estimator
+
+    @property
+    def tariff(self) -> Tariff | None:
+        """Return the configured rate schedule, if any."""
+        return Tariff.from_options(self.config_entry.options)
+
+    def cost(self, account_id: str) -> UsageCost | None:
+        """
+        Return the costs of an account's usage under the configured tariff.
+
+        They are computed once per synced series and tariff.
+        """
+        if (tariff := self.tariff) is None:
+            return None
+        rollup = self.rollup(account_id)
+        cost = self._costs.get(account_id)
+        if cost is None or cost.rollup is not rollup or cost.tariff != tariff:
+            cost = self._costs[account_id] = UsageCost(rollup, tariff)
+        return cost
+
+    @property
+    def account_ids(self) -> list[str]:
+        """Return the accounts being synced, or those of the stored snapshot."""
+        if self._account_ids is not None:
+            return self._account_ids
+        return list(self.data or {})
+
+    @property
+    def scheduler(self) -> PollScheduler:
+        """Return the adaptive poll scheduler."""
+        return self._scheduler
+
+    def usage_watermark(self, account_id: str) -> datetime | None:
+        """Return the date of the newest usage entry synced for an account."""
+        if self.data and (usage := self.data.get(account_id)):
+            return usage.last_date
+        return None
+
+    async def _async_discover_accounts(self) -> list[str]:
+        """Return the configured account, or every account of the login."""
+        if account_id := self.config_entry.data.get(CONF_ACCOUNT_ID):
+            return [account_id]
+        return await self.config_entry.runtime_data.client.async_get_accounts()
+
+    def _sync_start(self, account_id: str, now: datetime) -> datetime:
+        """Return where an account's sync starts: its watermark, less overlap."""
+        if (watermark := self.usage_watermark(account_id)) is not None:
+            return watermark - USAGE_SYNC_OVERLAP
+        return now - USAGE_INITIAL_HISTORY
+
+    async def _async_merge_account(
+        self, account_id: str, backfill: BackfillResult
+    ) -> UsageSeries:
+        """Merge an account's fetched usage into its series."""
+        current = (self.data or {}).get(account_id, UsageSeries())
+        with self.tracer.span("merge"):
+            usage = current.merge(backfill.usage)
+        with self.tracer.span("estimators"):
+            self.estimator(account_id).update(usage)
+        if backfill.usage:
+            with self.tracer.span("import_statistics"):
+                await async_import_usage_statistics(
+                    self.hass,
+                    account_id=account_id,
+                    usage=usage,
+                    since=backfill.usage.first_date,
+                )
+        return usage
+
+    @property
+    def tracer(self) -> Tracer:
+        """Return the tracer timing refreshes, shared with the API client."""
+        return self.config_entry.runtime_data.client.tracer
+
+    async def _async_update_data(self) -> dict[str, UsageSeries]:
+        """Refresh, timing the phases and profiling if tracing asks for it."""
+        tracer = self.tracer
+        tracer.start_trace()
+        profile = None
+        if tracer.profile_next:
+            tracer.profile_next = False
+            profile = cProfile.Profile()
+            profile.enable()
         try:
-            return await self.config_entry.runtime_data.client.async_get_data()
+            with tracer.span("refresh"):
+                return await self._async_sync_accounts()
+        finally:
+            if profile is not None:
+                profile.disable()
+                path = self.hass.config.path(
+                    f"{DOMAIN}_refresh_{dt_util.utcnow():%Y%m%d%H%M%S}.prof"
+                )
+                await self.hass.async_add_executor_job(profile.dump_stats, path)
+                LOGGER.info("Saved a profile of the refresh to %s", path)
+
+    @callback
+    def async_update_listeners(self) -> None:
+        """
+        Update the listeners affected by the refresh, finishing its trace.
+
+        Entities of an account whose usage did not change are skipped, unless
+        availability or staleness changed; entities of the whole login are
+        always updated and write their state only if it changed.
+        """
+        status = (self.last_update_success, self.stale)
+        update_all = status != self._notified_status
+        self._notified_status = status
+        with self.tracer.span("entity_updates"):
+            for update_callback, account_id in list(self._listeners.values()):
+                if (
+                    update_all
+                    or account_id is None
+                    or account_id in self._changed_accounts
+                ):
+                    update_callback()
+        self._changed_accounts = set()
+        self.tracer.finish_trace()
+
+    async def _async_sync_accounts(self) -> dict[str, UsageSeries]:
+        """Sync every account concurrently over one login and connection."""
+        now = dt_util.utcnow()
+        started = time.monotonic()
+        try:
+            if self._account_ids is None:
+                self._account_ids = await self._async_discover_accounts()
+            # Long gaps (first sync, long outages) are fetched in windows;
+            # a partial backfill is kept and resumed on the next refresh. The
+            # range ends at the next UTC midnight so repeated polls within a
+            # day are identical requests the API can answer with 304 Not
+            # Modified.
+            with self.tracer.span("backfill"):
+                backfills = await async_backfill_accounts(
+                    self.config_entry.runtime_data.client,
+                    {
+                        account_id: self._sync_start(account_id, now)
+                        for account_id in self._account_ids
+                    },
+                    end_date=(now + timedelta(days=1)).replace(
+                        hour=0, minute=0, second=0, microsecond=0
+                    ),
+                    interval=self.usage_interval,
+                    conditional=True,
+                )
+            fetched = {
+                account_id: backfill
+                for account_id, backfill in backfills.items()
+                if isinstance(backfill, BackfillResult)
+            }
+            merged = await asyncio.gather(
+                *(
+                    self._async_merge_account(account_id, backfill)
+                    for account_id, backfill in fetched.items()
+                ),
+                return_exceptions=True,
+            )
+            results = {**backfills, **dict(zip(fetched, merged, strict=True))}
+            data = dict(self.data or {})
+            errors = []
+            for account_id, result in results.items():
+                if isinstance(result, BaseException):
+                    errors.append(result)
+                    LOGGER.warning("Error syncing account %s: %s", account_id, result)
+                else:
+                    # Merging nothing new returns the same series
+                    if result is not data.get(account_id):
+                        self._changed_accounts.add(account_id)
+                    data[account_id] = result
+            for error in errors:
+                if isinstance(error, TalquinElectricApiClientAuthenticationError):
+                    raise error
+            if errors and len(errors) == len(results):
+                raise errors[0]
         except TalquinElectricApiClientAuthenticationError as exception:
             raise ConfigEntryAuthFailed(exception) from exception
         except TalquinElectricApiClientError as exception:
             raise UpdateFailed(exception) from exception
+        self._scheduler.record_poll(
+            now,
+            new_data=any(
+                usage.last_date != self.usage_watermark(account_id)
+                for account_id, usage in data.items()
+            ),
+        )
+        self.update_interval = self._scheduler.next_interval(now)
+        self.last_refresh_duration = round(time.monotonic() - started, 3)
+        self.stale = False
+        self._store.async_schedule_save(
+            StoredUsage(
+                usage=data,
+                scheduler=self._scheduler.as_dict(),
+                interval=self.usage_interval,
+                estimators={
+                    account_id: self.estimator(account_id).as_dict()
+                    for account_id in data
+                },
+            )
+        )
+        return data
@@ -0,0 +1,52 @@
+"""Diagnostics support for talquin_electric."""
+
+from __future__ import annotations
+
+from typing import TYPE_CHECKING, Any
+
+from homeassistant.components.diagnostics import async_redact_data
+from homeassistant.const import CONF_PASSWORD, CONF_USERNAME
+
+from .const import CONF_ACCOUNT_ID
+
+if TYPE_CHECKING:
+    from homeassistant.core import HomeAssistant
+
+    from .data import TalquinElectricConfigEntry
+
+TO_REDACT = {CONF_ACCOUNT_ID, CONF_PASSWORD, CONF_USERNAME, "title", "unique_id"}
+
+
+async def async_get_config_entry_diagnostics(
+    hass: HomeAssistant,  # noqa: ARG001 Unused function argument: `hass`
+    entry: TalquinElectricConfigEntry,
+) -> dict[str, Any]:
+    """Return diagnostics for a config entry, without credentials or accounts."""
+    client = entry.runtime_data.client
+    coordinator = entry.runtime_data.coordinator
+    return {
+        "entry": async_redact_data(entry.as_dict(), TO_REDACT),
+        "coordinator": {
+            "last_update_success": coordinator.last_update_success,
+            "update_interval": str(coordinator.update_interval),
+            "last_refresh_duration": coordinator.last_refresh_duration,
+            "usage_interval": coordinator.usage_interval,
+            "scheduler": coordinator.scheduler.as_dict(),
+            # Accounts are numbered rather than named to keep them private.
+            "accounts": [
+                {
+                    "rows": len(usage),
+                    "first_date": usage.first_date,
+                    "last_date": usage.last_date,
+                }
+                for usage in (coordinator.data or {}).values()
+            ],
+        },
+        "api": {
+            "compression": client.compression,
+            "retry_count": client.retry_count,
+            "circuit_breaker": client.circuit_breaker.as_dict(),
+            "metrics": client.metrics.as_dict(),
+            "tracing": client.tracer.as_dict(),
+        },
+    }
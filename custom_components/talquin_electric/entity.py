@@ -2,27 +2,95 @@
 
 from __future__ import annotations
 
+from typing import TYPE_CHECKING, Any
+
+from homeassistant.core import callback
 from homeassistant.helpers.device_registry import DeviceInfo
 from homeassistant.helpers.update_coordinator import CoordinatorEntity
 
 from .const import ATTRIBUTION
 from .coordinator import BlueprintDataUpdateCoordinator
+from .usage_series import UsageSeries
+
+if TYPE_CHECKING:
+    from .estimators import UsageEstimator
+    from .rollups import UsageRollup
+    from .tariff import UsageCost
 
 
 class TalquinElectricEntity(CoordinatorEntity[BlueprintDataUpdateCoordinator]):
     """BlueprintEntity class."""
 
     _attr_attribution = ATTRIBUTION
+    _attr_has_entity_name = True
+
+    def __init__(
+        self,
+        coordinator: BlueprintDataUpdateCoordinator,
+        account_id: str | None,
+        key: str,
+    ) -> None:
+        """
+        Initialize.
 
-    def __init__(self, coordinator: BlueprintDataUpdateCoordinator) -> None:
-        """Initialize."""
-        super().__init__(coordinator)
-        self._attr_unique_id = coordinator.config_entry.entry_id
+        Entities without an account belong to a device for the whole login.
+        """
+        # The account is the listener context, so the coordinator can skip
+        # the entities of accounts whose usage did not change.
+        super().__init__(coordinator, account_id)
+        self.account_id = account_id
+        self._written_state: tuple[Any, ...] | None = None
+        entry = coordinator.config_entry
+        if account_id is None:
+            self._attr_unique_id = f"{entry.entry_id}_{key}"
+            self._attr_device_info = DeviceInfo(
+                identifiers={(entry.domain, entry.entry_id)},
+                name=f"Talquin Electric {entry.title}",
+            )
+            return
+        self._attr_unique_id = f"{entry.entry_id}_{account_id}_{key}"
         self._attr_device_info = DeviceInfo(
-            identifiers={
-                (
-                    coordinator.config_entry.domain,
-                    coordinator.config_entry.entry_id,
-                ),
-            },
+            identifiers={(entry.domain, f"{entry.entry_id}_{account_id}")},
+            name=f"Talquin Electric {account_id}",
         )
+
+    def _state_snapshot(self) -> tuple[Any, ...]:
+        """Return what a state write would record, to detect changes."""
+        return (self.available, self.assumed_state, self.state)
+
+    async def async_added_to_hass(self) -> None:
+        """Remember the state written when the entity is added."""
+        await super().async_added_to_hass()
+        self._written_state = self._state_snapshot()
+
+    @callback
+    def _handle_coordinator_update(self) -> None:
+        """Write the state only if it changed, to spare the recorder."""
+        if (snapshot := self._state_snapshot()) != self._written_state:
+            self._written_state = snapshot
+            self.async_write_ha_state()
+
+    @property
+    def assumed_state(self) -> bool:
+        """Return True while showing usage stored by a previous run."""
+        return self.coordinator.stale
+
+    @property
+    def usage(self) -> UsageSeries:
+        """Return the synced usage of this entity's account."""
+        return (self.coordinator.data or {}).get(self.account_id, UsageSeries())
+
+    @property
+    def rollup(self) -> UsageRollup:
+        """Return the rollups of this entity's account usage."""
+        return self.coordinator.rollup(self.account_id)
+
+    @property
+    def cost(self) -> UsageCost | None:
+        """Return the costs of this entity's account usage, if priced."""
+        return self.coordinator.cost(self.account_id)
+
+    @property
+    def estimator(self) -> UsageEstimator:
+        """Return the online estimators of this entity's account usage."""
+        return self.coordinator.estimator(self.account_id)
@@ -0,0 +1,202 @@
+"""Online usage estimators for talquin_electric."""
+
+from __future__ import annotations
+
+import math
+from bisect import bisect_right
+from datetime import UTC, datetime
+from typing import TYPE_CHECKING, Any
+
+from .const import (
+    DEFAULT_USAGE_INTERVAL,
+    ESTIMATOR_EWMA_ALPHA,
+    ESTIMATOR_MIN_DAYS,
+    ESTIMATOR_UNUSUAL_STDDEVS,
+    UsageInterval,
+)
+from .rollups import cycle_starts, day_starts
+
+if TYPE_CHECKING:
+    from datetime import tzinfo
+
+    from .usage_series import UsageSeries
+
+
+class UsageEstimator:
+    """
+    Track daily usage statistics and the current billing cycle incrementally.
+
+    Readings are folded in once each, in date order, in O(1): a running total
+    of the current local day and billing cycle, and for every completed day a
+    running mean and variance (Welford) of daily usage and an exponentially
+    weighted baseline per weekday. A day is complete once the reading of its
+    last interval is folded in, and unusual if it is further from its weekday
+    baseline than ESTIMATOR_UNUSUAL_STDDEVS standard deviations of daily usage.
+
+    Readings at or before the newest one seen are skipped, so corrections to
+    already-folded readings only show in the rollups.
+    """
+
+    def __init__(
+        self,
+        state: dict[str, Any] | None = None,
+        *,
+        tz: tzinfo = UTC,
+        billing_cycle_day: int = 1,
+        interval: UsageInterval = DEFAULT_USAGE_INTERVAL,
+    ) -> None:
+        """Initialize, resuming from a state saved with `as_dict`."""
+        self._tz = tz
+        self._billing_cycle_day = billing_cycle_day
+        self._step = int(interval.step.total_seconds())
+        state = state or {}
+        if state.get("billing_cycle_day", billing_cycle_day) != billing_cycle_day:
+            # The cycle total no longer matches; start over from the series
+            state = {}
+        self._last_timestamp: int | None = state.get("last_timestamp")
+        # Epoch second bounds and running totals of the current day and cycle
+        self._day_start: int = state.get("day_start", 0)
+        self._day_end: int = state.get("day_end", 0)
+        self._day_total: float = state.get("day_total", 0.0)
+        self._day_complete: bool = state.get("day_complete", False)
+        self._cycle_start: int = state.get("cycle_start", 0)
+        self._cycle_end: int = state.get("cycle_end", 0)
+        self._cycle_total: float = state.get("cycle_total", 0.0)
+        # Welford's running mean and sum of squared deviations of daily usage
+        self._days: int = state.get("days", 0)
+        self._mean: float = state.get("mean", 0.0)
+        self._m2: float = state.get("m2", 0.0)
+        # Exponentially weighted daily usage per weekday, Monday first
+        self._weekday_baselines: list[float | None] = state.get(
+            "weekday_baselines", [None] * 7
+        )
+        self._last_day_total: float | None = state.get("last_day_total")
+        self._last_day_unusual: bool | None = state.get("last_day_unusual")
+
+    def as_dict(self) -> dict[str, Any]:
+        """Return the estimator state for persisting."""
+        return {
+            "billing_cycle_day": self._billing_cycle_day,
+            "last_timestamp": self._last_timestamp,
+            "day_start": self._day_start,
+            "day_end": self._day_end,
+            "day_total": self._day_total,
+            "day_complete": self._day_complete,
+            "cycle_start": self._cycle_start,
+            "cycle_end": self._cycle_end,
+            "cycle_total": self._cycle_total,
+            "days": self._days,
+            "mean": self._mean,
+            "m2": self._m2,
+            "weekday_baselines": list(self._weekday_baselines),
+            "last_day_total": self._last_day_total,
+            "last_day_unusual": self._last_day_unusual,
+        }
+
+    def update(self, usage: UsageSeries) -> None:
+        """Fold in the readings of `usage` newer than those already seen."""
+        timestamps = usage.timestamps
+        first = (
+            bisect_right(timestamps, self._last_timestamp)
+            if self._last_timestamp is not None
+            else 0
+        )
+        values = usage.values
+        for index in range(first, len(timestamps)):
+            self.add(timestamps[index], values[index])
+
+    def add(self, timestamp: int, value: float) -> None:
+        """Fold in one reading, newer than every reading seen so far."""
+        if timestamp >= self._day_end:
+            if self._last_timestamp is not None and not self._day_complete:
+                # The day's last reading was missing
+                self._complete_day()
+            moment = datetime.fromtimestamp(timestamp, UTC)
+            start, end = day_starts(moment, moment, self._tz)
+            self._day_start = int(start.timestamp())
+            self._day_end = int(end.timestamp())
+            self._day_total = 0.0
+            self._day_complete = False
+            if timestamp >= self._cycle_end:
+                start, end = cycle_starts(
+                    moment, moment, self._tz, self._billing_cycle_day
+                )
+                self._cycle_start = int(start.timestamp())
+                self._cycle_end = int(end.timestamp())
+                self._cycle_total = 0.0
+        self._day_total += value
+        self._cycle_total += value
+        self._last_timestamp = timestamp
+        if timestamp + self._step >= self._day_end:
+            self._complete_day()
+
+    def _complete_day(self) -> None:
+        """Fold the finished current day into the daily statistics."""
+        self._day_complete = True
+        total = self._day_total
+        weekday = datetime.fromtimestamp(self._day_start, self._tz).weekday()
+        baseline = self._weekday_baselines[weekday]
+        stddev = self.stddev
+        self._last_day_total = total
+        self._last_day_unusual = (
+            self._days >= ESTIMATOR_MIN_DAYS
+            and baseline is not None
+            and stddev is not None
+            and abs(total - baseline) > ESTIMATOR_UNUSUAL_STDDEVS * stddev
+        )
+
+        self._days += 1
+        delta = total - self._mean
+        self._mean += delta / self._days
+        self._m2 += delta * (total - self._mean)
+        self._weekday_baselines[weekday] = (
+            total
+            if baseline is None
+            else baseline + ESTIMATOR_EWMA_ALPHA * (total - baseline)
+        )
+
+    @property
+    def mean(self) -> float | None:
+        """Return the mean usage of the completed days."""
+        return self._mean if self._days else None
+
+    @property
+    def stddev(self) -> float | None:
+        """Return the sample standard deviation of daily usage."""
+        if self._days < 2:  # noqa: PLR2004
+            return None
+        return math.sqrt(self._m2 / (self._days - 1))
+
+    def weekday_baseline(self, weekday: int) -> float | None:
+        """Return the expected usage of a weekday, Monday being 0."""
+        return self._weekday_baselines[weekday]
+
+    @property
+    def last_day_total(self) -> float | None:
+        """Return the usage of the most recent completed day."""
+        return self._last_day_total
+
+    @property
+    def last_day_unusual(self) -> bool | None:
+        """Return whether the most recent completed day was unusual."""
+        return self._last_day_unusual
+
+    @property
+    def cycle_total(self) -> float | None:
+        """Return the usage so far in the current billing cycle."""
+        return self._cycle_total if self._last_timestamp is not None else None
+
+    @property
+    def projected_cycle_total(self) -> float | None:
+        """
+        Return the expected usage of the whole current billing cycle.
+
+        The usage so far is extrapolated at the average rate of its days.
+        """
+        if self._last_timestamp is None:
+            return None
+        return (
+            self._cycle_total
+            * (self._cycle_end - self._cycle_start)
+            / (self._day_end - self._cycle_start)
+        )
@@ -0,0 +1,211 @@
+"""Streaming usage exports for talquin_electric."""
+
+from __future__ import annotations
+
+import csv
+import json
+from abc import ABC, abstractmethod
+from datetime import UTC, datetime
+from enum import StrEnum
+from typing import TYPE_CHECKING, Any, TextIO
+
+from .backfill import split_windows
+from .const import BACKFILL_WINDOW, EXPORT_CHUNK_SIZE, UsageInterval
+
+if TYPE_CHECKING:
+    from collections.abc import AsyncIterator
+    from pathlib import Path
+
+    from homeassistant.core import HomeAssistant
+
+    from .api import TalquinElectricApiClient
+    from .usage_series import UsageSeries
+
+
+class ExportFormat(StrEnum):
+    """File format of a usage export."""
+
+    CSV = "csv"
+    NDJSON = "ndjson"
+    PARQUET = "parquet"
+
+
+class ExportDependencyError(Exception):
+    """Exception to indicate an export format needs a missing package."""
+
+
+def _date_times(chunk: UsageSeries) -> list[str]:
+    """Return the dates of a chunk as ISO 8601 UTC strings."""
+    return [
+        datetime.fromtimestamp(timestamp, UTC).isoformat()
+        for timestamp in chunk.timestamps
+    ]
+
+
+class UsageWriter(ABC):
+    """
+    Write usage chunks to a file as they arrive.
+
+    Writers are created with the path to write. Every method does blocking
+    I/O and must run in an executor.
+    """
+
+    @abstractmethod
+    def write(self, chunk: UsageSeries) -> None:
+        """Append a chunk of usage."""
+
+    @abstractmethod
+    def close(self) -> None:
+        """Flush and close the file."""
+
+
+class _TextUsageWriter(UsageWriter):
+    """Write usage to a text file."""
+
+    def __init__(self, path: Path) -> None:
+        """Open the file."""
+        self._file: TextIO = path.open("w", encoding="utf-8", newline="")
+
+    def close(self) -> None:
+        """Flush and close the file."""
+        self._file.close()
+
+
+class CsvUsageWriter(_TextUsageWriter):
+    """Write usage as CSV with a header row."""
+
+    def __init__(self, path: Path) -> None:
+        """Open the file and write the header."""
+        super().__init__(path)
+        self._writer = csv.writer(self._file)
+        self._writer.writerow(("date_time", "value"))
+
+    def write(self, chunk: UsageSeries) -> None:
+        """Append a chunk of usage."""
+        self._writer.writerows(zip(_date_times(chunk), chunk.values, strict=True))
+
+
+class NdjsonUsageWriter(_TextUsageWriter):
+    """Write usage as one JSON object per line, as the API returns it."""
+
+    def write(self, chunk: UsageSeries) -> None:
+        """Append a chunk of usage."""
+        self._file.writelines(
+            json.dumps({"date_time": date_time, "value": value}) + "\n"
+            for date_time, value in zip(_date_times(chunk), chunk.values, strict=True)
+        )
+
+
+class ParquetUsageWriter(UsageWriter):
+    """Write usage as Parquet, one row group per chunk. Needs pyarrow."""
+
+    def __init__(self, path: Path) -> None:
+        """Open the file."""
+        try:
+            import pyarrow as pa
+            import pyarrow.parquet as pq
+        except ImportError as exception:
+            msg = "Parquet exports need the pyarrow package"
+            raise ExportDependencyError(msg) from exception
+        self._pa = pa
+        self._schema = pa.schema(
+            [("date_time", pa.timestamp("s", tz="UTC")), ("value", pa.float64())]
+        )
+        self._parquet: Any = pq.ParquetWriter(str(path), self._schema)
+
+    def write(self, chunk: UsageSeries) -> None:
+        """Append a chunk of usage."""
+        self._parquet.write_table(
+            self._pa.table(
+                [chunk.timestamps.tolist(), chunk.values.tolist()],
+                schema=self._schema,
+            )
+        )
+
+    def close(self) -> None:
+        """Write the footer and close the file."""
+        self._parquet.close()
+
+
+WRITERS: dict[ExportFormat, type[UsageWriter]] = {
+    ExportFormat.CSV: CsvUsageWriter,
+    ExportFormat.NDJSON: NdjsonUsageWriter,
+    ExportFormat.PARQUET: ParquetUsageWriter,
+}
+
+
+async def async_iter_export(  # noqa: PLR0913
+    client: TalquinElectricApiClient,
+    stored: UsageSeries,
+    account_id: str,
+    start_date: datetime,
+    end_date: datetime,
+    *,
+    interval: UsageInterval = UsageInterval.DAILY,
+    chunk_size: int = EXPORT_CHUNK_SIZE,
+) -> AsyncIterator[UsageSeries]:
+    """
+    Yield an account's usage in [start_date, end_date) in date order.
+
+    The part older than the stored series is streamed from the API one
+    window at a time, and the rest is sliced from the stored series without
+    copying, so no more than a chunk or a response batch is held at once.
+    The API is not asked to revalidate: an export always needs the rows.
+    """
+    api_end = end_date
+    if (first_date := stored.first_date) is not None:
+        api_end = min(end_date, first_date)
+    # The date from which rows are still to be written. The API may include
+    # a window's end, which the next window or the stored series repeats.
+    resume = start_date
+    for window_start, window_end in split_windows(start_date, api_end, BACKFILL_WINDOW):
+        async for batch in client.async_iter_usage(
+            account_id,
+            window_start,
+            window_end,
+            interval=interval,
+            batch_size=chunk_size,
+            conditional=False,
+        ):
+            if chunk := batch.between(resume, end_date):
+                resume = datetime.fromtimestamp(chunk.timestamps[-1] + 1, UTC)
+                yield chunk
+    cached = stored.between(resume, end_date)
+    for offset in range(0, len(cached), chunk_size):
+        yield cached[offset : offset + chunk_size]
+
+
+async def async_export_usage(  # noqa: PLR0913
+    hass: HomeAssistant,
+    client: TalquinElectricApiClient,
+    stored: UsageSeries,
+    account_id: str,
+    start_date: datetime,
+    end_date: datetime,
+    *,
+    path: Path,
+    export_format: ExportFormat = ExportFormat.CSV,
+    interval: UsageInterval = UsageInterval.DAILY,
+) -> int:
+    """
+    Export an account's usage to `path` and return the number of rows.
+
+    Chunks are written in the executor as they arrive. The file is written
+    under a temporary name and only moved into place once complete.
+    """
+    partial = path.with_name(f"{path.name}.partial")
+    writer = await hass.async_add_executor_job(WRITERS[export_format], partial)
+    rows = 0
+    try:
+        async for chunk in async_iter_export(
+            client, stored, account_id, start_date, end_date, interval=interval
+        ):
+            await hass.async_add_executor_job(writer.write, chunk)
+            rows += len(chunk)
+    except BaseException:
+        await hass.async_add_executor_job(writer.close)
+        await hass.async_add_executor_job(partial.unlink)
+        raise
+    await hass.async_add_executor_job(writer.close)
+    await hass.async_add_executor_job(partial.replace, path)
+    return rows
@@ -0,0 +1,114 @@
+"""Request metrics for the talquin_electric API client."""
+
+from __future__ import annotations
+
+import time
+from bisect import bisect_left
+from collections import Counter, deque
+from dataclasses import dataclass, field
+from typing import Any
+
+from .const import METRICS_LATENCY_BUCKETS, METRICS_REQUEST_WINDOW
+
+
+@dataclass
+class EndpointMetrics:
+    """Counters and a latency histogram for one API endpoint."""
+
+    requests: int = 0
+    # Responses and failures by outcome, e.g. "200", "challenge", "timeout"
+    outcomes: Counter[str] = field(default_factory=Counter)
+    bytes_received: int = 0
+    total_duration: float = 0.0
+    last_duration: float | None = None
+    # One count per bucket of METRICS_LATENCY_BUCKETS, plus one for slower
+    latency_buckets: list[int] = field(
+        default_factory=lambda: [0] * (len(METRICS_LATENCY_BUCKETS) + 1)
+    )
+
+    def as_dict(self) -> dict[str, Any]:
+        """Return the metrics for diagnostics."""
+        return {
+            "requests": self.requests,
+            "outcomes": dict(self.outcomes),
+            "bytes_received": self.bytes_received,
+            "mean_duration": (
+                round(self.total_duration / self.requests, 3) if self.requests else None
+            ),
+            "last_duration": self.last_duration,
+            "latency_histogram": dict(
+                zip(
+                    [f"le_{bound}" for bound in METRICS_LATENCY_BUCKETS] + ["inf"],
+                    self.latency_buckets,
+                    strict=True,
+                )
+            ),
+        }
+
+
+class ApiMetrics:
+    """
+    Registry of request metrics, per endpoint, for the lifetime of a client.
+
+    Recording is a few counter updates per request, so it is always on.
+    """
+
+    def __init__(self) -> None:
+        """Initialize an empty registry."""
+        self.endpoints: dict[str, EndpointMetrics] = {}
+        self.token_fetches = 0
+        self.challenges = 0
+        # (monotonic hour, requests in that hour) for the trailing window
+        self._hourly_requests: deque[list[int]] = deque()
+
+    def endpoint(self, name: str) -> EndpointMetrics:
+        """Return the metrics of an endpoint, creating them on first use."""
+        if (metrics := self.endpoints.get(name)) is None:
+            metrics = self.endpoints[name] = EndpointMetrics()
+        return metrics
+
+    def record_request(self, endpoint: str, duration: float, outcome: str) -> None:
+        """Record a finished request attempt."""
+        metrics = self.endpoint(endpoint)
+        metrics.requests += 1
+        metrics.outcomes[outcome] += 1
+        metrics.total_duration += duration
+        metrics.last_duration = round(duration, 3)
+        metrics.latency_buckets[bisect_left(METRICS_LATENCY_BUCKETS, duration)] += 1
+        if outcome == "challenge":
+            self.challenges += 1
+
+        hour = int(time.monotonic() // 3600)
+        if self._hourly_requests and self._hourly_requests[-1][0] == hour:
+            self._hourly_requests[-1][1] += 1
+        else:
+            self._hourly_requests.append([hour, 1])
+        self._expire(hour)
+
+    def record_bytes(self, endpoint: str, num_bytes: int) -> None:
+        """Record the bytes received for a response."""
+        self.endpoint(endpoint).bytes_received += num_bytes
+
+    def requests_in_window(self) -> int:
+        """Return the requests made in the trailing METRICS_REQUEST_WINDOW."""
+        self._expire(int(time.monotonic() // 3600))
+        return sum(count for _, count in self._hourly_requests)
+
+    def _expire(self, hour: int) -> None:
+        """Drop hourly counts that fell out of the trailing window."""
+        window_hours = int(METRICS_REQUEST_WINDOW.total_seconds() // 3600)
+        while self._hourly_requests and self._hourly_requests[0][0] <= (
+            hour - window_hours
+        ):
+            self._hourly_requests.popleft()
+
+    def as_dict(self) -> dict[str, Any]:
+        """Return the metrics for diagnostics."""
+        return {
+            "token_fetches": self.token_fetches,
+            "challenges": self.challenges,
+            "requests_in_window": self.requests_in_window(),
+            "endpoints": {
+                name: metrics.as_dict() for name, metrics in self.endpoints.items()
+            },
+        }
@@ -0,0 +1,145 @@
+"""Retry and circuit breaker policies for the talquin_electric API client."""
+
+from __future__ import annotations
+
+import random
+import time
+from dataclasses import dataclass
+from datetime import UTC, datetime
+from email.utils import parsedate_to_datetime
+from enum import StrEnum
+from typing import Any
+
+from .const import (
+    CIRCUIT_COOLDOWN,
+    CIRCUIT_FAILURE_THRESHOLD,
+    RETRY_ATTEMPTS,
+    RETRY_BASE_DELAY,
+    RETRY_JITTER,
+    RETRY_MAX_DELAY,
+)
+
+
+@dataclass(frozen=True)
+class RetryPolicy:
+    """How often, and how long apart, transient failures are retried."""
+
+    attempts: int = RETRY_ATTEMPTS
+    base_delay: float = RETRY_BASE_DELAY
+    max_delay: float = RETRY_MAX_DELAY
+    jitter: float = RETRY_JITTER
+
+    def delay(self, attempt: int) -> float:
+        """Return the backoff before retrying after failed attempt `attempt`."""
+        delay = min(self.base_delay * 2 ** (attempt - 1), self.max_delay)
+        return delay * (1 + random.uniform(-self.jitter, self.jitter))  # noqa: S311
+
+
+def parse_retry_after(value: str | None) -> float | None:
+    """Parse a Retry-After header (seconds or HTTP date) into seconds."""
+    if value is None:
+        return None
+    try:
+        return max(float(value), 0.0)
+    except ValueError:
+        pass
+    try:
+        retry_at = parsedate_to_datetime(value)
+    except (TypeError, ValueError):
+        return None
+    return max((retry_at - datetime.now(UTC)).total_seconds(), 0.0)
+
+
+class CircuitState(StrEnum):
+    """State of a circuit breaker."""
+
+    CLOSED = "closed"
+    OPEN = "open"
+    HALF_OPEN = "half_open"
+
+
+class CircuitBreaker:
+    """
+    Stop calling the API for a cooldown after repeated failures.
+
+    After `failure_threshold` consecutive failed calls, or when tripped
+    explicitly (e.g. by a Cloudflare challenge), the breaker opens. Once the
+    cooldown has passed a single trial call is let through; its outcome closes
+    or re-opens the breaker.
+    """
+
+    def __init__(
+        self,
+        failure_threshold: int = CIRCUIT_FAILURE_THRESHOLD,
+        cooldown: float = CIRCUIT_COOLDOWN,
+    ) -> None:
+        """Initialize a closed circuit breaker."""
+        self.failure_threshold = failure_threshold
+        self.cooldown = cooldown
+        self.consecutive_failures = 0
+        self.last_error: str | None = None
+        self._opened_until: float | None = None
+        self._trial_in_flight = False
+
+    @property
+    def state(self) -> CircuitState:
+        """Return the current state."""
+        if self._opened_until is None:
+            return CircuitState.CLOSED
+        if time.monotonic() < self._opened_until:
+            return CircuitState.OPEN
+        return CircuitState.HALF_OPEN
+
+    @property
+    def cooldown_remaining(self) -> float:
+        """Return the seconds left before a trial call is allowed."""
+        if self._opened_until is None:
+            return 0.0
+        return max(self._opened_until - time.monotonic(), 0.0)
+
+    def allow_request(self) -> bool:
+        """Return True if a call may be made now, claiming the half-open trial."""
+        match self.state:
+            case CircuitState.CLOSED:
+                return True
+            case CircuitState.HALF_OPEN if not self._trial_in_flight:
+                self._trial_in_flight = True
+                return True
+        return False
+
+    def end_trial(self) -> None:
+        """Release the half-open trial of a call that ended without an outcome."""
+        self._trial_in_flight = False
+
+    def record_success(self) -> None:
+        """Record a successful call, closing the breaker."""
+        self.consecutive_failures = 0
+        self._opened_until = None
+        self._trial_in_flight = False
+
+    def record_failure(self, error: Exception) -> None:
+        """Record a failed call, opening the breaker past the threshold."""
+        self.consecutive_failures += 1
+        self.last_error = str(error)
+        if (
+            self.state is CircuitState.HALF_OPEN
+            or self.consecutive_failures >= self.failure_threshold
+        ):
+            self.trip(error)
+
+    def trip(self, error: Exception, cooldown: float | None = None) -> None:
+        """Open the breaker for `cooldown` seconds (the default cooldown if None)."""
+        self.last_error = str(error)
+        self._trial_in_flight = False
+        self._opened_until = time.monotonic() + (
+            self.cooldown if cooldown is None else cooldown
+        )
+
+    def as_dict(self) -> dict[str, Any]:
+        """Return the breaker state for diagnostics."""
+        return {
+            "state": self.state,
+            "consecutive_failures": self.consecutive_failures,
+            "cooldown_remaining": round(self.cooldown_remaining, 1),
+            "last_error": self.last_error,
+        }
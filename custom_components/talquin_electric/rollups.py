@@ -0,0 +1,211 @@
+"""Precomputed usage rollups for talquin_electric."""
+
+from __future__ import annotations
+
+import calendar
+from array import array
+from datetime import UTC, date, datetime, time, timedelta
+from itertools import accumulate, pairwise
+from typing import TYPE_CHECKING
+
+from .usage_series import UsageSeries
+
+if TYPE_CHECKING:
+    from collections.abc import Iterable, Iterator
+    from datetime import tzinfo
+
+
+def day_start(moment: datetime, tz: tzinfo) -> datetime:
+    """Return the start of the local day containing `moment`."""
+    return datetime.combine(moment.astimezone(tz).date(), time(), tzinfo=tz)
+
+
+def _cycle_start_date(year: int, month: int, billing_cycle_day: int) -> date:
+    """Return the cycle start in a month, clamped to the month's last day."""
+    return date(
+        year, month, min(billing_cycle_day, calendar.monthrange(year, month)[1])
+    )
+
+
+def cycle_start(moment: datetime, tz: tzinfo, billing_cycle_day: int = 1) -> datetime:
+    """Return the start of the billing cycle containing `moment`."""
+    local = moment.astimezone(tz).date()
+    start = _cycle_start_date(local.year, local.month, billing_cycle_day)
+    if local < start:
+        year, month = divmod(local.year * 12 + local.month - 2, 12)
+        start = _cycle_start_date(year, month + 1, billing_cycle_day)
+    return datetime.combine(start, time(), tzinfo=tz)
+
+
+def day_starts(start: datetime, end: datetime, tz: tzinfo) -> Iterator[datetime]:
+    """Yield the local day starts from the day of `start` up to past `end`."""
+    day = day_start(start, tz).date()
+    while True:
+        boundary = datetime.combine(day, time(), tzinfo=tz)
+        yield boundary
+        if boundary > end:
+            return
+        day += timedelta(days=1)
+
+
+def cycle_starts(
+    start: datetime, end: datetime, tz: tzinfo, billing_cycle_day: int = 1
+) -> Iterator[datetime]:
+    """Yield the billing cycle starts from the cycle of `start` up to past `end`."""
+    first = cycle_start(start, tz, billing_cycle_day)
+    months = first.year * 12 + first.month - 1
+    while True:
+        year, month = divmod(months, 12)
+        boundary = datetime.combine(
+            _cycle_start_date(year, month + 1, billing_cycle_day), time(), tzinfo=tz
+        )
+        yield boundary
+        if boundary > end:
+            return
+        months += 1
+
+
+class UsageRollup:
+    """
+    Range totals and peaks over a usage series.
+
+    Prefix sums answer the total of any date range with two binary searches,
+    and a segment tree of maxima answers its peak in O(log n). Daily, monthly
+    and billing cycle totals are derived from the prefix sums rather than by
+    re-summing the rows of every bucket.
+    """
+
+    __slots__ = ("_billing_cycle_day", "_peaks", "_prefix", "_tz", "_usage")
+
+    def __init__(
+        self,
+        usage: UsageSeries,
+        *,
+        tz: tzinfo = UTC,
+        billing_cycle_day: int = 1,
+    ) -> None:
+        """Precompute the rollups of `usage` in the local time zone `tz`."""
+        self._usage = usage
+        self._tz = tz
+        self._billing_cycle_day = billing_cycle_day
+        self._prefix = array("d", accumulate(usage.values, initial=0.0))
+        # Leaves at [n, 2n); node i holds the max of nodes 2i and 2i + 1.
+        size = len(usage)
+        peaks = array("d", bytes(8 * size))
+        peaks.extend(usage.values)
+        for node in range(size - 1, 0, -1):
+            peaks[node] = max(peaks[2 * node], peaks[2 * node + 1])
+        self._peaks = peaks
+
+    @property
+    def usage(self) -> UsageSeries:
+        """Return the series the rollups were computed from."""
+        return self._usage
+
+    @property
+    def tz(self) -> tzinfo:
+        """Return the time zone of the day and cycle boundaries."""
+        return self._tz
+
+    @property
+    def billing_cycle_day(self) -> int:
+        """Return the day of the month billing cycles start on."""
+        return self._billing_cycle_day
+
+    def _bounds(self, start: datetime | None, end: datetime | None) -> tuple[int, int]:
+        """Return the index range of the entries in [start, end)."""
+        return (
+            self._usage.index_of(start) if start is not None else 0,
+            self._usage.index_of(end) if end is not None else len(self._usage),
+        )
+
+    def total(
+        self, start: datetime | None = None, end: datetime | None = None
+    ) -> float:
+        """Return the total usage in [start, end)."""
+        first, last = self._bounds(start, end)
+        if first >= last:
+            return 0.0
+        return self._prefix[last] - self._prefix[first]
+
+    def peak(
+        self, start: datetime | None = None, end: datetime | None = None
+    ) -> float | None:
+        """Return the largest single reading in [start, end), if any."""
+        first, last = self._bounds(start, end)
+        if first >= last:
+            return None
+        size = len(self._usage)
+        first += size
+        last += size
+        peak = self._peaks[first]
+        while first < last:
+            if first & 1:
+                peak = max(peak, self._peaks[first])
+                first += 1
+            if last & 1:
+                last -= 1
+                peak = max(peak, self._peaks[last])
+            first >>= 1
+            last >>= 1
+        return peak
+
+    def totals(self, boundaries: Iterable[datetime]) -> UsageSeries:
+        """Return the total of each bucket between consecutive boundaries."""
+        timestamps = []
+        values = []
+        for start, end in pairwise(boundaries):
+            timestamps.append(int(start.timestamp()))
+            values.append(self.total(start, end))
+        return UsageSeries(timestamps, values)
+
+    def daily(self) -> UsageSeries:
+        """Return the total usage of each local day."""
+        if not self._usage:
+            return UsageSeries()
+        return self.totals(
+            day_starts(self._usage.first_date, self._usage.last_date, self._tz)
+        )
+
+    def monthly(self) -> UsageSeries:
+        """Return the total usage of each calendar month."""
+        if not self._usage:
+            return UsageSeries()
+        return self.totals(
+            cycle_starts(self._usage.first_date, self._usage.last_date, self._tz)
+        )
+
+    def billing_cycles(self) -> UsageSeries:
+        """Return the total usage of each billing cycle."""
+        if not self._usage:
+            return UsageSeries()
+        return self.totals(
+            cycle_starts(
+                self._usage.first_date,
+                self._usage.last_date,
+                self._tz,
+                self._billing_cycle_day,
+            )
+        )
+
+    def last_day_total(self) -> float | None:
+        """Return the total usage of the most recent day with data."""
+        if not self._usage:
+            return None
+        return self.total(day_start(self._usage.last_date, self._tz))
+
+    def current_cycle_total(self) -> float | None:
+        """Return the usage so far in the most recent billing cycle."""
+        if not self._usage:
+            return None
+        return self.total(self._current_cycle_start())
+
+    def current_cycle_peak(self) -> float | None:
+        """Return the largest reading so far in the most recent billing cycle."""
+        if not self._usage:
+            return None
+        return self.peak(self._current_cycle_start())
+
+    def _current_cycle_start(self) -> datetime:
+        """Return the start of the billing cycle of the newest entry."""
+        return cycle_start(self._usage.last_date, self._tz, self._billing_cycle_day)
@@ -0,0 +1,101 @@
+"""Adaptive poll scheduling for talquin_electric."""
+
+from __future__ import annotations
+
+import random
+from datetime import datetime, timedelta
+from typing import Any
+
+from .const import (
+    POLL_INTERVAL_DEFAULT,
+    POLL_INTERVAL_DENSE,
+    POLL_INTERVAL_MAX,
+    POLL_JITTER,
+    POLL_MIN_OBSERVATIONS,
+    POLL_PUBLICATION_SHARE,
+)
+
+
+class PollScheduler:
+    """
+    Learn when new usage is published and poll densely only around then.
+
+    Every poll that brings new data counts towards the UTC hour it happened
+    in. Once enough publications have been seen, polls are dense during the
+    learned hours until that day's data arrives, and otherwise back off
+    exponentially (with jitter) without sleeping past the next window.
+    """
+
+    def __init__(self, state: dict[str, Any] | None = None) -> None:
+        """Initialize, resuming from a state saved with `as_dict`."""
+        state = state or {}
+        self._publication_hours: list[int] = state.get("publication_hours", [0] * 24)
+        self._idle_polls: int = state.get("idle_polls", 0)
+        last_publication = state.get("last_publication")
+        self._last_publication = (
+            datetime.fromisoformat(last_publication) if last_publication else None
+        )
+
+    def as_dict(self) -> dict[str, Any]:
+        """Return the learned state for persisting."""
+        return {
+            "publication_hours": list(self._publication_hours),
+            "idle_polls": self._idle_polls,
+            "last_publication": (
+                self._last_publication.isoformat() if self._last_publication else None
+            ),
+        }
+
+    def record_poll(self, now: datetime, *, new_data: bool) -> None:
+        """Record the outcome of a poll."""
+        if new_data:
+            self._publication_hours[now.hour] += 1
+            self._last_publication = now
+            self._idle_polls = 0
+        else:
+            self._idle_polls += 1
+
+    def publication_hours(self) -> set[int]:
+        """Return the UTC hours new data is typically published in."""
+        if sum(self._publication_hours) < POLL_MIN_OBSERVATIONS:
+            return set()
+        threshold = max(self._publication_hours) * POLL_PUBLICATION_SHARE
+        return {
+            hour
+            for hour, count in enumerate(self._publication_hours)
+            if count >= threshold
+        }
+
+    def next_interval(self, now: datetime) -> timedelta:
+        """Return how long to wait before the next poll."""
+        hours = self.publication_hours()
+        if not hours:
+            return POLL_INTERVAL_DEFAULT
+        published_today = (
+            self._last_publication is not None
+            and self._last_publication.date() == now.date()
+        )
+        if now.hour in hours and not published_today:
+            return POLL_INTERVAL_DENSE
+        backoff = min(
+            POLL_INTERVAL_DEFAULT * 2 ** min(self._idle_polls, 8), POLL_INTERVAL_MAX
+        )
+        backoff *= 1 + random.uniform(-POLL_JITTER, POLL_JITTER)  # noqa: S311
+        interval = min(backoff, self._until_next_window(now, hours, published_today))
+        return max(interval, POLL_INTERVAL_DENSE)
+
+    @staticmethod
+    def _until_next_window(
+        now: datetime,
+        hours: set[int],
+        published_today: bool,  # noqa: FBT001
+    ) -> timedelta:
+        """Return the time until the next learned publication hour starts."""
+        hour_start = now.replace(minute=0, second=0, microsecond=0)
+        for offset in range(1, 49):
+            candidate = hour_start + timedelta(hours=offset)
+            if candidate.hour in hours and not (
+                published_today and candidate.date() == now.date()
+            ):
+                return candidate - now
+        return POLL_INTERVAL_MAX
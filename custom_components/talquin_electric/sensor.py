@@ -2,24 +2,143 @@
 
 from __future__ import annotations
 
+from dataclasses import dataclass
 from typing import TYPE_CHECKING
 
-from homeassistant.components.sensor import SensorEntity, SensorEntityDescription
+from homeassistant.components.sensor import (
+    SensorDeviceClass,
+    SensorEntity,
+    SensorEntityDescription,
+    SensorStateClass,
+)
+from homeassistant.const import EntityCategory, UnitOfEnergy, UnitOfTime
 
 from .entity import TalquinElectricEntity
 
 if TYPE_CHECKING:
+    from collections.abc import Callable
+
     from homeassistant.core import HomeAssistant
     from homeassistant.helpers.entity_platform import AddEntitiesCallback
+    from homeassistant.helpers.typing import StateType
 
     from .coordinator import BlueprintDataUpdateCoordinator
     from .data import TalquinElectricConfigEntry
+    from .estimators import UsageEstimator
+    from .rollups import UsageRollup
+    from .tariff import UsageCost
+
+
+@dataclass(frozen=True, kw_only=True)
+class TalquinElectricSensorEntityDescription(SensorEntityDescription):
+    """Describes a talquin_electric sensor."""
+
+    value_fn: Callable[[UsageRollup], StateType]
+
+
+@dataclass(frozen=True, kw_only=True)
+class TalquinElectricEstimatorSensorEntityDescription(SensorEntityDescription):
+    """Describes a talquin_electric sensor read from the online estimators."""
+
+    value_fn: Callable[[UsageEstimator], StateType]
+
+
+@dataclass(frozen=True, kw_only=True)
+class TalquinElectricCostSensorEntityDescription(SensorEntityDescription):
+    """Describes a talquin_electric sensor priced under the tariff."""
+
+    value_fn: Callable[[UsageCost], StateType]
+
+
+@dataclass(frozen=True, kw_only=True)
+class TalquinElectricDiagnosticSensorEntityDescription(SensorEntityDescription):
+    """Describes a talquin_electric sensor about the integration itself."""
+
+    value_fn: Callable[[BlueprintDataUpdateCoordinator], StateType]
+
 
 ENTITY_DESCRIPTIONS = (
-    SensorEntityDescription(
-        key="talquin_electric",
-        name="Integration Sensor",
-        icon="mdi:format-quote-close",
+    TalquinElectricSensorEntityDescription(
+        key="last_day_usage",
+        name="Last day usage",
+        device_class=SensorDeviceClass.ENERGY,
+        native_unit_of_measurement=UnitOfEnergy.KILO_WATT_HOUR,
+        value_fn=lambda rollup: rollup.last_day_total(),
+    ),
+    TalquinElectricSensorEntityDescription(
+        key="billing_cycle_usage",
+        name="Billing cycle usage",
+        device_class=SensorDeviceClass.ENERGY,
+        native_unit_of_measurement=UnitOfEnergy.KILO_WATT_HOUR,
+        value_fn=lambda rollup: rollup.current_cycle_total(),
+    ),
+    TalquinElectricSensorEntityDescription(
+        key="billing_cycle_peak_usage",
+        name="Billing cycle peak usage",
+        device_class=SensorDeviceClass.ENERGY,
+        native_unit_of_measurement=UnitOfEnergy.KILO_WATT_HOUR,
+        value_fn=lambda rollup: rollup.current_cycle_peak(),
+    ),
+)
+
+ESTIMATOR_ENTITY_DESCRIPTIONS = (
+    TalquinElectricEstimatorSensorEntityDescription(
+        key="projected_billing_cycle_usage",
+        name="Projected billing cycle usage",
+        device_class=SensorDeviceClass.ENERGY,
+        native_unit_of_measurement=UnitOfEnergy.KILO_WATT_HOUR,
+        suggested_display_precision=1,
+        value_fn=lambda estimator: estimator.projected_cycle_total,
+    ),
+)
+
+
+COST_ENTITY_DESCRIPTIONS = (
+    TalquinElectricCostSensorEntityDescription(
+        key="last_day_cost",
+        name="Last day cost",
+        device_class=SensorDeviceClass.MONETARY,
+        suggested_display_precision=2,
+        value_fn=lambda cost: cost.last_day_cost(),
+    ),
+    TalquinElectricCostSensorEntityDescription(
+        key="billing_cycle_cost",
+        name="Billing cycle cost",
+        device_class=SensorDeviceClass.MONETARY,
+        suggested_display_precision=2,
+        value_fn=lambda cost: cost.current_cycle_cost(),
+    ),
+    TalquinElectricCostSensorEntityDescription(
+        key="projected_billing_cycle_cost",
+        name="Projected billing cycle cost",
+        device_class=SensorDeviceClass.MONETARY,
+        suggested_display_precision=2,
+        value_fn=lambda cost: cost.projected_cycle_cost(),
+    ),
+)
+
+
+DIAGNOSTIC_ENTITY_DESCRIPTIONS = (
+    TalquinElectricDiagnosticSensorEntityDescription(
+        key="last_refresh_duration",
+        name="Last refresh duration",
+        device_class=SensorDeviceClass.DURATION,
+        native_unit_of_measurement=UnitOfTime.SECONDS,
+        state_class=SensorStateClass.MEASUREMENT,
+        entity_category=EntityCategory.DIAGNOSTIC,
+        entity_registry_enabled_default=False,
+        value_fn=lambda coordinator: coordinator.last_refresh_duration,
+    ),
+    TalquinElectricDiagnosticSensorEntityDescription(
+        key="requests_per_day",
+        name="API requests in the last day",
+        native_unit_of_measurement="requests",
+        state_class=SensorStateClass.MEASUREMENT,
+        entity_category=EntityCategory.DIAGNOSTIC,
+        entity_registry_enabled_default=False,
+        value_fn=lambda coordinator: (
+            coordinator.config_entry.runtime_data.client.metrics.requests_in_window()
+        ),
     ),
 )
 
@@ -30,28 +149,125 @@ async def async_setup_entry(
     async_add_entities: AddEntitiesCallback,
 ) -> None:
     """Set up the sensor platform."""
+    coordinator = entry.runtime_data.coordinator
     async_add_entities(
         TalquinElectricSensor(
-            coordinator=entry.runtime_data.coordinator,
+            coordinator=coordinator,
+            account_id=account_id,
             entity_description=entity_description,
         )
+        for account_id in coordinator.account_ids
         for entity_description in ENTITY_DESCRIPTIONS
     )
+    async_add_entities(
+        TalquinElectricEstimatorSensor(
+            coordinator=coordinator,
+            account_id=account_id,
+            entity_description=entity_description,
+        )
+        for account_id in coordinator.account_ids
+        for entity_description in ESTIMATOR_ENTITY_DESCRIPTIONS
+    )
+    if coordinator.tariff is not None:
+        async_add_entities(
+            TalquinElectricCostSensor(
+                coordinator=coordinator,
+                account_id=account_id,
+                entity_description=entity_description,
+            )
+            for account_id in coordinator.account_ids
+            for entity_description in COST_ENTITY_DESCRIPTIONS
+        )
+    async_add_entities(
+        TalquinElectricDiagnosticSensor(
+            coordinator=coordinator,
+            entity_description=entity_description,
+        )
+        for entity_description in DIAGNOSTIC_ENTITY_DESCRIPTIONS
+    )
 
 
 class TalquinElectricSensor(TalquinElectricEntity, SensorEntity):
     """talquin_electric Sensor class."""
 
+    entity_description: TalquinElectricSensorEntityDescription
+
+    def __init__(
+        self,
+        coordinator: BlueprintDataUpdateCoordinator,
+        account_id: str,
+        entity_description: TalquinElectricSensorEntityDescription,
+    ) -> None:
+        """Initialize the sensor class."""
+        super().__init__(coordinator, account_id, entity_description.key)
+        self.entity_description = entity_description
+
+    @property
+    def native_value(self) -> StateType:
+        """Return the native value of the sensor."""
+        return self.entity_description.value_fn(self.rollup)
+
+
+class TalquinElectricEstimatorSensor(TalquinElectricEntity, SensorEntity):
+    """talquin_electric sensor estimated incrementally from new readings."""
+
+    entity_description: TalquinElectricEstimatorSensorEntityDescription
+
+    def __init__(
+        self,
+        coordinator: BlueprintDataUpdateCoordinator,
+        account_id: str,
+        entity_description: TalquinElectricEstimatorSensorEntityDescription,
+    ) -> None:
+        """Initialize the sensor class."""
+        super().__init__(coordinator, account_id, entity_description.key)
+        self.entity_description = entity_description
+
+    @property
+    def native_value(self) -> StateType:
+        """Return the native value of the sensor."""
+        return self.entity_description.value_fn(self.estimator)
+
+
+class TalquinElectricCostSensor(TalquinElectricEntity, SensorEntity):
+    """talquin_electric sensor of the cost of an account's usage."""
+
+    entity_description: TalquinElectricCostSensorEntityDescription
+
+    def __init__(
+        self,
+        coordinator: BlueprintDataUpdateCoordinator,
+        account_id: str,
+        entity_description: TalquinElectricCostSensorEntityDescription,
+    ) -> None:
+        """Initialize the sensor class."""
+        super().__init__(coordinator, account_id, entity_description.key)
+        self.entity_description = entity_description
+        self._attr_native_unit_of_measurement = coordinator.hass.config.currency
+
+    @property
+    def native_value(self) -> StateType:
+        """Return the native value of the sensor."""
+        if (cost := self.cost) is None:
+            return None
+        return self.entity_description.value_fn(cost)
+
+
+class TalquinElectricDiagnosticSensor(TalquinElectricEntity, SensorEntity):
+    """talquin_electric sensor about the integration's own API use."""
+
+    entity_description: TalquinElectricDiagnosticSensorEntityDescription
+
     def __init__(
         self,
         coordinator: BlueprintDataUpdateCoordinator,
-        entity_description: SensorEntityDescription,
+        entity_description: TalquinElectricDiagnosticSensorEntityDescription,
     ) -> None:
         """Initialize the sensor class."""
-        super().__init__(coordinator)
+        super().__init__(coordinator, None, entity_description.key)
         self.entity_description = entity_description
 
     @property
-    def native_value(self) -> str | None:
+    def native_value(self) -> StateType:
         """Return the native value of the sensor."""
-        return self.coordinator.data.get("body")
+        return self.entity_description.value_fn(self.coordinator)
@@ -0,0 +1,133 @@
+"""Services for talquin_electric."""
+
+from __future__ import annotations
+
+from pathlib import Path
+from typing import TYPE_CHECKING
+
+import voluptuous as vol
+from homeassistant.config_entries import ConfigEntryState
+from homeassistant.core import SupportsResponse, callback
+from homeassistant.exceptions import HomeAssistantError, ServiceValidationError
+from homeassistant.helpers import config_validation as cv
+from homeassistant.util import dt as dt_util
+
+from .api import TalquinElectricApiClientError
+from .const import DOMAIN, LOGGER
+from .export import ExportDependencyError, ExportFormat, async_export_usage
+from .usage_series import UsageSeries
+
+if TYPE_CHECKING:
+    from homeassistant.core import HomeAssistant, ServiceCall, ServiceResponse
+
+    from .data import TalquinElectricConfigEntry
+
+SERVICE_SET_TRACING = "set_tracing"
+ATTR_ENABLED = "enabled"
+ATTR_PROFILE = "profile"
+
+SET_TRACING_SCHEMA = vol.Schema(
+    {
+        vol.Required(ATTR_ENABLED): cv.boolean,
+        vol.Optional(ATTR_PROFILE, default=False): cv.boolean,
+    }
+)
+
+SERVICE_EXPORT_USAGE = "export_usage"
+ATTR_ACCOUNT_ID = "account_id"
+ATTR_START = "start"
+ATTR_END = "end"
+ATTR_FORMAT = "format"
+
+EXPORT_USAGE_SCHEMA = vol.Schema(
+    {
+        vol.Required(ATTR_ACCOUNT_ID): cv.string,
+        vol.Required(ATTR_START): cv.datetime,
+        vol.Optional(ATTR_END): cv.datetime,
+        vol.Optional(ATTR_FORMAT, default=ExportFormat.CSV): vol.Coerce(ExportFormat),
+    }
+)
+
+
+def _loaded_entries(hass: HomeAssistant) -> list[TalquinElectricConfigEntry]:
+    """Return the loaded config entries of the integration."""
+    return [
+        entry
+        for entry in hass.config_entries.async_entries(DOMAIN)
+        if entry.state is ConfigEntryState.LOADED
+    ]
+
+
+@callback
+def async_setup_services(hass: HomeAssistant) -> None:
+    """Register the integration's services."""
+
+    async def async_set_tracing(call: ServiceCall) -> None:
+        """Turn refresh tracing on or off, optionally profiling a refresh now."""
+        for entry in _loaded_entries(hass):
+            tracer = entry.runtime_data.client.tracer
+            tracer.enabled = call.data[ATTR_ENABLED]
+            if call.data[ATTR_PROFILE]:
+                tracer.profile_next = True
+                await entry.runtime_data.coordinator.async_request_refresh()
+        LOGGER.info(
+            "Refresh tracing %s%s",
+            "enabled" if call.data[ATTR_ENABLED] else "disabled",
+            ", profiling a refresh" if call.data[ATTR_PROFILE] else "",
+        )
+
+    async def async_export(call: ServiceCall) -> ServiceResponse:
+        """Export an account's usage to a file in the configuration directory."""
+        account_id = call.data[ATTR_ACCOUNT_ID]
+        entry = next(
+            (
+                entry
+                for entry in _loaded_entries(hass)
+                if account_id in entry.runtime_data.coordinator.account_ids
+            ),
+            None,
+        )
+        if entry is None:
+            msg = f"No loaded account {account_id}"
+            raise ServiceValidationError(msg)
+        coordinator = entry.runtime_data.coordinator
+        start = dt_util.as_utc(call.data[ATTR_START])
+        end = dt_util.as_utc(call.data.get(ATTR_END) or dt_util.now())
+        if start >= end:
+            msg = "The export must start before it ends"
+            raise ServiceValidationError(msg)
+        export_format = call.data[ATTR_FORMAT]
+        path = Path(
+            hass.config.path(
+                f"{DOMAIN}_{account_id}_{start:%Y%m%d}_{end:%Y%m%d}.{export_format}"
+            )
+        )
+        try:
+            rows = await async_export_usage(
+                hass,
+                entry.runtime_data.client,
+                (coordinator.data or {}).get(account_id, UsageSeries()),
+                account_id,
+                start,
+                end,
+                path=path,
+                export_format=export_format,
+                interval=coordinator.usage_interval,
+            )
+        except ExportDependencyError as exception:
+            raise ServiceValidationError(str(exception)) from exception
+        except TalquinElectricApiClientError as exception:
+            raise HomeAssistantError(str(exception)) from exception
+        LOGGER.info("Exported %s rows of usage to %s", rows, path)
+        return {"path": str(path), "rows": rows}
+
+    hass.services.async_register(
+        DOMAIN, SERVICE_SET_TRACING, async_set_tracing, schema=SET_TRACING_SCHEMA
+    )
+    hass.services.async_register(
+        DOMAIN,
+        SERVICE_EXPORT_USAGE,
+        async_export,
+        schema=EXPORT_USAGE_SCHEMA,
+        supports_response=SupportsResponse.OPTIONAL,
+    )
@@ -0,0 +1,136 @@
+"""Long-term statistics import for talquin_electric."""
+
+from __future__ import annotations
+
+from datetime import timedelta
+from itertools import groupby, islice
+from typing import TYPE_CHECKING
+
+from homeassistant.components.recorder import get_instance
+from homeassistant.components.recorder.models import StatisticData, StatisticMetaData
+from homeassistant.components.recorder.statistics import (
+    async_add_external_statistics,
+    get_last_statistics,
+    statistics_during_period,
+)
+from homeassistant.const import UnitOfEnergy
+from homeassistant.util import dt as dt_util
+from homeassistant.util import slugify
+
+from .const import (
+    DOMAIN,
+    LOGGER,
+    STATISTICS_IMPORT_BATCH_SIZE,
+    STATISTICS_SUM_LOOKBACK,
+)
+
+if TYPE_CHECKING:
+    from datetime import datetime
+
+    from homeassistant.core import HomeAssistant
+
+    from .usage_series import UsageSeries
+
+
+def usage_statistic_id(account_id: str) -> str:
+    """Return the external statistic ID for an account's energy usage."""
+    return f"{DOMAIN}:energy_consumption_{slugify(account_id)}"
+
+
+def build_statistics(
+    usage: UsageSeries,
+    base_sum: float,
+) -> list[StatisticData]:
+    """
+    Build hourly statistics with a running sum starting at `base_sum`.
+
+    Readings finer than an hour are added up into the hour they fall in.
+    """
+    statistics = []
+    running_sum = base_sum
+    for hour, values in groupby(
+        zip(usage.timestamps, usage.values, strict=True),
+        key=lambda row: row[0] - row[0] % 3600,
+    ):
+        state = sum(value for _, value in values)
+        running_sum += state
+        statistics.append(
+            StatisticData(
+                start=dt_util.utc_from_timestamp(hour),
+                state=state,
+                sum=running_sum,
+            )
+        )
+    return statistics
+
+
+async def _async_get_sum_before(
+    hass: HomeAssistant, statistic_id: str, start: datetime
+) -> float | None:
+    """Get the running sum of the last statistic before `start`, if recent."""
+    stats = await get_instance(hass).async_add_executor_job(
+        statistics_during_period,
+        hass,
+        start - STATISTICS_SUM_LOOKBACK,
+        start,
+        {statistic_id},
+        "hour",
+        None,
+        {"sum"},
+    )
+    if rows := stats.get(statistic_id):
+        return rows[-1]["sum"]
+    return None
+
+
+async def async_import_usage_statistics(
+    hass: HomeAssistant,
+    account_id: str,
+    usage: UsageSeries,
+    since: datetime,
+) -> None:
+    """
+    Import an account's usage from `since` onwards as external statistics.
+
+    The running sum continues from the statistics already in the recorder, so
+    only rows that are new (or were re-fetched for corrections) are written.
+    """
+    statistic_id = usage_statistic_id(account_id)
+    # Statistics are hourly, so a partially re-fetched hour is rebuilt whole.
+    since = since.replace(minute=0, second=0, microsecond=0)
+    last_stats = await get_instance(hass).async_add_executor_job(
+        get_last_statistics,
+        hass,
+        1,
+        statistic_id,
+        True,  # noqa: FBT003
+        {"sum"},
+    )
+    base_sum = 0.0
+    if last_stat := next(iter(last_stats.get(statistic_id, [])), None):
+        last_start = dt_util.utc_from_timestamp(last_stat["start"])
+        base_sum = last_stat["sum"] or 0.0
+        if since <= last_start:
+            # Corrections to rows already imported: continue from the sum
+            # just before them, or only append if that is out of reach.
+            sum_before = await _async_get_sum_before(hass, statistic_id, since)
+            if sum_before is not None:
+                base_sum = sum_before
+            else:
+                since = last_start + timedelta(hours=1)
+    usage = usage.between(since)
+    if not usage:
+        return
+
+    metadata = StatisticMetaData(
+        has_mean=False,
+        has_sum=True,
+        name=f"Talquin Electric {account_id} energy consumption",
+        source=DOMAIN,
+        statistic_id=statistic_id,
+        unit_of_measurement=UnitOfEnergy.KILO_WATT_HOUR,
+    )
+    statistics = iter(build_statistics(usage, base_sum))
+    while batch := list(islice(statistics, STATISTICS_IMPORT_BATCH_SIZE)):
+        async_add_external_statistics(hass, metadata, batch)
+    LOGGER.debug("Imported %s usage rows for %s", len(usage), account_id)
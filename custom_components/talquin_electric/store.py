@@ -0,0 +1,104 @@
+"""Persistent usage storage for talquin_electric."""
+
+from __future__ import annotations
+
+from dataclasses import dataclass, field
+from typing import TYPE_CHECKING, Any
+
+from homeassistant.helpers.storage import Store
+
+from .const import (
+    DEFAULT_USAGE_INTERVAL,
+    DOMAIN,
+    STORAGE_SAVE_DELAY,
+    STORAGE_VERSION,
+    UsageInterval,
+)
+from .usage_series import UsageSeries
+
+if TYPE_CHECKING:
+    from homeassistant.core import HomeAssistant
+
+
+@dataclass
+class StoredUsage:
+    """Everything persisted for a config entry."""
+
+    usage: dict[str, UsageSeries] = field(default_factory=dict)
+    scheduler: dict[str, Any] = field(default_factory=dict)
+    # Granularity of the stored series; they are refetched if it changes
+    interval: UsageInterval = DEFAULT_USAGE_INTERVAL
+    # Online estimator state per account, so restarts don't replay the series
+    estimators: dict[str, dict[str, Any]] = field(default_factory=dict)
+
+
+class TalquinElectricUsageStore:
+    """
+    Store the synced usage series of every account of a config entry.
+
+    Rows are kept as compact `[epoch seconds, kWh]` pairs so restarts can
+    resume incremental sync from the stored watermark instead of refetching
+    history.
+    """
+
+    def __init__(self, hass: HomeAssistant, entry_id: str) -> None:
+        """Initialize the store for a config entry."""
+        self._store: Store[dict[str, Any]] = Store(
+            hass, STORAGE_VERSION, f"{DOMAIN}.{entry_id}"
+        )
+        # Usage waiting for a delayed save
+        self._pending: StoredUsage | None = None
+
+    async def async_load(self) -> StoredUsage:
+        """Load the stored usage series, keyed by account, and poll state."""
+        if (data := await self._store.async_load()) is None:
+            return StoredUsage()
+        return StoredUsage(
+            usage={
+                account_id: UsageSeries(
+                    (timestamp for timestamp, _ in rows),
+                    (usage for _, usage in rows),
+                )
+                for account_id, rows in data["accounts"].items()
+            },
+            scheduler=data.get("scheduler", {}),
+            interval=UsageInterval(data.get("interval", DEFAULT_USAGE_INTERVAL)),
+            estimators=data.get("estimators", {}),
+        )
+
+    def async_schedule_save(self, stored: StoredUsage) -> None:
+        """Save the usage series, batching writes that happen close together."""
+        self._pending = stored
+        self._store.async_delay_save(self._serialize_pending, STORAGE_SAVE_DELAY)
+
+    async def async_flush(self) -> None:
+        """Write a pending delayed save now, cancelling its timer."""
+        if self._pending is not None:
+            await self._store.async_save(self._serialize_pending())
+
+    def _serialize_pending(self) -> dict[str, Any]:
+        """Serialize the pending usage; the store calls this once per save."""
+        stored, self._pending = self._pending, None
+        return _serialize(stored or StoredUsage())
+
+    async def async_remove(self) -> None:
+        """Remove the stored usage."""
+        await self._store.async_remove()
+
+
+def _serialize(stored: StoredUsage) -> dict[str, Any]:
+    """Convert usage series into their stored representation."""
+    return {
+        "accounts": {
+            account_id: [
+                [timestamp, value]
+                for timestamp, value in zip(
+                    series.timestamps, series.values, strict=True
+                )
+            ]
+            for account_id, series in stored.usage.items()
+        },
+        "scheduler": stored.scheduler,
+        "interval": stored.interval,
+        "estimators": stored.estimators,
+    }
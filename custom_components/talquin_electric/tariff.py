@@ -0,0 +1,209 @@
+"""Tiered and seasonal energy costs for talquin_electric."""
+
+from __future__ import annotations
+
+from dataclasses import dataclass
+from functools import cached_property
+from itertools import pairwise
+from typing import TYPE_CHECKING, Any
+
+from .const import (
+    CONF_CUSTOMER_CHARGE,
+    CONF_ENERGY_RATE,
+    CONF_SUMMER_ENERGY_RATE,
+    CONF_SUMMER_TIER_RATE,
+    CONF_TIER_RATE,
+    CONF_TIER_THRESHOLD,
+    DEFAULT_CUSTOMER_CHARGE,
+    TARIFF_SUMMER_MONTHS,
+)
+from .rollups import cycle_starts, day_starts
+from .usage_series import UsageSeries
+
+if TYPE_CHECKING:
+    from collections.abc import Mapping
+
+    from .rollups import UsageRollup
+
+
+@dataclass(frozen=True, slots=True)
+class TariffTier:
+    """An energy rate, per kWh, up to a usage breakpoint of the billing cycle."""
+
+    rate: float
+    # kWh of the cycle the rate applies up to; None for the last tier
+    up_to: float | None = None
+
+
+@dataclass(frozen=True, slots=True)
+class TariffSeason:
+    """Tiers replacing the default ones in some months."""
+
+    months: frozenset[int]
+    tiers: tuple[TariffTier, ...]
+
+
+@dataclass(frozen=True, slots=True)
+class Tariff:
+    """
+    A rate schedule: a customer charge per billing cycle plus energy tiers.
+
+    Tiers apply to the usage so far in the cycle, and a cycle takes the tiers
+    of the season its start falls in. Tariffs compare equal when their rates
+    do, so an unchanged schedule keeps cached costs valid.
+    """
+
+    tiers: tuple[TariffTier, ...]
+    customer_charge: float = 0.0
+    seasons: tuple[TariffSeason, ...] = ()
+
+    @classmethod
+    def from_options(cls, options: Mapping[str, Any]) -> Tariff | None:
+        """Build the tariff configured in the options, if rates are set."""
+        if (energy_rate := options.get(CONF_ENERGY_RATE)) is None:
+            return None
+        threshold = options.get(CONF_TIER_THRESHOLD)
+        tier_rate = options.get(CONF_TIER_RATE)
+
+        def _tiers(rate: float, above: float | None) -> tuple[TariffTier, ...]:
+            if not threshold or above is None:
+                return (TariffTier(rate),)
+            return (TariffTier(rate, threshold), TariffTier(above))
+
+        seasons = ()
+        if (summer_rate := options.get(CONF_SUMMER_ENERGY_RATE)) is not None:
+            seasons = (
+                TariffSeason(
+                    TARIFF_SUMMER_MONTHS,
+                    _tiers(summer_rate, options.get(CONF_SUMMER_TIER_RATE, tier_rate)),
+                ),
+            )
+        return cls(
+            tiers=_tiers(energy_rate, tier_rate),
+            customer_charge=options.get(CONF_CUSTOMER_CHARGE, DEFAULT_CUSTOMER_CHARGE),
+            seasons=seasons,
+        )
+
+    def tiers_for(self, month: int) -> tuple[TariffTier, ...]:
+        """Return the tiers of cycles starting in `month`."""
+        for season in self.seasons:
+            if month in season.months:
+                return season.tiers
+        return self.tiers
+
+    def energy_cost(self, usage: float, month: int) -> float:
+        """Return the energy cost of the first `usage` kWh of a cycle."""
+        cost = 0.0
+        billed = 0.0
+        for tier in self.tiers_for(month):
+            upper = usage if tier.up_to is None else min(usage, tier.up_to)
+            if upper > billed:
+                cost += (upper - billed) * tier.rate
+                billed = upper
+            if billed >= usage:
+                break
+        return cost
+
+
+class UsageCost:
+    """
+    Costs of a usage series under a tariff.
+
+    Costs are computed from the prefix sums of the series' rollups: the
+    energy cost of a day is the cost of the cycle's usage up to the end of
+    the day minus that up to its start, so one pass over the day boundaries
+    prices every day and cycle without touching individual readings.
+    """
+
+    def __init__(self, rollup: UsageRollup, tariff: Tariff) -> None:
+        """Initialize the costs; they are computed on first use."""
+        self._rollup = rollup
+        self._tariff = tariff
+
+    @property
+    def rollup(self) -> UsageRollup:
+        """Return the rollups the costs are computed from."""
+        return self._rollup
+
+    @property
+    def tariff(self) -> Tariff:
+        """Return the tariff the costs are computed under."""
+        return self._tariff
+
+    @cached_property
+    def _costs(self) -> tuple[UsageSeries, UsageSeries]:
+        """Return the energy cost of each day and the cost of each cycle."""
+        usage = self._rollup.usage
+        if not usage:
+            return UsageSeries(), UsageSeries()
+        tz = self._rollup.tz
+        tariff = self._tariff
+        cycles = iter(
+            pairwise(
+                cycle_starts(
+                    usage.first_date,
+                    usage.last_date,
+                    tz,
+                    self._rollup.billing_cycle_day,
+                )
+            )
+        )
+        cycle, cycle_end = next(cycles)
+        cycle_timestamps = [int(cycle.timestamp())]
+        cycle_costs = [tariff.customer_charge]
+        day_timestamps = []
+        day_costs = []
+        billed = 0.0
+        for day, day_end in pairwise(day_starts(usage.first_date, usage.last_date, tz)):
+            if day >= cycle_end:
+                cycle, cycle_end = next(cycles)
+                cycle_timestamps.append(int(cycle.timestamp()))
+                cycle_costs.append(tariff.customer_charge)
+                billed = 0.0
+            cost = tariff.energy_cost(self._rollup.total(cycle, day_end), cycle.month)
+            day_timestamps.append(int(day.timestamp()))
+            day_costs.append(cost - billed)
+            cycle_costs[-1] += cost - billed
+            billed = cost
+        return (
+            UsageSeries(day_timestamps, day_costs),
+            UsageSeries(cycle_timestamps, cycle_costs),
+        )
+
+    def daily(self) -> UsageSeries:
+        """Return the energy cost of each local day."""
+        return self._costs[0]
+
+    def billing_cycles(self) -> UsageSeries:
+        """Return the cost of each billing cycle, customer charge included."""
+        return self._costs[1]
+
+    def last_day_cost(self) -> float | None:
+        """Return the energy cost of the most recent day with data."""
+        daily = self.daily()
+        return daily.values[-1] if daily else None
+
+    def current_cycle_cost(self) -> float | None:
+        """Return the cost so far of the most recent billing cycle."""
+        cycles = self.billing_cycles()
+        return cycles.values[-1] if cycles else None
+
+    def projected_cycle_cost(self) -> float | None:
+        """
+        Return the expected cost of the most recent billing cycle.
+
+        The usage so far is extrapolated over the whole cycle at the average
+        rate of the days with data.
+        """
+        usage = self._rollup.usage
+        if not usage:
+            return None
+        tz = self._rollup.tz
+        start, end = cycle_starts(
+            usage.last_date, usage.last_date, tz, self._rollup.billing_cycle_day
+        )
+        _, elapsed = day_starts(usage.last_date, usage.last_date, tz)
+        projected = self._rollup.total(start) * ((end - start) / (elapsed - start))
+        return self._tariff.customer_charge + self._tariff.energy_cost(
+            projected, start.month
+        )
@@ -0,0 +1,87 @@
+"""Bulk parsing of usage row timestamps for talquin_electric."""
+
+from __future__ import annotations
+
+from datetime import date, datetime
+from typing import TYPE_CHECKING
+
+if TYPE_CHECKING:
+    from collections.abc import Iterable
+
+_EPOCH_ORDINAL = date(1970, 1, 1).toordinal()
+
+
+def _day_seconds(day: str) -> int | None:
+    """Return the epoch seconds of a `YYYY-MM-DD` day, or None if malformed."""
+    if len(day) != 10 or day[4] != "-" or day[7] != "-":  # noqa: PLR2004
+        return None
+    try:
+        return (date.fromisoformat(day).toordinal() - _EPOCH_ORDINAL) * 86400
+    except ValueError:
+        return None
+
+
+def _offset_seconds(offset: str) -> int | None:
+    """Return the UTC offset of `Z` or `±HH:MM` in seconds, or None."""
+    if offset == "Z":
+        return 0
+    if len(offset) != 6 or offset[0] not in "+-" or offset[3] != ":":  # noqa: PLR2004
+        return None
+    hours, minutes = offset[1:3], offset[4:]
+    if not (hours + minutes).isdigit():
+        return None
+    seconds = int(hours) * 3600 + int(minutes) * 60
+    return -seconds if offset[0] == "-" else seconds
+
+
+def _time_seconds(suffix: str) -> int | None:
+    """
+    Return the seconds since UTC midnight of a `THH:MM:SS` time and offset.
+
+    None is returned if the time or offset is malformed.
+    """
+    if len(suffix) < 10 or suffix[0] not in "Tt " or suffix[3] != ":":  # noqa: PLR2004
+        return None
+    hour, minute, second = suffix[1:3], suffix[4:6], suffix[7:9]
+    if suffix[6] != ":" or not (hour + minute + second).isdigit():
+        return None
+    if int(hour) > 23 or int(minute) > 59 or int(second) > 59:  # noqa: PLR2004
+        return None
+    if (offset := _offset_seconds(suffix[9:])) is None:
+        return None
+    return int(hour) * 3600 + int(minute) * 60 + int(second) - offset
+
+
+def parse_timestamps(date_times: Iterable[str]) -> list[int]:
+    """
+    Convert ISO 8601 date-times to epoch seconds in one pass.
+
+    The API sends `YYYY-MM-DDTHH:MM:SSZ`, with few distinct days per batch and
+    the same few times of day on every day, so each date-time is split into its
+    day and the rest, and both halves are converted once and cached. Anything
+    else goes through `datetime.fromisoformat`.
+    """
+    days: dict[str, int] = {}
+    times: dict[str, int] = {}
+    get_day, get_time = days.get, times.get
+    timestamps: list[int] = []
+    append = timestamps.append
+    for date_time in date_times:
+        day = get_day(date_time[:10])
+        time_of_day = get_time(date_time[10:])
+        if day is None or time_of_day is None:
+            append(_parse_slow(date_time, days, times))
+        else:
+            append(day + time_of_day)
+    return timestamps
+
+
+def _parse_slow(date_time: str, days: dict[str, int], times: dict[str, int]) -> int:
+    """Convert a date-time with an uncached half, caching it if well-formed."""
+    day = _day_seconds(date_time[:10])
+    time_of_day = _time_seconds(date_time[10:])
+    if day is None or time_of_day is None:
+        return int(datetime.fromisoformat(date_time).timestamp())
+    days[date_time[:10]] = day
+    times[date_time[10:]] = time_of_day
+    return day + time_of_day
@@ -0,0 +1,96 @@
+"""Opt-in timing spans for talquin_electric refreshes."""
+
+from __future__ import annotations
+
+import time
+from contextlib import AbstractContextManager, contextmanager, nullcontext
+from dataclasses import dataclass
+from typing import TYPE_CHECKING, Any
+
+from .const import LOGGER
+
+if TYPE_CHECKING:
+    from collections.abc import Iterator
+
+# Returned by every span while tracing is off, so a disabled span costs one
+# attribute check and no allocation.
+_NULL_SPAN = nullcontext()
+
+
+@dataclass(frozen=True, slots=True)
+class Span:
+    """A timed phase of a refresh."""
+
+    name: str
+    # Seconds since the trace started
+    start: float
+    duration: float
+
+
+class Tracer:
+    """
+    Time the phases of a refresh into a trace.
+
+    Spans are only recorded while `enabled`, and only between `start_trace`
+    and `finish_trace`; concurrent phases (e.g. several accounts) each get
+    their own span.
+    """
+
+    def __init__(self) -> None:
+        """Initialize a disabled tracer."""
+        self.enabled = False
+        # Capture a cProfile of the next refresh when set
+        self.profile_next = False
+        self.last_trace: list[Span] = []
+        self._trace: list[Span] | None = None
+        self._trace_started = 0.0
+
+    def span(self, name: str) -> AbstractContextManager[Any]:
+        """Return a context manager timing the phase `name`."""
+        if not self.enabled or self._trace is None:
+            return _NULL_SPAN
+        return self._span(self._trace, name)
+
+    @contextmanager
+    def _span(self, trace: list[Span], name: str) -> Iterator[None]:
+        """Time a phase into `trace`."""
+        started = time.perf_counter()
+        try:
+            yield
+        finally:
+            trace.append(
+                Span(
+                    name=name,
+                    start=round(started - self._trace_started, 6),
+                    duration=round(time.perf_counter() - started, 6),
+                )
+            )
+
+    def start_trace(self) -> None:
+        """Start collecting the spans of a refresh."""
+        if self.enabled:
+            self._trace = []
+            self._trace_started = time.perf_counter()
+
+    def finish_trace(self) -> None:
+        """Stop collecting spans and log the finished trace."""
+        if self._trace is None:
+            return
+        self.last_trace, self._trace = self._trace, None
+        totals: dict[str, float] = {}
+        for span in self.last_trace:
+            totals[span.name] = totals.get(span.name, 0.0) + span.duration
+        LOGGER.debug(
+            "Refresh trace: %s",
+            ", ".join(f"{name} {total * 1000:.1f}ms" for name, total in totals.items()),
+        )
+
+    def as_dict(self) -> dict[str, Any]:
+        """Return the tracer state and last trace for diagnostics."""
+        return {
+            "enabled": self.enabled,
+            "last_trace": [
+                {"name": span.name, "start": span.start, "duration": span.duration}
+                for span in self.last_trace
+            ],
+        }
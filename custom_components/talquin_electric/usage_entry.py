@@ -1,22 +1,16 @@
 """A container for daily usage data."""
 
+from dataclasses import dataclass
 from datetime import datetime
 
 
+@dataclass(frozen=True, slots=True, repr=False)
 class TalquinElectricUsageEntry:
     """A class to represent a daily usage entry for Talquin Electric."""
 
-    def __init__(self, date: datetime, usage: float) -> None:
-        """Return a representation of a daily usage entry for Talquin Electric."""
-        self.date = date
-        self.usage = usage
+    date: datetime
+    usage: float
 
     def __repr__(self) -> str:
         """Return string representation of usage."""
         return f"{{day: {self.date}, kWh: {self.usage}}}"
-
-    def __eq__(self, value: object) -> bool:
-        """Return True if TalquinElectricUsageEntry with the same date/usage."""
-        if not isinstance(value, TalquinElectricUsageEntry):
-            return False
-        return self.date == value.date and self.usage == value.usage
@@ -0,0 +1,187 @@
+"""A compact, date-sorted usage series for talquin_electric."""
+
+from __future__ import annotations
+
+from array import array
+from bisect import bisect_left
+from collections.abc import Iterable, Iterator, Sequence
+from datetime import UTC, datetime
+from functools import reduce
+from itertools import pairwise
+from typing import overload
+
+from .usage_entry import TalquinElectricUsageEntry
+
+
+class UsageSeries(Sequence[TalquinElectricUsageEntry]):
+    """
+    An immutable usage series backed by typed arrays.
+
+    Dates are stored as epoch seconds and usage as kWh in two contiguous
+    arrays, sorted by date without duplicates. Slices are zero-copy views,
+    and `TalquinElectricUsageEntry` records are only built when iterated.
+    """
+
+    __slots__ = ("_timestamps", "_values")
+
+    def __init__(
+        self,
+        timestamps: Iterable[int] = (),
+        values: Iterable[float] = (),
+    ) -> None:
+        """Initialize from date-sorted epoch seconds and their kWh values."""
+        timestamps = array("q", timestamps)
+        values = array("d", values)
+        if len(timestamps) != len(values):
+            msg = "Usage series needs one value per timestamp"
+            raise ValueError(msg)
+        if any(a >= b for a, b in pairwise(timestamps)):
+            msg = "Usage series timestamps must be strictly increasing"
+            raise ValueError(msg)
+        self._timestamps = memoryview(timestamps).toreadonly()
+        self._values = memoryview(values).toreadonly()
+
+    @classmethod
+    def _from_views(cls, timestamps: memoryview, values: memoryview) -> UsageSeries:
+        """Wrap already-validated views without copying."""
+        series = cls.__new__(cls)
+        series._timestamps = timestamps  # noqa: SLF001
+        series._values = values  # noqa: SLF001
+        return series
+
+    @classmethod
+    def from_unsorted(
+        cls, timestamps: Iterable[int], values: Iterable[float]
+    ) -> UsageSeries:
+        """Build a series from rows in any order; later duplicates win."""
+        rows = dict(zip(timestamps, values, strict=True))
+        ordered = sorted(rows)
+        return cls(ordered, (rows[timestamp] for timestamp in ordered))
+
+    @classmethod
+    def from_entries(cls, entries: Iterable[TalquinElectricUsageEntry]) -> UsageSeries:
+        """Build a series from usage entries in any order."""
+        entries = list(entries)
+        return cls.from_unsorted(
+            (int(entry.date.timestamp()) for entry in entries),
+            (entry.usage for entry in entries),
+        )
+
+    @classmethod
+    def concat(cls, batches: Sequence[UsageSeries]) -> UsageSeries:
+        """Join consecutive batches, merging any that overlap or are out of order."""
+        timestamps = array("q")
+        values = array("d")
+        for batch in batches:
+            if timestamps and batch and batch.timestamps[0] <= timestamps[-1]:
+                return reduce(UsageSeries.merge, batches, cls())
+            timestamps.frombytes(batch.timestamps.tobytes())
+            values.frombytes(batch.values.tobytes())
+        return cls._from_views(
+            memoryview(timestamps).toreadonly(), memoryview(values).toreadonly()
+        )
+
+    @property
+    def timestamps(self) -> memoryview:
+        """Return a read-only view of the epoch-second timestamps."""
+        return self._timestamps
+
+    @property
+    def values(self) -> memoryview:
+        """Return a read-only view of the kWh values."""
+        return self._values
+
+    @property
+    def first_date(self) -> datetime | None:
+        """Return the date of the oldest entry."""
+        return _to_datetime(self._timestamps[0]) if self._timestamps else None
+
+    @property
+    def last_date(self) -> datetime | None:
+        """Return the date of the newest entry."""
+        return _to_datetime(self._timestamps[-1]) if self._timestamps else None
+
+    def __len__(self) -> int:
+        """Return the number of entries."""
+        return len(self._timestamps)
+
+    @overload
+    def __getitem__(self, index: int) -> TalquinElectricUsageEntry: ...
+
+    @overload
+    def __getitem__(self, index: slice) -> UsageSeries: ...
+
+    def __getitem__(
+        self, index: int | slice
+    ) -> TalquinElectricUsageEntry | UsageSeries:
+        """Return an entry, or a zero-copy view for a slice."""
+        if isinstance(index, slice):
+            if index.step not in (None, 1):
+                msg = "Usage series slices cannot have a step"
+                raise ValueError(msg)
+            return UsageSeries._from_views(self._timestamps[index], self._values[index])
+        return TalquinElectricUsageEntry(
+            date=_to_datetime(self._timestamps[index]),
+            usage=self._values[index],
+        )
+
+    def __iter__(self) -> Iterator[TalquinElectricUsageEntry]:
+        """Iterate over entries, building each one on demand."""
+        for timestamp, value in zip(self._timestamps, self._values, strict=True):
+            yield TalquinElectricUsageEntry(date=_to_datetime(timestamp), usage=value)
+
+    def __eq__(self, other: object) -> bool:
+        """Return True if the other series has the same dates and usage."""
+        if not isinstance(other, UsageSeries):
+            return NotImplemented
+        return self._timestamps == other._timestamps and self._values == other._values
+
+    __hash__ = None  # type: ignore[assignment]
+
+    def __repr__(self) -> str:
+        """Return string representation of the series."""
+        return f"UsageSeries({len(self)} entries, {self.first_date} - {self.last_date})"
+
+    def index_of(self, date: datetime) -> int:
+        """Return the index of the first entry at or after `date`."""
+        return bisect_left(self._timestamps, date.timestamp())
+
+    def between(
+        self, start: datetime | None = None, end: datetime | None = None
+    ) -> UsageSeries:
+        """Return a zero-copy view of the entries in [start, end)."""
+        start_index = self.index_of(start) if start is not None else 0
+        end_index = self.index_of(end) if end is not None else len(self)
+        return self[start_index:end_index]
+
+    def merge(self, other: UsageSeries) -> UsageSeries:
+        """
+        Return a new series with `other` merged in.
+
+        Entries in `other` replace entries for the same date, so late
+        corrections win. Only the overlapping tail of this series is re-sorted.
+        If `other` adds or changes nothing, this series itself is returned.
+        """
+        if not other:
+            return self
+        cut = bisect_left(self._timestamps, other.timestamps[0])
+        tail = dict(zip(self._timestamps[cut:], self._values[cut:], strict=True))
+        if all(
+            tail.get(timestamp) == value
+            for timestamp, value in zip(other.timestamps, other.values, strict=True)
+        ):
+            return self
+        tail.update(zip(other.timestamps, other.values, strict=True))
+        ordered = sorted(tail)
+        timestamps = array("q", self._timestamps[:cut].tobytes())
+        timestamps.extend(ordered)
+        values = array("d", self._values[:cut].tobytes())
+        values.extend(tail[timestamp] for timestamp in ordered)
+        return UsageSeries._from_views(
+            memoryview(timestamps).toreadonly(), memoryview(values).toreadonly()
+        )
+
+
+def _to_datetime(timestamp: int) -> datetime:
+    """Convert epoch seconds into an aware UTC datetime."""
+    return datetime.fromtimestamp(timestamp, tz=UTC)
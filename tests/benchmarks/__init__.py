@@ -0,0 +1 @@
+"""Benchmarks for the talquin_electric integration."""
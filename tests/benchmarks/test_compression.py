@@ -0,0 +1,87 @@
+"""Benchmark compressed against uncompressed usage responses."""
+
+import asyncio
+import gzip
+import json
+from datetime import datetime, timedelta
+
+import httpx
+import pytest
+from pytest_benchmark.fixture import BenchmarkFixture
+
+from custom_components.talquin_electric.api import TalquinElectricApiClient
+
+# Simulated link between Home Assistant and the utility's edge.
+LINK_BYTES_PER_SECOND = 10_000_000 / 8
+
+START = datetime.fromisoformat("2021-01-01T00:00:00Z")
+
+
+def _usage_body(rows: int) -> bytes:
+    """Return a usage response body with `rows` hourly rows."""
+    return json.dumps(
+        [
+            {
+                "date_time": (START + timedelta(hours=row)).strftime(
+                    "%Y-%m-%dT%H:%M:%SZ"
+                ),
+                "value": round(0.5 + (row % 24) / 10, 3),
+            }
+            for row in range(rows)
+        ]
+    ).encode()
+
+
+class _SimulatedLinkTransport(httpx.AsyncBaseTransport):
+    """Serve usage responses, charging the simulated link for each wire byte."""
+
+    def __init__(self, body: bytes) -> None:
+        self.body = body
+        self.gzipped_body = gzip.compress(body)
+        self.wire_bytes = 0
+
+    async def handle_async_request(self, request: httpx.Request) -> httpx.Response:
+        if request.url.path.endswith("/oauth2/token"):
+            return httpx.Response(
+                200, json={"access_token": "token", "expires_in": 3600}
+            )
+        if "gzip" in request.headers.get("accept-encoding", ""):
+            content = self.gzipped_body
+            headers = {"Content-Encoding": "gzip"}
+        else:
+            content = self.body
+            headers = {}
+        self.wire_bytes += len(content)
+        await asyncio.sleep(len(content) / LINK_BYTES_PER_SECOND)
+        return httpx.Response(200, content=content, headers=headers)
+
+
+@pytest.mark.parametrize("rows", [30, 365, 8760, 35040])
+@pytest.mark.parametrize("compression", [False, True])
+def test_usage_response_compression(
+    benchmark: BenchmarkFixture, rows: int, *, compression: bool
+) -> None:
+    """Compare bytes on the wire and wall time with and without compression."""
+    transport = _SimulatedLinkTransport(_usage_body(rows))
+
+    async def _fetch() -> int:
+        client = TalquinElectricApiClient(
+            username="username",
+            password="password",
+            compression=compression,
+            transport=transport,
+        )
+        try:
+            usage = await client.async_get_usage_data(
+                account_id="account_id",
+                start_date=START,
+                end_date=START + timedelta(hours=rows),
+            )
+        finally:
+            await client.async_close()
+        return len(usage)
+
+    assert asyncio.run(_fetch()) == rows
+    benchmark.extra_info["wire_bytes"] = transport.wire_bytes
+
+    benchmark.pedantic(lambda: asyncio.run(_fetch()), rounds=3, iterations=1)
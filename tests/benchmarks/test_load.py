@@ -0,0 +1,147 @@
+"""End-to-end load benchmarks of the API client against the local server."""
+
+import asyncio
+import statistics
+import tracemalloc
+from collections.abc import Iterator
+from datetime import datetime, timedelta
+
+import pytest
+import pytest_socket
+from pytest_benchmark.fixture import BenchmarkFixture
+
+from custom_components.talquin_electric.api import TalquinElectricApiClient
+from custom_components.talquin_electric.backfill import async_backfill_accounts
+from custom_components.talquin_electric.const import UsageInterval
+from custom_components.talquin_electric.resilience import RetryPolicy
+from tests.fake_talquin import FakeTalquinOptions, FakeTalquinServer
+
+START = datetime.fromisoformat("2021-01-01T00:00:00Z")
+ROUNDS = 20
+
+# (interval, days per refresh, accounts)
+SCENARIOS = {
+    "daily-1y-1": (UsageInterval.DAILY, 365, 1),
+    "hourly-31d-4": (UsageInterval.HOURLY, 31, 4),
+    "15min-31d-4": (UsageInterval.FIFTEEN_MINUTE, 31, 4),
+}
+
+
+@pytest.fixture
+def event_loop_for_rounds() -> Iterator[asyncio.AbstractEventLoop]:
+    """Return one event loop shared by every round, so connections are reused."""
+    pytest_socket.enable_socket()
+    pytest_socket.socket_allow_hosts(["127.0.0.1"])
+    loop = asyncio.new_event_loop()
+    try:
+        yield loop
+    finally:
+        loop.close()
+        pytest_socket.disable_socket(allow_unix_socket=True)
+
+
+def _run_load(
+    benchmark: BenchmarkFixture,
+    loop: asyncio.AbstractEventLoop,
+    options: FakeTalquinOptions,
+    scenario: str,
+) -> None:
+    """Benchmark the coordinator's fan-out over every account and report it."""
+    interval, days, accounts = SCENARIOS[scenario]
+    account_ids = [str(account) for account in range(accounts)]
+
+    with FakeTalquinServer(
+        FakeTalquinOptions(**{**options.__dict__, "accounts": tuple(account_ids)})
+    ) as server:
+        client = TalquinElectricApiClient(
+            username="username",
+            password="password",
+            base_url=server.base_url,
+            ssl_context=server.ssl_context(),
+            retry_policy=RetryPolicy(attempts=10, base_delay=0.0, jitter=0.0),
+        )
+
+        async def _refresh() -> int:
+            backfills = await async_backfill_accounts(
+                client,
+                dict.fromkeys(account_ids, START),
+                end_date=START + timedelta(days=days),
+                interval=interval,
+            )
+            return sum(len(backfill.usage) for backfill in backfills.values())
+
+        try:
+            # Log in and connect outside the measurements.
+            rows = loop.run_until_complete(_refresh())
+            benchmark.pedantic(
+                lambda: loop.run_until_complete(_refresh()),
+                rounds=ROUNDS,
+                iterations=1,
+            )
+
+            tracemalloc.start()
+            try:
+                before = tracemalloc.take_snapshot()
+                loop.run_until_complete(_refresh())
+                after = tracemalloc.take_snapshot()
+                _, peak = tracemalloc.get_traced_memory()
+            finally:
+                tracemalloc.stop()
+        finally:
+            loop.run_until_complete(client.async_close())
+
+    if benchmark.disabled:
+        # Only the refreshes ran, e.g. under --benchmark-disable.
+        return
+    times = benchmark.stats.stats.data
+    percentiles = statistics.quantiles(times, n=100, method="inclusive")
+    allocated = [
+        stat for stat in after.compare_to(before, "filename") if stat.size_diff > 0
+    ]
+    benchmark.extra_info.update(
+        {
+            "rows_per_refresh": rows,
+            "latency_p50_ms": round(percentiles[49] * 1000, 2),
+            "latency_p95_ms": round(percentiles[94] * 1000, 2),
+            "latency_p99_ms": round(percentiles[98] * 1000, 2),
+            "rows_per_second": round(rows / statistics.median(times)),
+            "refreshes_per_second": round(1 / statistics.median(times), 2),
+            "peak_traced_kib_per_refresh": round(peak / 1024, 1),
+            "retained_kib_per_refresh": round(
+                sum(stat.size_diff for stat in allocated) / 1024, 1
+            ),
+            "retry_count": client.retry_count,
+        }
+    )
+
+
+@pytest.mark.parametrize("scenario", list(SCENARIOS))
+@pytest.mark.parametrize("latency", [0.0, 0.02])
+def test_refresh_load(
+    benchmark: BenchmarkFixture,
+    event_loop_for_rounds: asyncio.AbstractEventLoop,
+    scenario: str,
+    latency: float,
+) -> None:
+    """Benchmark refreshes over HTTP/2 and TLS with added server latency."""
+    _run_load(
+        benchmark,
+        event_loop_for_rounds,
+        FakeTalquinOptions(latency=latency),
+        scenario,
+    )
+
+
+@pytest.mark.parametrize("scenario", ["hourly-31d-4"])
+def test_refresh_load_with_errors(
+    benchmark: BenchmarkFixture,
+    event_loop_for_rounds: asyncio.AbstractEventLoop,
+    scenario: str,
+) -> None:
+    """Benchmark refreshes when one API request in ten fails and is retried."""
+    _run_load(
+        benchmark,
+        event_loop_for_rounds,
+        FakeTalquinOptions(error_rate=0.1, seed=1),
+        scenario,
+    )
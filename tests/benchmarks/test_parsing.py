@@ -0,0 +1,131 @@
+"""Micro-benchmarks of usage response parsing and entry construction."""
+
+import asyncio
+import calendar
+import json
+import time
+import tracemalloc
+from collections.abc import AsyncIterator, Callable
+from datetime import datetime, timedelta
+from typing import Any
+
+import pytest
+from pytest_benchmark.fixture import BenchmarkFixture
+
+from custom_components.talquin_electric.api import _iter_json_array
+from custom_components.talquin_electric.timestamps import parse_timestamps
+from custom_components.talquin_electric.usage_entry import TalquinElectricUsageEntry
+from custom_components.talquin_electric.usage_series import UsageSeries
+
+START = datetime.fromisoformat("2021-01-01T00:00:00Z")
+ROW_COUNTS = [30, 365, 10_000, 100_000]
+# Size of the text chunks a streamed response body is decoded in
+CHUNK_SIZE = 16_384
+
+
+def _usage_body(rows: int) -> str:
+    """Return a usage response body with `rows` hourly rows."""
+    return json.dumps(
+        [
+            {
+                "date_time": (START + timedelta(hours=row)).strftime(
+                    "%Y-%m-%dT%H:%M:%SZ"
+                ),
+                "value": round(0.5 + (row % 24) / 10, 3),
+            }
+            for row in range(rows)
+        ]
+    )
+
+
+def _parse_bulk(rows: list[dict[str, Any]]) -> UsageSeries:
+    """Parse dates with `parse_timestamps`, as the client does."""
+    return UsageSeries.from_unsorted(
+        parse_timestamps([row["date_time"] for row in rows]),
+        [row["value"] for row in rows],
+    )
+
+
+def _parse_fromisoformat(rows: list[dict[str, Any]]) -> UsageSeries:
+    """Parse dates with `datetime.fromisoformat`, one row at a time."""
+    return UsageSeries.from_unsorted(
+        [int(datetime.fromisoformat(row["date_time"]).timestamp()) for row in rows],
+        [row["value"] for row in rows],
+    )
+
+
+def _parse_strptime(rows: list[dict[str, Any]]) -> UsageSeries:
+    """Parse dates with `time.strptime` and `calendar.timegm`."""
+    return UsageSeries.from_unsorted(
+        [
+            calendar.timegm(time.strptime(row["date_time"], "%Y-%m-%dT%H:%M:%SZ"))
+            for row in rows
+        ],
+        [row["value"] for row in rows],
+    )
+
+
+def _parse_entries(rows: list[dict[str, Any]]) -> list[TalquinElectricUsageEntry]:
+    """Build one entry object per row, the representation before UsageSeries."""
+    return [
+        TalquinElectricUsageEntry(
+            datetime.fromisoformat(row["date_time"]), row["value"]
+        )
+        for row in rows
+    ]
+
+
+def _parse_tuples(rows: list[dict[str, Any]]) -> list[tuple[datetime, float]]:
+    """Build one (date, kWh) tuple per row."""
+    return [(datetime.fromisoformat(row["date_time"]), row["value"]) for row in rows]
+
+
+PARSERS: dict[str, Callable[[list[dict[str, Any]]], object]] = {
+    "series-bulk": _parse_bulk,
+    "series-fromisoformat": _parse_fromisoformat,
+    "series-strptime": _parse_strptime,
+    "entries": _parse_entries,
+    "tuples": _parse_tuples,
+}
+
+
+@pytest.mark.parametrize("rows", ROW_COUNTS)
+@pytest.mark.parametrize("parser", list(PARSERS))
+def test_parse_usage(benchmark: BenchmarkFixture, parser: str, rows: int) -> None:
+    """Compare date parsers and in-memory representations of a usage body."""
+    body = _usage_body(rows)
+    parse = PARSERS[parser]
+
+    tracemalloc.start()
+    try:
+        parsed_rows = json.loads(body)
+        before, _ = tracemalloc.get_traced_memory()
+        parsed = parse(parsed_rows)
+        after, _ = tracemalloc.get_traced_memory()
+    finally:
+        tracemalloc.stop()
+    assert len(parsed) == rows  # type: ignore[arg-type]
+    benchmark.extra_info["bytes_per_entry"] = round((after - before) / rows, 1)
+
+    benchmark(lambda: parse(json.loads(body)))
+
+
+@pytest.mark.parametrize("rows", ROW_COUNTS)
+def test_parse_usage_streamed(benchmark: BenchmarkFixture, rows: int) -> None:
+    """Benchmark the client's incremental parser over a chunked body."""
+    body = _usage_body(rows)
+    chunks = [body[i : i + CHUNK_SIZE] for i in range(0, len(body), CHUNK_SIZE)]
+
+    async def _aiter_chunks() -> AsyncIterator[str]:
+        for chunk in chunks:
+            yield chunk
+
+    async def _parse() -> UsageSeries:
+        return _parse_bulk([row async for row in _iter_json_array(_aiter_chunks())])
+
+    loop = asyncio.new_event_loop()
+    try:
+        assert len(loop.run_until_complete(_parse())) == rows
+        benchmark(lambda: loop.run_until_complete(_parse()))
+    finally:
+        loop.close()
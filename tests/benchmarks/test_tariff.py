@@ -0,0 +1,51 @@
+"""Benchmarks of the cost engine over long usage histories."""
+
+from datetime import UTC, datetime
+
+from pytest_benchmark.fixture import BenchmarkFixture
+
+from custom_components.talquin_electric.rollups import UsageRollup
+from custom_components.talquin_electric.tariff import (
+    Tariff,
+    TariffSeason,
+    TariffTier,
+    UsageCost,
+)
+from custom_components.talquin_electric.usage_series import UsageSeries
+
+START = datetime(2015, 1, 1, tzinfo=UTC)
+HOURS = 10 * 365 * 24
+
+TARIFF = Tariff(
+    tiers=(TariffTier(0.10, 1000.0), TariffTier(0.15)),
+    customer_charge=30.0,
+    seasons=(
+        TariffSeason(
+            frozenset(range(5, 11)), (TariffTier(0.12, 1000.0), TariffTier(0.2))
+        ),
+    ),
+)
+
+
+def _hourly_usage() -> UsageSeries:
+    """Return ten years of hourly readings."""
+    start = int(START.timestamp())
+    return UsageSeries(
+        range(start, start + HOURS * 3600, 3600),
+        (0.5 + (hour % 24) / 10 for hour in range(HOURS)),
+    )
+
+
+def test_costs_ten_years_hourly(benchmark: BenchmarkFixture) -> None:
+    """Benchmark pricing every day and cycle of ten years of hourly usage."""
+    rollup = UsageRollup(_hourly_usage())
+
+    def _price() -> UsageCost:
+        cost = UsageCost(rollup, TARIFF)
+        cost.daily()
+        cost.projected_cycle_cost()
+        return cost
+
+    cost = benchmark(_price)
+    assert len(cost.daily()) == 10 * 365
+    assert len(cost.billing_cycles()) == 10 * 12
@@ -0,0 +1,55 @@
+"""Shared pytest configuration, fixtures and helpers."""
+
+from collections.abc import Callable, Iterator
+from datetime import datetime, timedelta
+from pathlib import Path
+from unittest.mock import AsyncMock, patch
+
+import pytest
+
+from custom_components.talquin_electric.usage_series import UsageSeries
+
+BENCHMARKS = Path(__file__).parent / "benchmarks"
+
+
+def pytest_addoption(parser: pytest.Parser) -> None:
+    """Add the option that opts in to the benchmarks."""
+    parser.addoption(
+        "--benchmarks",
+        action="store_true",
+        help="run the benchmarks under tests/benchmarks (see scripts/benchmark)",
+    )
+
+
+def pytest_collection_modifyitems(
+    config: pytest.Config, items: list[pytest.Item]
+) -> None:
+    """Skip the benchmarks unless they were asked for."""
+    if config.getoption("--benchmarks"):
+        return
+    skip = pytest.mark.skip(reason="benchmarks only run with --benchmarks")
+    for item in items:
+        if item.path.is_relative_to(BENCHMARKS):
+            item.add_marker(skip)
+
+
+def daily_usage(
+    start: datetime,
+    days: int,
+    value: float | Callable[[datetime], float] = 1.0,
+) -> UsageSeries:
+    """Return one reading a day from `start`, `value` or `value(date)` kWh."""
+    dates = [start + timedelta(days=day) for day in range(days)]
+    values = value if callable(value) else lambda _: value
+    return UsageSeries(
+        (int(date.timestamp()) for date in dates), (values(date) for date in dates)
+    )
+
+
+@pytest.fixture
+def mock_import_statistics() -> Iterator[AsyncMock]:
+    """Don't import statistics into the recorder."""
+    with patch(
+        "custom_components.talquin_electric.coordinator.async_import_usage_statistics"
+    ) as mock_import:
+        yield mock_import
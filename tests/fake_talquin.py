@@ -0,0 +1,266 @@
+"""Local stand-in for the Talquin Electric API, for tests and benchmarks."""
+
+from __future__ import annotations
+
+import asyncio
+import json
+import multiprocessing
+import random
+import socket
+import ssl
+import tempfile
+import time
+from dataclasses import dataclass
+from datetime import datetime, timedelta
+from pathlib import Path
+from typing import TYPE_CHECKING, Any, Self
+from urllib.parse import parse_qs
+
+import trustme
+from hypercorn.asyncio import serve
+from hypercorn.config import Config
+
+if TYPE_CHECKING:
+    from collections.abc import Awaitable, Callable
+    from types import TracebackType
+
+ACCESS_TOKEN = "fake-access-token"
+
+# Rows per response chunk, so large responses are streamed like the real API
+CHUNK_ROWS = 1000
+
+INTERVAL_STEPS = {
+    "DAILY": timedelta(days=1),
+    "HOURLY": timedelta(hours=1),
+    "FIFTEEN_MINUTE": timedelta(minutes=15),
+}
+
+type _Receive = Callable[[], Awaitable[dict[str, Any]]]
+type _Send = Callable[[dict[str, Any]], Awaitable[None]]
+
+
+@dataclass(frozen=True)
+class FakeTalquinOptions:
+    """How the stand-in server behaves."""
+
+    # Seconds added before every response
+    latency: float = 0.0
+    # Extra bytes in every usage row, to grow the payload
+    row_padding: int = 0
+    # Share of API requests answered with `error_status`
+    error_rate: float = 0.0
+    error_status: int = 503
+    retry_after: str | None = None
+    # Share of API requests answered with a Cloudflare challenge
+    challenge_rate: float = 0.0
+    accounts: tuple[str, ...] = ("1234",)
+    seed: int = 0
+
+
+class FakeTalquinApp:
+    """ASGI app implementing the token, accounts and usage endpoints."""
+
+    def __init__(self, options: FakeTalquinOptions) -> None:
+        """Initialize the app."""
+        self.options = options
+        self._random = random.Random(options.seed)  # noqa: S311
+
+    async def __call__(
+        self, scope: dict[str, Any], receive: _Receive, send: _Send
+    ) -> None:
+        """Handle an ASGI request."""
+        if scope["type"] == "lifespan":
+            while (message := await receive())["type"] != "lifespan.shutdown":
+                await send({"type": f"{message['type']}.complete"})
+            await send({"type": "lifespan.shutdown.complete"})
+            return
+        while (await receive()).get("more_body"):
+            pass
+        if self.options.latency:
+            await asyncio.sleep(self.options.latency)
+
+        headers = dict(scope["headers"])
+        roll = self._random.random()
+        if roll < self.options.challenge_rate:
+            await _respond(
+                send,
+                403,
+                b"<html>Just a moment...</html>",
+                content_type=b"text/html",
+                headers=[(b"cf-mitigated", b"challenge")],
+            )
+        elif roll < self.options.challenge_rate + self.options.error_rate:
+            await _respond(
+                send,
+                self.options.error_status,
+                b'{"error": "injected"}',
+                headers=(
+                    [(b"retry-after", self.options.retry_after.encode())]
+                    if self.options.retry_after is not None
+                    else []
+                ),
+            )
+        elif scope["path"] == "/v1/oauth2/token" and scope["method"] == "POST":
+            await _respond(
+                send,
+                200,
+                json.dumps({"access_token": ACCESS_TOKEN, "expires_in": 3600}).encode(),
+            )
+        elif headers.get(b"authorization") != f"Bearer {ACCESS_TOKEN}".encode():
+            await _respond(send, 401, b'{"error": "unauthorized"}')
+        elif scope["path"] == "/v1/accounts":
+            await _respond(
+                send,
+                200,
+                json.dumps(
+                    [{"id": account} for account in self.options.accounts]
+                ).encode(),
+            )
+        elif (
+            scope["path"].startswith("/v1/accounts/")
+            and scope["path"].endswith("/usage")
+            and scope["path"].split("/")[3] in self.options.accounts
+        ):
+            await self._send_usage(send, parse_qs(scope["query_string"].decode()))
+        else:
+            await _respond(send, 404, b'{"error": "not found"}')
+
+    async def _send_usage(self, send: _Send, query: dict[str, list[str]]) -> None:
+        """Stream one usage row per interval step in [start_date, end_date)."""
+        date = datetime.fromisoformat(query["start_date"][0])
+        end = datetime.fromisoformat(query["end_date"][0])
+        step = INTERVAL_STEPS[query.get("interval", ["DAILY"])[0]]
+        padding = "x" * self.options.row_padding
+        await send(
+            {
+                "type": "http.response.start",
+                "status": 200,
+                "headers": [(b"content-type", b"application/json")],
+            }
+        )
+        separator = "["
+        rows = []
+        while date < end:
+            row: dict[str, Any] = {
+                "date_time": date.strftime("%Y-%m-%dT%H:%M:%SZ"),
+                "value": round(0.5 + date.hour / 10, 3),
+            }
+            if padding:
+                row["padding"] = padding
+            rows.append(separator + json.dumps(row))
+            separator = ","
+            date += step
+            if len(rows) == CHUNK_ROWS:
+                await send(
+                    {
+                        "type": "http.response.body",
+                        "body": "".join(rows).encode(),
+                        "more_body": True,
+                    }
+                )
+                rows = []
+        rows.append("[]" if separator == "[" else "]")
+        await send({"type": "http.response.body", "body": "".join(rows).encode()})
+
+
+async def _respond(
+    send: _Send,
+    status: int,
+    body: bytes,
+    *,
+    content_type: bytes = b"application/json",
+    headers: list[tuple[bytes, bytes]] | None = None,
+) -> None:
+    """Send a complete response."""
+    await send(
+        {
+            "type": "http.response.start",
+            "status": status,
+            "headers": [(b"content-type", content_type), *(headers or [])],
+        }
+    )
+    await send({"type": "http.response.body", "body": body})
+
+
+def _serve(options: FakeTalquinOptions, port: int, certfile: str) -> None:
+    """Run the app over HTTP/2 and TLS until the process is terminated."""
+    config = Config()
+    config.bind = [f"127.0.0.1:{port}"]
+    config.certfile = certfile
+    config.keyfile = certfile
+    config.alpn_protocols = ["h2", "http/1.1"]
+    config.accesslog = None
+    config.errorlog = None
+    asyncio.run(serve(FakeTalquinApp(options), config))  # type: ignore[arg-type]
+
+
+class FakeTalquinServer:
+    """
+    Run the stand-in API over HTTP/2 and TLS in a separate process.
+
+    Serving from another process keeps the server's CPU time and allocations
+    out of measurements of the client.
+    """
+
+    def __init__(self, options: FakeTalquinOptions | None = None) -> None:
+        """Initialize the server with a fresh certificate authority."""
+        self.options = options or FakeTalquinOptions()
+        self._ca = trustme.CA()
+        self._process: multiprocessing.process.BaseProcess | None = None
+        self._tempdir: tempfile.TemporaryDirectory[str] | None = None
+        self.port = 0
+
+    @property
+    def base_url(self) -> str:
+        """Return the base URL to point the client at."""
+        return f"https://127.0.0.1:{self.port}/v1/"
+
+    def ssl_context(self) -> ssl.SSLContext:
+        """Return a client SSL context trusting the server's certificate."""
+        context = ssl.create_default_context()
+        context.maximum_version = ssl.TLSVersion.TLSv1_2
+        self._ca.configure_trust(context)
+        return context
+
+    def __enter__(self) -> Self:
+        """Start the server and wait until it accepts connections."""
+        self._tempdir = tempfile.TemporaryDirectory()
+        certfile = Path(self._tempdir.name) / "server.pem"
+        pem = self._ca.issue_cert(
+            "127.0.0.1", "localhost"
+        ).private_key_and_cert_chain_pem
+        pem.write_to_path(str(certfile))
+        with socket.socket() as probe:
+            probe.bind(("127.0.0.1", 0))
+            self.port = probe.getsockname()[1]
+        self._process = multiprocessing.get_context("spawn").Process(
+            target=_serve, args=(self.options, self.port, str(certfile)), daemon=True
+        )
+        self._process.start()
+        deadline = time.monotonic() + 30
+        while True:
+            try:
+                socket.create_connection(("127.0.0.1", self.port), timeout=1).close()
+            except OSError:
+                if time.monotonic() > deadline or not self._process.is_alive():
+                    self.__exit__(None, None, None)
+                    msg = "Fake Talquin server did not start"
+                    raise RuntimeError(msg) from None
+                time.sleep(0.05)
+            else:
+                return self
+
+    def __exit__(
+        self,
+        exc_type: type[BaseException] | None,
+        exc: BaseException | None,
+        traceback: TracebackType | None,
+    ) -> None:
+        """Stop the server."""
+        if self._process is not None:
+            self._process.terminate()
+            self._process.join()
+            self._process = None
+        if self._tempdir is not None:
+            self._tempdir.cleanup()
+            self._tempdir = None
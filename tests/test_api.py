@@ -1,6 +1,13 @@
 """Tests for the API connectivity."""
 
+import asyncio
+import gzip
+import json
 import socket
+import ssl
+import sys
+import time
+from collections.abc import AsyncIterator
 from datetime import datetime
 from tkinter import W
 from unittest.mock import AsyncMock, Mock, patch
@@ -12,12 +19,26 @@ from pytest_mock import MockerFixture
 from custom_components.talquin_electric.api import (
     TalquinElectricApiClient,
     TalquinElectricApiClientAuthenticationError,
+    TalquinElectricApiClientChallengeError,
+    TalquinElectricApiClientCircuitOpenError,
     TalquinElectricApiClientCommunicationError,
     TalquinElectricApiClientError,
+    TalquinElectricApiClientNotModifiedError,
     _handle_exception,
+    _import_http_modules,
+    _iter_json_array,
     _verify_response_or_raise,
+    async_get_ssl_context,
+    async_import_http_modules,
+    invalidate_ssl_context,
+)
+from custom_components.talquin_electric.resilience import (
+    CircuitBreaker,
+    CircuitState,
+    RetryPolicy,
 )
 from custom_components.talquin_electric.usage_entry import TalquinElectricUsageEntry
+from custom_components.talquin_electric.usage_series import UsageSeries
 
 
 @pytest.mark.asyncio
@@ -25,7 +46,10 @@ async def test_get_access_token() -> None:
     """Test getting an access token."""
     client = TalquinElectricApiClient(username="username", password="password")
     client._api_wrapper = AsyncMock()
-    client._api_wrapper.return_value = "access token"
+    client._api_wrapper.return_value = {
+        "access_token": "access token",
+        "expires_in": 3600,
+    }
 
     token = await client.async_get_access_token()
 
@@ -47,14 +71,124 @@ async def test_get_access_token() -> None:
 
 
 @pytest.mark.asyncio
-async def test_get_usage_data(mocker: MockerFixture) -> None:
-    """Test getting usage data."""
+@pytest.mark.parametrize(
+    "response", [{"token_type": "bearer"}, {"access_token": None}, ["token"]]
+)
+async def test_get_access_token_invalid_response(response: object) -> None:
+    """Test that a token response without an access token is an API error."""
+    client = TalquinElectricApiClient(username="username", password="password")
+    client._api_wrapper = AsyncMock(return_value=response)
+
+    with pytest.raises(TalquinElectricApiClientError, match="no access token"):
+        await client.async_get_access_token()
+    assert client._access_token is None
+
+
+@pytest.mark.asyncio
+async def test_get_access_token_cached() -> None:
+    """Test that the access token is reused until shortly before it expires."""
     client = TalquinElectricApiClient(username="username", password="password")
     client._api_wrapper = AsyncMock()
-    client._api_wrapper.return_value = [
-        {"date_time": "2021-01-20T17:00:00Z", "value": 1.0},
-        {"date_time": "2021-01-21T18:00:00Z", "value": 2.0},
+    client._api_wrapper.side_effect = [
+        {"access_token": "first token", "expires_in": 3600},
+        {"access_token": "second token", "expires_in": 3600},
     ]
+
+    assert await client.async_get_access_token() == "first token"
+    assert await client.async_get_access_token() == "first token"
+    client._api_wrapper.assert_called_once()
+
+    with patch(
+        "custom_components.talquin_electric.api.time.monotonic",
+        return_value=time.monotonic() + 3600,
+    ):
+        assert await client.async_get_access_token() == "second token"
+
+
+@pytest.mark.asyncio
+async def test_get_access_token_single_flight() -> None:
+    """Test that concurrent callers share one login request."""
+    client = TalquinElectricApiClient(username="username", password="password")
+    client._api_wrapper = AsyncMock()
+    client._api_wrapper.return_value = {"access_token": "token", "expires_in": 3600}
+
+    tokens = await asyncio.gather(*(client.async_get_access_token() for _ in range(5)))
+
+    assert set(tokens) == {"token"}
+    client._api_wrapper.assert_called_once()
+
+
+def _usage_response(*chunks: str) -> Mock:
+    """Return a streamed response whose body arrives in `chunks`."""
+
+    async def _aiter_text() -> AsyncIterator[str]:
+        for chunk in chunks:
+            yield chunk
+
+    response = Mock(name="MockResponse", num_bytes_downloaded=0)
+    response.aiter_text = _aiter_text
+    response.aclose = AsyncMock()
+    return response
+
+
+@pytest.mark.asyncio
+async def test_get_usage_data_refreshes_rejected_token() -> None:
+    """Test that a 401 on the usage call refreshes the token and retries once."""
+    client = TalquinElectricApiClient(username="username", password="password")
+    client._api_wrapper = AsyncMock()
+    client._api_wrapper.side_effect = [
+        {"access_token": "stale token", "expires_in": 3600},
+        {"access_token": "fresh token", "expires_in": 3600},
+    ]
+    client._api_send = AsyncMock()
+    client._api_send.side_effect = [
+        TalquinElectricApiClientAuthenticationError("Invalid credentials"),
+        _usage_response('[{"date_time": "2021-01-20T17:00:00Z", "value": 1.0}]'),
+    ]
+
+    usage_data = await client.async_get_usage_data(
+        account_id="account_id",
+        start_date=datetime.fromisoformat("2021-01-01T00:00:00Z"),
+        end_date=datetime.fromisoformat("2021-01-30T00:00:00Z"),
+    )
+
+    assert list(usage_data) == [
+        TalquinElectricUsageEntry(datetime.fromisoformat("2021-01-20T17:00:00Z"), 1.0),
+    ]
+    retried = client._api_send.call_args_list[-1].kwargs
+    assert retried["headers"]["Authorization"] == "Bearer fresh token"
+
+
+@pytest.mark.asyncio
+async def test_get_usage_data_does_not_retry_challenge() -> None:
+    """Test that a Cloudflare challenge is not retried with a new token."""
+    client = TalquinElectricApiClient(username="username", password="password")
+    client._api_wrapper = AsyncMock()
+    client._api_wrapper.return_value = {"access_token": "token", "expires_in": 3600}
+    client._api_send = AsyncMock()
+    client._api_send.side_effect = TalquinElectricApiClientChallengeError(
+        "Cloudflare challenge received"
+    )
+
+    with pytest.raises(TalquinElectricApiClientChallengeError):
+        await client.async_get_usage_data(
+            account_id="account_id",
+            start_date=datetime.fromisoformat("2021-01-01T00:00:00Z"),
+            end_date=datetime.fromisoformat("2021-01-30T00:00:00Z"),
+        )
+    assert client._access_token == "token"
+    client._api_send.assert_called_once()
+
+
+@pytest.mark.asyncio
+async def test_get_usage_data(mocker: MockerFixture) -> None:
+    """Test getting usage data."""
+    client = TalquinElectricApiClient(username="username", password="password")
+    response = _usage_response(
+        '[{"date_time": "2021-01-20T17:00:00Z", "value": 1.0},',
+        ' {"date_time": "2021-01-21T18:00:00Z", "value": 2.0}]',
+    )
+    client._api_send = AsyncMock(return_value=response)
     mocker.patch(
         "custom_components.talquin_electric.api.TalquinElectricApiClient.async_get_access_token",
         return_value="access_token",
@@ -66,7 +200,7 @@ async def test_get_usage_data(mocker: MockerFixture) -> None:
         end_date=datetime.fromisoformat("2021-01-30T00:00:00Z"),
     )
 
-    client._api_wrapper.assert_called_once_with(
+    client._api_send.assert_called_once_with(
         method="get",
         url="https://api.talquinelectric.com/v1/accounts/account_id/usage",
         headers={
@@ -79,14 +213,79 @@ async def test_get_usage_data(mocker: MockerFixture) -> None:
             "end_date": "2021-01-30T00:00:00Z",
             "interval": "DAILY",
         },
+        stream=True,
+        conditional=False,
     )
+    response.aclose.assert_awaited_once()
 
-    assert usage_data == [
+    assert list(usage_data) == [
         TalquinElectricUsageEntry(datetime.fromisoformat("2021-01-20T17:00:00Z"), 1.0),
         TalquinElectricUsageEntry(datetime.fromisoformat("2021-01-21T18:00:00Z"), 2.0),
     ]
 
 
+@pytest.mark.asyncio
+async def test_iter_usage_yields_batches(mocker: MockerFixture) -> None:
+    """Test that usage is streamed in batches of the requested size."""
+    client = TalquinElectricApiClient(username="username", password="password")
+    body = json.dumps(
+        [
+            {"date_time": f"2021-01-{day:02d}T05:00:00Z", "value": float(day)}
+            for day in range(1, 6)
+        ]
+    )
+    client._api_send = AsyncMock(
+        return_value=_usage_response(*(body[i : i + 7] for i in range(0, len(body), 7)))
+    )
+    mocker.patch(
+        "custom_components.talquin_electric.api.TalquinElectricApiClient.async_get_access_token",
+        return_value="access_token",
+    )
+
+    batches = [
+        batch
+        async for batch in client.async_iter_usage(
+            account_id="account_id",
+            start_date=datetime.fromisoformat("2021-01-01T00:00:00Z"),
+            end_date=datetime.fromisoformat("2021-01-30T00:00:00Z"),
+            batch_size=2,
+        )
+    ]
+
+    assert [[entry.usage for entry in batch] for batch in batches] == [
+        [1.0, 2.0],
+        [3.0, 4.0],
+        [5.0],
+    ]
+
+
+@pytest.mark.asyncio
+async def test__iter_json_array() -> None:
+    """Test decoding a JSON array split at arbitrary points."""
+    body = '[ {"a": [1, 2]}, {"b": "],"} ,3, 45 ]'
+
+    for size in range(1, len(body) + 1):
+        chunks = _usage_response(
+            *(body[i : i + size] for i in range(0, len(body), size))
+        ).aiter_text()
+        assert [item async for item in _iter_json_array(chunks)] == [
+            {"a": [1, 2]},
+            {"b": "],"},
+            3,
+            45,
+        ]
+
+    with pytest.raises(ValueError, match="Truncated JSON array"):
+        [
+            item
+            async for item in _iter_json_array(
+                _usage_response('[{"a": 1}').aiter_text()
+            )
+        ]
+    with pytest.raises(ValueError, match="Expected a JSON array"):
+        [item async for item in _iter_json_array(_usage_response("{}").aiter_text())]
+
+
 def test__handle_exception() -> None:
     """Test converting exceptions from httpx to API exceptions."""
     timeouterror = TimeoutError("error message")
@@ -132,6 +331,13 @@ def test__verify_response_or_raise() -> None:
         _verify_response_or_raise(response)
     assert str(autherror.value) == "Invalid credentials"
 
+    response = Mock()
+    response.status_code = 403
+    response.headers = {"cf-mitigated": "challenge"}
+    with pytest.raises(TalquinElectricApiClientChallengeError) as challengeerror:
+        _verify_response_or_raise(response)
+    assert str(challengeerror.value) == "Cloudflare challenge received"
+
     response = Mock()
     response.status_code = 200
     _verify_response_or_raise(response)
@@ -147,8 +353,8 @@ def test__verify_response_or_raise() -> None:
 async def test__api_wrapper_success(mock_send: AsyncMock, mock_verify: Mock) -> None:
     """Test the API wrapper."""
     client = TalquinElectricApiClient(username="username", password="password")
-    mock_response = Mock(name="MockResponse")
-    mock_response.json = AsyncMock()
+    mock_response = Mock(name="MockResponse", num_bytes_downloaded=0)
+    mock_response.json = Mock()
     mock_response.json.return_value = "ok"
 
     mock_send.return_value = mock_response
@@ -194,7 +400,8 @@ async def test__api_wrapper_failure(
     """Test the API wrapper."""
     error = TalquinElectricApiClientError("error message")
     client = TalquinElectricApiClient(username="username", password="password")
-    mock_response = Mock(name="MockResponse")
+    mock_response = Mock(name="MockResponse", num_bytes_downloaded=0)
+    mock_response.aclose = AsyncMock()
     mock_send.return_value = mock_response
     mock_verify.side_effect = error
 
@@ -206,3 +413,705 @@ async def test__api_wrapper_failure(
         params={"params": "params"},
     )
     mock_handler.assert_called_once_with(error)
+    mock_response.aclose.assert_awaited_once()
+
+
+@pytest.mark.asyncio
+@patch("httpx.AsyncClient.send", new_callable=AsyncMock)
+async def test__api_wrapper_reuses_client(mock_send: AsyncMock) -> None:
+    """Test that consecutive requests share one pooled client until closed."""
+    client = TalquinElectricApiClient(username="username", password="password")
+    mock_response = Mock(name="MockResponse", status_code=200, num_bytes_downloaded=0)
+    mock_response.json = Mock(return_value="ok")
+    mock_send.return_value = mock_response
+
+    await client._api_wrapper(method="post", url="https://example.com/token")
+    http_client = client._client
+    await client._api_wrapper(method="get", url="https://example.com/usage")
+
+    assert http_client is not None
+    assert client._client is http_client
+
+    await client.async_close()
+    assert client._client is None
+    assert http_client.is_closed
+
+
+@pytest.mark.asyncio
+async def test_ssl_context_is_shared_and_invalidated() -> None:
+    """Test that the SSL context is built once and rebuilt after invalidation."""
+    invalidate_ssl_context()
+    context = await async_get_ssl_context()
+
+    assert context.maximum_version == ssl.TLSVersion.TLSv1_2
+    assert await async_get_ssl_context() is context
+
+    invalidate_ssl_context()
+    assert await async_get_ssl_context() is not context
+
+
+@pytest.mark.asyncio
+async def test_http_modules_are_imported_in_executor() -> None:
+    """Test that httpx and h2 are imported off the event loop, only once."""
+    loop = asyncio.get_running_loop()
+    with patch.object(
+        loop, "run_in_executor", wraps=loop.run_in_executor
+    ) as mock_executor:
+        await async_import_http_modules()
+        mock_executor.assert_not_called()
+
+        with patch.dict(sys.modules):
+            del sys.modules["h2.connection"]
+            await async_import_http_modules()
+            assert "h2.connection" in sys.modules
+        mock_executor.assert_called_once_with(None, _import_http_modules)
+
+
+@pytest.mark.asyncio
+async def test_client_reconnects_after_ssl_context_invalidated() -> None:
+    """Test that a pooled client picks up a new SSL context."""
+    client = TalquinElectricApiClient(username="username", password="password")
+    http_client = await client._async_get_client()
+    assert await client._async_get_client() is http_client
+
+    invalidate_ssl_context()
+    new_http_client = await client._async_get_client()
+
+    assert new_http_client is not http_client
+    assert http_client.is_closed
+    await client.async_close()
+
+
+@pytest.mark.asyncio
+async def test__api_wrapper_compression() -> None:
+    """Test that compressed responses are requested and decoded when enabled."""
+    requests: list[httpx.Request] = []
+
+    def _handler(request: httpx.Request) -> httpx.Response:
+        requests.append(request)
+        return httpx.Response(
+            200,
+            content=gzip.compress(b'{"ok": true}'),
+            headers={"Content-Encoding": "gzip"},
+        )
+
+    client = TalquinElectricApiClient(
+        username="username",
+        password="password",
+        compression=True,
+        transport=httpx.MockTransport(_handler),
+    )
+
+    assert await client._api_wrapper(method="get", url="https://example.com") == {
+        "ok": True
+    }
+    assert "gzip" in requests[0].headers["accept-encoding"]
+    assert client.compression
+    await client.async_close()
+
+
+@pytest.mark.asyncio
+@pytest.mark.parametrize(
+    "rejection",
+    [
+        httpx.Response(406),
+        httpx.Response(415),
+    ],
+)
+async def test__api_wrapper_compression_fallback(rejection: httpx.Response) -> None:
+    """Test that a rejected compressed request falls back to uncompressed."""
+    requests: list[httpx.Request] = []
+
+    def _handler(request: httpx.Request) -> httpx.Response:
+        requests.append(request)
+        if "accept-encoding" in request.headers:
+            return rejection
+        return httpx.Response(200, json={"ok": True})
+
+    client = TalquinElectricApiClient(
+        username="username",
+        password="password",
+        compression=True,
+        transport=httpx.MockTransport(_handler),
+    )
+
+    assert await client._api_wrapper(method="get", url="https://example.com") == {
+        "ok": True
+    }
+    assert await client._api_wrapper(method="get", url="https://example.com") == {
+        "ok": True
+    }
+    assert ["accept-encoding" in request.headers for request in requests] == [
+        True,
+        False,
+        False,
+    ]
+    assert not client.compression
+    await client.async_close()
+
+
+class _ChunkedStream(httpx.AsyncByteStream):
+    """A response body that is only read, and decoded, while iterated."""
+
+    def __init__(self, *chunks: bytes) -> None:
+        self._chunks = chunks
+
+    async def __aiter__(self) -> AsyncIterator[bytes]:
+        for chunk in self._chunks:
+            yield chunk
+
+
+@pytest.mark.asyncio
+async def test_iter_usage_streamed_compression_fallback(
+    mocker: MockerFixture,
+) -> None:
+    """Test that a streamed body failing to decompress is fetched uncompressed."""
+    requests: list[httpx.Request] = []
+
+    def _handler(request: httpx.Request) -> httpx.Response:
+        requests.append(request)
+        if "accept-encoding" in request.headers:
+            return httpx.Response(
+                200,
+                headers={"Content-Encoding": "gzip"},
+                stream=_ChunkedStream(b"not gzip"),
+            )
+        return httpx.Response(
+            200,
+            stream=_ChunkedStream(
+                b'[{"date_time": "2021-01-20T17:00:00Z", "value": 1.0}]'
+            ),
+        )
+
+    client = TalquinElectricApiClient(
+        username="username",
+        password="password",
+        compression=True,
+        transport=httpx.MockTransport(_handler),
+    )
+    mocker.patch.object(client, "async_get_access_token", return_value="token")
+
+    for _ in range(2):
+        usage = await client.async_get_usage_data(
+            "account_id",
+            datetime.fromisoformat("2021-01-01T00:00:00Z"),
+            datetime.fromisoformat("2021-01-30T00:00:00Z"),
+        )
+        assert [entry.usage for entry in usage] == [1.0]
+        client._usage_cache.clear()
+    assert ["accept-encoding" in request.headers for request in requests] == [
+        True,
+        False,
+        False,
+    ]
+    assert not client.compression
+    await client.async_close()
+
+
+@pytest.mark.asyncio
+async def test__api_wrapper_compression_challenge() -> None:
+    """Test that a challenge propagates instead of disabling compression."""
+    requests: list[httpx.Request] = []
+
+    def _handler(request: httpx.Request) -> httpx.Response:
+        requests.append(request)
+        return httpx.Response(403, headers={"cf-mitigated": "challenge"})
+
+    client = TalquinElectricApiClient(
+        username="username",
+        password="password",
+        compression=True,
+        transport=httpx.MockTransport(_handler),
+    )
+
+    with pytest.raises(TalquinElectricApiClientChallengeError):
+        await client._api_wrapper(method="get", url="https://example.com")
+    assert len(requests) == 1
+    assert client.compression
+    await client.async_close()
+
+
+@pytest.mark.asyncio
+async def test_get_accounts(mocker: MockerFixture) -> None:
+    """Test discovering the accounts of a login."""
+    client = TalquinElectricApiClient(username="username", password="password")
+    response = Mock(name="MockResponse")
+    response.json.return_value = [{"id": 1234}, {"id": "5678"}]
+    client._api_send = AsyncMock(return_value=response)
+    mocker.patch(
+        "custom_components.talquin_electric.api.TalquinElectricApiClient.async_get_access_token",
+        return_value="access_token",
+    )
+
+    assert await client.async_get_accounts() == ["1234", "5678"]
+    client._api_send.assert_called_once_with(
+        method="get",
+        url="https://api.talquinelectric.com/v1/accounts",
+        headers={
+            "User-Agent": "Home Assistant - Talquin Electric Integration",
+            "Accept": "application/json",
+            "Authorization": "Bearer access_token",
+        },
+    )
+
+
+@pytest.mark.asyncio
+async def test_get_usage_data_conditional_request(mocker: MockerFixture) -> None:
+    """Test that an unchanged usage response is revalidated with a 304."""
+    requests: list[httpx.Request] = []
+
+    def _handler(request: httpx.Request) -> httpx.Response:
+        requests.append(request)
+        if request.headers.get("If-None-Match") == '"v1"':
+            return httpx.Response(304)
+        return httpx.Response(
+            200,
+            json=[{"date_time": "2021-01-20T17:00:00Z", "value": 1.0}],
+            headers={"ETag": '"v1"'},
+        )
+
+    client = TalquinElectricApiClient(
+        username="username",
+        password="password",
+        transport=httpx.MockTransport(_handler),
+    )
+    mocker.patch(
+        "custom_components.talquin_electric.api.TalquinElectricApiClient.async_get_access_token",
+        return_value="access_token",
+    )
+
+    async def _fetch(end_day: int, *, conditional: bool) -> list[float] | None:
+        usage = await client.async_get_usage_data(
+            account_id="account_id",
+            start_date=datetime.fromisoformat("2021-01-01T00:00:00Z"),
+            end_date=datetime.fromisoformat(f"2021-01-{end_day}T00:00:00Z"),
+            conditional=conditional,
+        )
+        return None if usage is None else [entry.usage for entry in usage]
+
+    assert await _fetch(30, conditional=False) == [1.0]
+    assert await _fetch(30, conditional=True) == [1.0]
+    assert await _fetch(30, conditional=True) is None
+    assert await _fetch(30, conditional=False) == [1.0]
+    assert await _fetch(31, conditional=True) == [1.0]
+    assert [request.headers.get("If-None-Match") for request in requests] == [
+        None,
+        None,
+        '"v1"',
+        None,
+        None,
+    ]
+    assert (
+        "end_date=2021-01-31" in client._validators["/v1/accounts/account_id/usage"][0]
+    )
+    await client.async_close()
+
+
+@pytest.mark.asyncio
+async def test_iter_usage_not_modified(mocker: MockerFixture) -> None:
+    """Test that an unchanged conditional stream raises instead of yielding nothing."""
+    client = TalquinElectricApiClient(
+        username="username",
+        password="password",
+        transport=httpx.MockTransport(
+            lambda request: httpx.Response(304)
+            if request.headers.get("If-None-Match")
+            else httpx.Response(200, json=[], headers={"ETag": '"v1"'})
+        ),
+    )
+    mocker.patch(
+        "custom_components.talquin_electric.api.TalquinElectricApiClient.async_get_access_token",
+        return_value="access_token",
+    )
+
+    async def _fetch() -> list[UsageSeries]:
+        return [
+            batch
+            async for batch in client.async_iter_usage(
+                "account_id",
+                datetime.fromisoformat("2021-01-01T00:00:00Z"),
+                datetime.fromisoformat("2021-01-30T00:00:00Z"),
+                conditional=True,
+            )
+        ]
+
+    assert await _fetch() == []
+    with pytest.raises(TalquinElectricApiClientNotModifiedError):
+        await _fetch()
+    await client.async_close()
+
+
+def _no_delay_policy(attempts: int = 3) -> RetryPolicy:
+    """Return a retry policy that does not sleep between attempts."""
+    return RetryPolicy(attempts=attempts, base_delay=0.0, jitter=0.0)
+
+
+@pytest.mark.asyncio
+@pytest.mark.parametrize(
+    "failure",
+    [
+        httpx.Response(503),
+        httpx.Response(429, headers={"Retry-After": "0"}),
+        httpx.ConnectError("connection refused"),
+    ],
+)
+async def test__api_wrapper_retries_transient_failures(
+    failure: httpx.Response | Exception,
+) -> None:
+    """Test that transient failures are retried until a request succeeds."""
+    requests: list[httpx.Request] = []
+
+    def _handler(request: httpx.Request) -> httpx.Response:
+        requests.append(request)
+        if len(requests) < 3:  # noqa: PLR2004
+            if isinstance(failure, Exception):
+                raise failure
+            return failure
+        return httpx.Response(200, json={"ok": True})
+
+    client = TalquinElectricApiClient(
+        username="username",
+        password="password",
+        retry_policy=_no_delay_policy(),
+        transport=httpx.MockTransport(_handler),
+    )
+
+    assert await client._api_wrapper(method="get", url="https://example.com") == {
+        "ok": True
+    }
+    assert client.retry_count == 2  # noqa: PLR2004
+    assert client.circuit_breaker.state is CircuitState.CLOSED
+    await client.async_close()
+
+
+@pytest.mark.asyncio
+async def test__api_wrapper_does_not_retry_client_errors() -> None:
+    """Test that 4xx and authentication errors are not retried."""
+    requests: list[httpx.Request] = []
+
+    def _handler(request: httpx.Request) -> httpx.Response:
+        requests.append(request)
+        return httpx.Response(404 if len(requests) == 1 else 401)
+
+    client = TalquinElectricApiClient(
+        username="username",
+        password="password",
+        retry_policy=_no_delay_policy(),
+        transport=httpx.MockTransport(_handler),
+    )
+
+    with pytest.raises(TalquinElectricApiClientCommunicationError):
+        await client._api_wrapper(method="get", url="https://example.com")
+    with pytest.raises(TalquinElectricApiClientAuthenticationError):
+        await client._api_wrapper(method="get", url="https://example.com")
+    assert len(requests) == 2  # noqa: PLR2004
+    assert client.retry_count == 0
+    await client.async_close()
+
+
+@pytest.mark.asyncio
+async def test__api_wrapper_honors_retry_after() -> None:
+    """Test that Retry-After stretches the backoff before the next attempt."""
+    responses = iter(
+        [
+            httpx.Response(429, headers={"Retry-After": "7"}),
+            httpx.Response(200, json={"ok": True}),
+        ]
+    )
+    client = TalquinElectricApiClient(
+        username="username",
+        password="password",
+        retry_policy=_no_delay_policy(),
+        transport=httpx.MockTransport(lambda _request: next(responses)),
+    )
+
+    with patch("asyncio.sleep", new=AsyncMock()) as mock_sleep:
+        assert await client._api_wrapper(method="get", url="https://example.com") == {
+            "ok": True
+        }
+    mock_sleep.assert_awaited_once_with(7.0)
+    await client.async_close()
+
+
+@pytest.mark.asyncio
+async def test__api_wrapper_long_retry_after_opens_circuit() -> None:
+    """Test that a Retry-After beyond the maximum delay opens the breaker."""
+    requests: list[httpx.Request] = []
+
+    def _handler(request: httpx.Request) -> httpx.Response:
+        requests.append(request)
+        return httpx.Response(503, headers={"Retry-After": "3600"})
+
+    client = TalquinElectricApiClient(
+        username="username",
+        password="password",
+        retry_policy=_no_delay_policy(),
+        transport=httpx.MockTransport(_handler),
+    )
+
+    with pytest.raises(TalquinElectricApiClientCommunicationError):
+        await client._api_wrapper(method="get", url="https://example.com")
+    with pytest.raises(TalquinElectricApiClientCircuitOpenError):
+        await client._api_wrapper(method="get", url="https://example.com")
+    assert len(requests) == 1
+    assert client.circuit_breaker.cooldown_remaining > 3500  # noqa: PLR2004
+    await client.async_close()
+
+
+@pytest.mark.asyncio
+async def test__api_wrapper_circuit_opens_after_failures() -> None:
+    """Test that repeated failed calls open the breaker and fail fast."""
+    requests: list[httpx.Request] = []
+
+    def _handler(request: httpx.Request) -> httpx.Response:
+        requests.append(request)
+        return httpx.Response(500)
+
+    client = TalquinElectricApiClient(
+        username="username",
+        password="password",
+        retry_policy=_no_delay_policy(attempts=2),
+        circuit_breaker=CircuitBreaker(failure_threshold=2, cooldown=60.0),
+        transport=httpx.MockTransport(_handler),
+    )
+
+    for _ in range(2):
+        with pytest.raises(TalquinElectricApiClientCommunicationError):
+            await client._api_wrapper(method="get", url="https://example.com")
+    with pytest.raises(TalquinElectricApiClientCircuitOpenError):
+        await client._api_wrapper(method="get", url="https://example.com")
+    assert len(requests) == 4  # noqa: PLR2004
+    assert client.circuit_breaker.state is CircuitState.OPEN
+    await client.async_close()
+
+
+@pytest.mark.asyncio
+async def test__api_wrapper_challenge_opens_circuit() -> None:
+    """Test that a Cloudflare challenge opens the breaker without retrying."""
+    requests: list[httpx.Request] = []
+
+    def _handler(request: httpx.Request) -> httpx.Response:
+        requests.append(request)
+        return httpx.Response(403, headers={"cf-mitigated": "challenge"})
+
+    client = TalquinElectricApiClient(
+        username="username",
+        password="password",
+        retry_policy=_no_delay_policy(),
+        transport=httpx.MockTransport(_handler),
+    )
+
+    with pytest.raises(TalquinElectricApiClientChallengeError):
+        await client._api_wrapper(method="get", url="https://example.com")
+    with pytest.raises(TalquinElectricApiClientCircuitOpenError):
+        await client._api_wrapper(method="get", url="https://example.com")
+    assert len(requests) == 1
+    await client.async_close()
+
+
+@pytest.mark.asyncio
+async def test__api_wrapper_half_open_sends_one_trial() -> None:
+    """Test that concurrent calls fail fast while the half-open trial runs."""
+    release = asyncio.Event()
+    requests: list[httpx.Request] = []
+
+    async def _handler(request: httpx.Request) -> httpx.Response:
+        requests.append(request)
+        await release.wait()
+        return httpx.Response(200, json={"ok": True})
+
+    breaker = CircuitBreaker(cooldown=0.0)
+    breaker.trip(RuntimeError("challenge"))
+    client = TalquinElectricApiClient(
+        username="username",
+        password="password",
+        circuit_breaker=breaker,
+        transport=httpx.MockTransport(_handler),
+    )
+
+    trial = asyncio.create_task(
+        client._api_wrapper(method="get", url="https://example.com")
+    )
+    await asyncio.sleep(0.01)
+    with pytest.raises(TalquinElectricApiClientCircuitOpenError):
+        await client._api_wrapper(method="get", url="https://example.com")
+    release.set()
+
+    assert await trial == {"ok": True}
+    assert len(requests) == 1
+    assert breaker.state is CircuitState.CLOSED
+    await client.async_close()
+
+
+@pytest.mark.asyncio
+async def test__api_wrapper_cancelled_trial_is_released() -> None:
+    """Test that a cancelled half-open trial lets the next call through."""
+    release = asyncio.Event()
+
+    async def _handler(request: httpx.Request) -> httpx.Response:  # noqa: ARG001
+        await release.wait()
+        return httpx.Response(200, json={"ok": True})
+
+    breaker = CircuitBreaker(cooldown=0.0)
+    breaker.trip(RuntimeError("challenge"))
+    client = TalquinElectricApiClient(
+        username="username",
+        password="password",
+        circuit_breaker=breaker,
+        transport=httpx.MockTransport(_handler),
+    )
+
+    trial = asyncio.create_task(
+        client._api_wrapper(method="get", url="https://example.com")
+    )
+    await asyncio.sleep(0.01)
+    trial.cancel()
+    with pytest.raises(asyncio.CancelledError):
+        await trial
+    release.set()
+
+    assert await client._api_wrapper(method="get", url="https://example.com") == {
+        "ok": True
+    }
+    await client.async_close()
+
+
+@pytest.mark.asyncio
+async def test_get_usage_data_coalesces_identical_queries() -> None:
+    """Test that concurrent identical usage queries share one fetch."""
+    client = TalquinElectricApiClient(username="username", password="password")
+    release = asyncio.Event()
+
+    async def _fetch(**_kwargs: object) -> AsyncIterator[UsageSeries]:
+        await release.wait()
+        yield UsageSeries.from_unsorted([1611162000], [1.0])
+
+    client.async_iter_usage = Mock(side_effect=_fetch)
+    start = datetime.fromisoformat("2021-01-01T00:00:00Z")
+    end = datetime.fromisoformat("2021-01-30T00:00:00Z")
+
+    callers = [
+        asyncio.create_task(client.async_get_usage_data("account_id", start, end))
+        for _ in range(3)
+    ]
+    other = asyncio.create_task(client.async_get_usage_data("other", start, end))
+    await asyncio.sleep(0)
+    callers[0].cancel()
+    release.set()
+    results = await asyncio.gather(*callers[1:], other)
+
+    assert results[0] is results[1]
+    assert results[0] == results[2]
+    assert client.async_iter_usage.call_count == 2  # noqa: PLR2004
+    # Without a cache TTL, a later query fetches again.
+    await client.async_get_usage_data("account_id", start, end)
+    assert client.async_iter_usage.call_count == 3  # noqa: PLR2004
+
+
+@pytest.mark.asyncio
+async def test_get_usage_data_cache_ttl() -> None:
+    """Test that usage results are reused within the cache TTL."""
+    client = TalquinElectricApiClient(
+        username="username", password="password", usage_cache_ttl=30.0
+    )
+
+    async def _fetch(**_kwargs: object) -> AsyncIterator[UsageSeries]:
+        yield UsageSeries.from_unsorted([1611162000], [1.0])
+
+    client.async_iter_usage = Mock(side_effect=_fetch)
+    start = datetime.fromisoformat("2021-01-01T00:00:00Z")
+    end = datetime.fromisoformat("2021-01-30T00:00:00Z")
+
+    with patch("time.monotonic", return_value=1000.0):
+        first = await client.async_get_usage_data("account_id", start, end)
+        assert await client.async_get_usage_data("account_id", start, end) is first
+    with patch("time.monotonic", return_value=1031.0):
+        assert await client.async_get_usage_data("account_id", start, end) == first
+    assert client.async_iter_usage.call_count == 2  # noqa: PLR2004
+
+
+@pytest.mark.asyncio
+async def test_get_usage_data_failure_is_not_cached() -> None:
+    """Test that a failed fetch is shared but not cached."""
+    client = TalquinElectricApiClient(
+        username="username", password="password", usage_cache_ttl=30.0
+    )
+    client._async_fetch_usage_data = AsyncMock(
+        side_effect=[TalquinElectricApiClientCommunicationError("down"), UsageSeries()]
+    )
+    start = datetime.fromisoformat("2021-01-01T00:00:00Z")
+    end = datetime.fromisoformat("2021-01-30T00:00:00Z")
+
+    with pytest.raises(TalquinElectricApiClientCommunicationError):
+        await client.async_get_usage_data("account_id", start, end)
+    assert await client.async_get_usage_data("account_id", start, end) == UsageSeries()
+
+
+@pytest.mark.asyncio
+async def test_client_records_metrics(mocker: MockerFixture) -> None:
+    """Test that requests are recorded per endpoint without account IDs."""
+
+    def _handler(request: httpx.Request) -> httpx.Response:
+        if request.url.path.endswith("/accounts"):
+            return httpx.Response(403, headers={"cf-mitigated": "challenge"})
+        return httpx.Response(200, stream=httpx.ByteStream(b"[]"))
+
+    client = TalquinElectricApiClient(
+        username="username",
+        password="password",
+        transport=httpx.MockTransport(_handler),
+    )
+    mocker.patch(
+        "custom_components.talquin_electric.api.TalquinElectricApiClient.async_get_access_token",
+        return_value="access_token",
+    )
+
+    await client.async_get_usage_data(
+        account_id="1234",
+        start_date=datetime.fromisoformat("2021-01-01T00:00:00Z"),
+        end_date=datetime.fromisoformat("2021-01-30T00:00:00Z"),
+    )
+    with pytest.raises(TalquinElectricApiClientChallengeError):
+        await client.async_get_accounts()
+
+    metrics = client.metrics.as_dict()
+    assert metrics["endpoints"]["usage"]["outcomes"] == {"200": 1}
+    assert metrics["endpoints"]["usage"]["bytes_received"] == 2  # noqa: PLR2004
+    assert metrics["endpoints"]["accounts"]["outcomes"] == {"challenge": 1}
+    assert metrics["challenges"] == 1
+    assert metrics["requests_in_window"] == 2  # noqa: PLR2004
+    await client.async_close()
+
+
+@pytest.mark.asyncio
+async def test_client_traces_usage_phases(mocker: MockerFixture) -> None:
+    """Test that a traced usage fetch times its request, body and parsing."""
+    client = TalquinElectricApiClient(
+        username="username",
+        password="password",
+        transport=httpx.MockTransport(
+            lambda _request: httpx.Response(
+                200, json=[{"date_time": "2021-01-20T17:00:00Z", "value": 1.0}]
+            )
+        ),
+    )
+    mocker.patch(
+        "custom_components.talquin_electric.api.TalquinElectricApiClient.async_get_access_token",
+        return_value="access_token",
+    )
+    client.tracer.enabled = True
+    client.tracer.start_trace()
+
+    await client.async_get_usage_data(
+        account_id="1234",
+        start_date=datetime.fromisoformat("2021-01-01T00:00:00Z"),
+        end_date=datetime.fromisoformat("2021-01-30T00:00:00Z"),
+    )
+    client.tracer.finish_trace()
+
+    assert [span.name for span in client.tracer.last_trace] == [
+        "request_usage",
+        "usage_body",
+        "usage_parse",
+    ]
+    await client.async_close()
@@ -0,0 +1,102 @@
+"""End-to-end tests of the API client against the local stand-in server."""
+
+from collections.abc import Iterator
+from datetime import datetime, timedelta
+
+import pytest
+import pytest_socket
+
+from custom_components.talquin_electric.api import (
+    TalquinElectricApiClient,
+    TalquinElectricApiClientChallengeError,
+)
+from custom_components.talquin_electric.backfill import async_backfill_accounts
+from custom_components.talquin_electric.const import UsageInterval
+from custom_components.talquin_electric.resilience import RetryPolicy
+from tests.fake_talquin import FakeTalquinOptions, FakeTalquinServer
+
+START = datetime.fromisoformat("2021-01-01T00:00:00Z")
+
+
+@pytest.fixture
+def localhost_sockets() -> Iterator[None]:
+    """Allow connections to the local server during the test."""
+    pytest_socket.enable_socket()
+    pytest_socket.socket_allow_hosts(["127.0.0.1"])
+    try:
+        yield
+    finally:
+        pytest_socket.disable_socket(allow_unix_socket=True)
+
+
+def _client(server: FakeTalquinServer, **kwargs: object) -> TalquinElectricApiClient:
+    """Return a client pointed at the stand-in server."""
+    return TalquinElectricApiClient(
+        username="username",
+        password="password",
+        base_url=server.base_url,
+        ssl_context=server.ssl_context(),
+        **kwargs,  # type: ignore[arg-type]
+    )
+
+
+@pytest.mark.asyncio
+@pytest.mark.usefixtures("localhost_sockets")
+async def test_fake_server_usage() -> None:
+    """Test logging in and streaming hourly usage over HTTP/2 and TLS."""
+    with FakeTalquinServer(FakeTalquinOptions(accounts=("1", "2"))) as server:
+        client = _client(server)
+        try:
+            assert await client.async_get_accounts() == ["1", "2"]
+            backfills = await async_backfill_accounts(
+                client,
+                dict.fromkeys(["1", "2"], START),
+                end_date=START + timedelta(days=60),
+                interval=UsageInterval.HOURLY,
+            )
+            http_client = await client._async_get_client()
+            response = await http_client.get(server.base_url)
+        finally:
+            await client.async_close()
+
+    assert [len(backfill.usage) for backfill in backfills.values()] == [
+        60 * 24,
+        60 * 24,
+    ]
+    assert backfills["1"].usage.first_date == START
+    assert response.http_version == "HTTP/2"
+
+
+@pytest.mark.asyncio
+@pytest.mark.usefixtures("localhost_sockets")
+async def test_fake_server_injected_errors_are_retried() -> None:
+    """Test that injected 503 responses are retried through to success."""
+    options = FakeTalquinOptions(error_rate=0.5, seed=1)
+    with FakeTalquinServer(options) as server:
+        client = _client(
+            server, retry_policy=RetryPolicy(attempts=20, base_delay=0.0, jitter=0.0)
+        )
+        try:
+            usage = await client.async_get_usage_data(
+                account_id="1234",
+                start_date=START,
+                end_date=START + timedelta(days=30),
+            )
+        finally:
+            await client.async_close()
+
+    assert len(usage) == 30  # noqa: PLR2004
+    assert client.retry_count > 0
+
+
+@pytest.mark.asyncio
+@pytest.mark.usefixtures("localhost_sockets")
+async def test_fake_server_challenge() -> None:
+    """Test that an injected Cloudflare challenge is recognized."""
+    with FakeTalquinServer(FakeTalquinOptions(challenge_rate=1.0)) as server:
+        client = _client(server)
+        try:
+            with pytest.raises(TalquinElectricApiClientChallengeError):
+                await client.async_get_access_token()
+        finally:
+            await client.async_close()
@@ -0,0 +1,210 @@
+"""Tests for the chunked usage backfill."""
+
+import asyncio
+from datetime import datetime, timedelta
+from unittest.mock import AsyncMock, patch
+
+import pytest
+
+from custom_components.talquin_electric.api import (
+    TalquinElectricApiClientAuthenticationError,
+    TalquinElectricApiClientCommunicationError,
+)
+from custom_components.talquin_electric.backfill import (
+    async_backfill_accounts,
+    async_backfill_usage,
+    split_windows,
+)
+from custom_components.talquin_electric.const import UsageInterval
+from custom_components.talquin_electric.usage_series import UsageSeries
+from tests.conftest import daily_usage
+
+START = datetime.fromisoformat("2021-01-01T00:00:00Z")
+MAX_CONCURRENCY = 3
+
+
+def _daily_usage(
+    account_id: str,  # noqa: ARG001
+    start_date: datetime,
+    end_date: datetime,
+    interval: UsageInterval = UsageInterval.DAILY,
+    *,
+    conditional: bool = False,  # noqa: ARG001
+) -> UsageSeries:
+    """Return one entry per day in [start_date, end_date], inclusive."""
+    assert interval is UsageInterval.DAILY
+    return daily_usage(start_date, (end_date - start_date).days + 1)
+
+
+def test_split_windows() -> None:
+    """Test that a range is split into consecutive windows."""
+    end = START + timedelta(days=25)
+
+    assert split_windows(START, end, timedelta(days=10)) == [
+        (START, START + timedelta(days=10)),
+        (START + timedelta(days=10), START + timedelta(days=20)),
+        (START + timedelta(days=20), end),
+    ]
+    assert split_windows(START, START, timedelta(days=10)) == []
+
+
+@pytest.mark.asyncio
+async def test_backfill_merges_windows_in_order() -> None:
+    """Test that windows are reassembled in order without duplicate days."""
+    in_flight = 0
+    max_in_flight = 0
+
+    async def _get_usage_data(**kwargs: datetime) -> UsageSeries:
+        nonlocal in_flight, max_in_flight
+        in_flight += 1
+        max_in_flight = max(max_in_flight, in_flight)
+        await asyncio.sleep(0)
+        in_flight -= 1
+        return _daily_usage(**kwargs)
+
+    client = AsyncMock()
+    client.async_get_usage_data.side_effect = _get_usage_data
+
+    result = await async_backfill_usage(
+        client,
+        account_id="1234",
+        start_date=START,
+        end_date=START + timedelta(days=99),
+        window=timedelta(days=10),
+        max_concurrency=MAX_CONCURRENCY,
+    )
+
+    assert result.complete
+    assert [entry.date for entry in result.usage] == [
+        START + timedelta(days=day) for day in range(100)
+    ]
+    assert client.async_get_usage_data.await_count == len(
+        split_windows(START, START + timedelta(days=99), timedelta(days=10))
+    )
+    assert max_in_flight == MAX_CONCURRENCY
+
+
+@pytest.mark.asyncio
+@patch("custom_components.talquin_electric.backfill.BACKFILL_RETRY_DELAY", 0)
+async def test_backfill_retries_failed_window() -> None:
+    """Test that a failing window is retried on its own."""
+    client = AsyncMock()
+    client.async_get_usage_data.side_effect = [
+        _daily_usage("1234", START, START + timedelta(days=10)),
+        TalquinElectricApiClientCommunicationError("timeout"),
+        _daily_usage("1234", START + timedelta(days=10), START + timedelta(days=15)),
+    ]
+
+    result = await async_backfill_usage(
+        client,
+        account_id="1234",
+        start_date=START,
+        end_date=START + timedelta(days=15),
+        window=timedelta(days=10),
+        max_concurrency=1,
+    )
+
+    assert result.complete
+    assert [entry.date for entry in result.usage] == [
+        START + timedelta(days=day) for day in range(16)
+    ]
+
+
+@pytest.mark.asyncio
+@patch("custom_components.talquin_electric.backfill.BACKFILL_RETRY_DELAY", 0)
+async def test_backfill_keeps_prefix_before_failed_window() -> None:
+    """Test that a window failing every attempt ends the backfill there."""
+    failed_window = START + timedelta(days=10)
+
+    async def _get_usage_data(**kwargs: datetime) -> UsageSeries:
+        if kwargs["start_date"] == failed_window:
+            raise TalquinElectricApiClientCommunicationError("timeout")
+        return _daily_usage(**kwargs)
+
+    client = AsyncMock()
+    client.async_get_usage_data.side_effect = _get_usage_data
+
+    result = await async_backfill_usage(
+        client,
+        account_id="1234",
+        start_date=START,
+        end_date=START + timedelta(days=30),
+        window=timedelta(days=10),
+        max_concurrency=1,
+        attempts=2,
+    )
+
+    assert not result.complete
+    assert result.usage.last_date == failed_window
+
+
+@pytest.mark.asyncio
+async def test_backfill_raises_authentication_error() -> None:
+    """Test that authentication errors are not retried."""
+    client = AsyncMock()
+    client.async_get_usage_data.side_effect = (
+        TalquinElectricApiClientAuthenticationError("Invalid credentials")
+    )
+
+    with pytest.raises(TalquinElectricApiClientAuthenticationError):
+        await async_backfill_usage(
+            client,
+            account_id="1234",
+            start_date=START,
+            end_date=START + timedelta(days=30),
+            window=timedelta(days=10),
+        )
+    assert client.async_get_usage_data.await_count == len(
+        split_windows(START, START + timedelta(days=30), timedelta(days=10))
+    )
+
+
+@pytest.mark.asyncio
+async def test_backfill_skips_unchanged_windows() -> None:
+    """Test that windows a conditional request found unchanged add nothing."""
+
+    async def _get_usage_data(**kwargs: datetime) -> UsageSeries | None:
+        assert kwargs["conditional"]
+        if kwargs["start_date"] == START:
+            return None
+        return _daily_usage(**kwargs)
+
+    client = AsyncMock()
+    client.async_get_usage_data.side_effect = _get_usage_data
+
+    result = await async_backfill_usage(
+        client,
+        account_id="1234",
+        start_date=START,
+        end_date=START + timedelta(days=19),
+        window=timedelta(days=10),
+        conditional=True,
+    )
+
+    assert result.complete
+    assert result.usage.first_date == START + timedelta(days=10)
+
+
+@pytest.mark.asyncio
+async def test_backfill_accounts_returns_failures_per_account() -> None:
+    """Test that one failing account doesn't stop the others."""
+
+    async def _get_usage_data(**kwargs: datetime) -> UsageSeries:
+        if kwargs["account_id"] == "2":
+            msg = "Invalid credentials"
+            raise TalquinElectricApiClientAuthenticationError(msg)
+        return _daily_usage(**kwargs)
+
+    client = AsyncMock()
+    client.async_get_usage_data.side_effect = _get_usage_data
+
+    results = await async_backfill_accounts(
+        client,
+        {"1": START, "2": START, "3": START + timedelta(days=5)},
+        end_date=START + timedelta(days=9),
+    )
+
+    assert list(results) == ["1", "2", "3"]
+    assert len(results["1"].usage) == 10  # noqa: PLR2004
+    assert isinstance(results["2"], TalquinElectricApiClientAuthenticationError)
+    assert results["3"].usage.first_date == START + timedelta(days=5)
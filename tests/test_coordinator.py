@@ -0,0 +1,262 @@
+"""Tests for the usage sync coordinator."""
+
+from collections.abc import Callable
+from datetime import datetime, timedelta
+from typing import Any
+from unittest.mock import AsyncMock, Mock, patch
+
+import pytest
+from freezegun.api import FrozenDateTimeFactory
+from homeassistant.const import CONF_PASSWORD, CONF_USERNAME
+from homeassistant.core import HomeAssistant
+from homeassistant.helpers.update_coordinator import UpdateFailed
+from pytest_homeassistant_custom_component.common import MockConfigEntry
+
+from custom_components.talquin_electric.api import (
+    TalquinElectricApiClientChallengeError,
+    TalquinElectricApiClientCommunicationError,
+)
+from custom_components.talquin_electric.const import (
+    BACKFILL_WINDOW,
+    CONF_ACCOUNT_ID,
+    DOMAIN,
+    USAGE_INITIAL_HISTORY,
+    USAGE_SYNC_OVERLAP,
+    UsageInterval,
+)
+from custom_components.talquin_electric.coordinator import (
+    BlueprintDataUpdateCoordinator,
+)
+from custom_components.talquin_electric.data import TalquinElectricData
+from custom_components.talquin_electric.tracing import Tracer
+from custom_components.talquin_electric.usage_series import UsageSeries
+from tests.conftest import daily_usage
+
+pytestmark = pytest.mark.usefixtures("mock_import_statistics")
+
+NOW = datetime.fromisoformat("2024-03-10T15:30:00+00:00")
+MIDNIGHT = datetime.fromisoformat("2024-03-11T00:00:00+00:00")
+
+
+def _client(usage_fn: Callable[..., UsageSeries]) -> Mock:
+    """Return a client answering usage queries with `usage_fn`."""
+    client = Mock()
+    client.tracer = Tracer()
+    client.async_get_usage_data = AsyncMock(side_effect=usage_fn)
+    client.async_get_accounts = AsyncMock(return_value=["1234"])
+    return client
+
+
+def _coordinator(
+    hass: HomeAssistant,
+    client: Mock,
+    data: dict[str, Any] | None = None,
+) -> BlueprintDataUpdateCoordinator:
+    """Return a coordinator of a config entry using `client`."""
+    entry = MockConfigEntry(
+        domain=DOMAIN,
+        data={
+            CONF_USERNAME: "username",
+            CONF_PASSWORD: "password",
+            **(data if data is not None else {CONF_ACCOUNT_ID: "1234"}),
+        },
+    )
+    entry.add_to_hass(hass)
+    coordinator = BlueprintDataUpdateCoordinator(hass=hass, store=Mock())
+    coordinator.config_entry = entry
+    entry.runtime_data = TalquinElectricData(
+        client=client, coordinator=coordinator, integration=Mock()
+    )
+    return coordinator
+
+
+async def test_first_sync_fetches_initial_history(
+    hass: HomeAssistant, freezer: FrozenDateTimeFactory
+) -> None:
+    """Test that the first sync backfills the initial history up to midnight."""
+    freezer.move_to(NOW)
+    usage = daily_usage(NOW - timedelta(days=2), 2)
+    client = _client(
+        lambda account_id, start_date, end_date, interval, conditional: usage  # noqa: ARG005
+    )
+    coordinator = _coordinator(hass, client)
+
+    data = await coordinator._async_update_data()
+
+    ranges = sorted(
+        (call.kwargs["start_date"], call.kwargs["end_date"])
+        for call in client.async_get_usage_data.await_args_list
+    )
+    assert ranges[0][0] == NOW - USAGE_INITIAL_HISTORY
+    assert ranges[-1][1] == MIDNIGHT
+    assert all(end - start <= BACKFILL_WINDOW for start, end in ranges)
+    assert data["1234"] == usage
+    coordinator._store.async_schedule_save.assert_called_once()
+
+
+async def test_sync_fetches_delta_from_watermark(
+    hass: HomeAssistant,
+    freezer: FrozenDateTimeFactory,
+    mock_import_statistics: Mock,
+) -> None:
+    """Test that later syncs only fetch the overlap window past the watermark."""
+    freezer.move_to(NOW)
+    stored = daily_usage(NOW - timedelta(days=10), 8)
+    client = _client(
+        lambda account_id, start_date, end_date, interval, conditional: daily_usage(  # noqa: ARG005
+            stored.last_date, 3
+        )
+    )
+    coordinator = _coordinator(hass, client)
+    coordinator.data = {"1234": stored}
+
+    data = await coordinator._async_update_data()
+
+    client.async_get_usage_data.assert_awaited_once()
+    call = client.async_get_usage_data.await_args
+    assert call.kwargs["start_date"] == stored.last_date - USAGE_SYNC_OVERLAP
+    assert call.kwargs["end_date"] == MIDNIGHT
+    assert call.kwargs["conditional"]
+    assert len(data["1234"]) == len(stored) + 2
+    assert mock_import_statistics.await_args.kwargs["since"] == stored.last_date
+
+
+async def test_sync_merges_corrections(
+    hass: HomeAssistant, freezer: FrozenDateTimeFactory
+) -> None:
+    """Test that re-fetched readings in the overlap replace stored ones."""
+    freezer.move_to(NOW)
+    stored = daily_usage(NOW - timedelta(days=10), 8)
+    corrected = daily_usage(stored.last_date - timedelta(days=1), 2, value=5.0)
+    client = _client(
+        lambda account_id, start_date, end_date, interval, conditional: corrected  # noqa: ARG005
+    )
+    coordinator = _coordinator(hass, client)
+    coordinator.data = {"1234": stored}
+
+    data = await coordinator._async_update_data()
+
+    assert list(data["1234"].values) == [1.0] * 6 + [5.0, 5.0]
+
+
+async def test_sync_discovers_accounts(
+    hass: HomeAssistant, freezer: FrozenDateTimeFactory
+) -> None:
+    """Test that every account of the login is synced without a configured one."""
+    freezer.move_to(NOW)
+    client = _client(
+        lambda account_id, start_date, end_date, interval, conditional: daily_usage(  # noqa: ARG005
+            NOW - timedelta(days=2), 2, value=float(account_id)
+        )
+    )
+    client.async_get_accounts.return_value = ["1", "2"]
+    coordinator = _coordinator(hass, client, data={})
+
+    data = await coordinator._async_update_data()
+    await coordinator._async_update_data()
+
+    client.async_get_accounts.assert_awaited_once()
+    assert coordinator.account_ids == ["1", "2"]
+    assert {account_id: series.values[0] for account_id, series in data.items()} == {
+        "1": 1.0,
+        "2": 2.0,
+    }
+
+
+@patch("custom_components.talquin_electric.backfill.BACKFILL_RETRY_DELAY", 0)
+async def test_sync_keeps_accounts_that_succeeded(
+    hass: HomeAssistant, freezer: FrozenDateTimeFactory
+) -> None:
+    """Test that a failing account keeps its old usage and others still sync."""
+    freezer.move_to(NOW)
+    stored = daily_usage(NOW - timedelta(days=10), 8)
+
+    def _usage(
+        account_id: str,
+        start_date: datetime,
+        end_date: datetime,  # noqa: ARG001
+        interval: UsageInterval,  # noqa: ARG001
+        *,
+        conditional: bool,  # noqa: ARG001
+    ) -> UsageSeries:
+        if account_id == "2":
+            msg = "Timeout"
+            raise TalquinElectricApiClientCommunicationError(msg)
+        return daily_usage(start_date, 4)
+
+    client = _client(_usage)
+    client.async_get_accounts.return_value = ["1", "2"]
+    coordinator = _coordinator(hass, client, data={})
+    coordinator.data = {"1": stored, "2": stored}
+
+    data = await coordinator._async_update_data()
+
+    assert len(data["1"]) == len(stored) + 1
+    assert data["2"] is stored
+
+
+@patch("custom_components.talquin_electric.backfill.BACKFILL_RETRY_DELAY", 0)
+async def test_sync_fails_if_every_account_fails(
+    hass: HomeAssistant, freezer: FrozenDateTimeFactory
+) -> None:
+    """Test that the refresh fails only when no account could be synced."""
+    freezer.move_to(NOW)
+    client = _client(Mock(side_effect=TalquinElectricApiClientCommunicationError))
+    client.async_get_accounts.return_value = ["1", "2"]
+    coordinator = _coordinator(hass, client, data={})
+
+    with pytest.raises(UpdateFailed):
+        await coordinator._async_update_data()
+    coordinator._store.async_schedule_save.assert_not_called()
+
+
+async def test_sync_challenge_is_not_an_auth_failure(
+    hass: HomeAssistant, freezer: FrozenDateTimeFactory
+) -> None:
+    """Test that a Cloudflare challenge fails the refresh without reauth."""
+    freezer.move_to(NOW)
+    client = _client(
+        Mock(side_effect=TalquinElectricApiClientChallengeError("challenge"))
+    )
+    coordinator = _coordinator(hass, client)
+    coordinator.data = {"1234": daily_usage(NOW - timedelta(days=10), 8)}
+
+    with pytest.raises(UpdateFailed):
+        await coordinator._async_update_data()
+    # Not retried: the breaker decides when to try again
+    client.async_get_usage_data.assert_awaited_once()
+
+
+@patch("custom_components.talquin_electric.backfill.BACKFILL_RETRY_DELAY", 0)
+async def test_update_listeners_skips_unchanged_accounts(
+    hass: HomeAssistant, freezer: FrozenDateTimeFactory
+) -> None:
+    """Test that only listeners of accounts whose usage changed are updated."""
+    freezer.move_to(NOW)
+    fixed = daily_usage(NOW - timedelta(days=3), 3)
+    client = _client(
+        lambda account_id, start_date, end_date, interval, conditional: (  # noqa: ARG005
+            daily_usage(start_date, 4) if account_id == "1" else fixed
+        )
+    )
+    client.async_get_accounts.return_value = ["1", "2"]
+    coordinator = _coordinator(hass, client, data={})
+    coordinator.data = {"1": daily_usage(NOW - timedelta(days=3), 3), "2": fixed}
+    updated: list[str | None] = []
+    for context in ("1", "2", None):
+        coordinator.async_add_listener(
+            lambda context=context: updated.append(context), context
+        )
+
+    await coordinator.async_refresh()
+    assert updated == ["1", "2", None]
+
+    updated.clear()
+    await coordinator.async_refresh()
+    assert updated == ["1", None]
+
+    updated.clear()
+    client.async_get_usage_data.side_effect = TalquinElectricApiClientCommunicationError
+    await coordinator.async_refresh()
+    assert updated == ["1", "2", None]
+    await coordinator.async_shutdown()
@@ -0,0 +1,56 @@
+"""Tests for the shared entity behaviour."""
+
+from unittest.mock import AsyncMock, patch
+
+import pytest
+from homeassistant.const import CONF_PASSWORD, CONF_USERNAME
+from homeassistant.core import HomeAssistant
+from pytest_homeassistant_custom_component.common import MockConfigEntry
+
+from custom_components.talquin_electric.api import TalquinElectricApiClient
+from custom_components.talquin_electric.const import CONF_ACCOUNT_ID, DOMAIN
+from custom_components.talquin_electric.entity import TalquinElectricEntity
+from custom_components.talquin_electric.usage_series import UsageSeries
+
+USAGE = UsageSeries((1710028800, 1710115200), (1.0, 2.0))
+
+pytestmark = pytest.mark.usefixtures("mock_import_statistics")
+
+
+@pytest.mark.usefixtures("recorder_mock", "enable_custom_integrations")
+async def test_coordinator_update_writes_only_changed_state(
+    hass: HomeAssistant,
+) -> None:
+    """Test that entities skip the state write when nothing they show changed."""
+    entry = MockConfigEntry(
+        domain=DOMAIN,
+        data={
+            CONF_USERNAME: "username",
+            CONF_PASSWORD: "password",
+            CONF_ACCOUNT_ID: "1234",
+        },
+    )
+    entry.add_to_hass(hass)
+    with patch.object(
+        TalquinElectricApiClient, "async_get_usage_data", AsyncMock(return_value=USAGE)
+    ):
+        assert await hass.config_entries.async_setup(entry.entry_id)
+    await hass.async_block_till_done()
+    coordinator = entry.runtime_data.coordinator
+    listeners = [update for update, _ in coordinator._listeners.values()]
+
+    with patch.object(
+        TalquinElectricEntity, "async_write_ha_state", autospec=True
+    ) as mock_write:
+        for update in listeners:
+            update()
+        assert mock_write.call_count == 0
+
+        coordinator.stale = True
+        for update in listeners:
+            update()
+        assert mock_write.call_count == len(listeners)
+
+        for update in listeners:
+            update()
+        assert mock_write.call_count == len(listeners)
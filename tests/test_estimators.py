@@ -0,0 +1,114 @@
+"""Tests for the online usage estimators."""
+
+import statistics
+from datetime import UTC, datetime, timedelta
+from zoneinfo import ZoneInfo
+
+import pytest
+
+from custom_components.talquin_electric.const import UsageInterval
+from custom_components.talquin_electric.estimators import UsageEstimator
+from custom_components.talquin_electric.rollups import UsageRollup
+from custom_components.talquin_electric.usage_series import UsageSeries
+
+# A Monday
+START = datetime(2021, 2, 1, tzinfo=UTC)
+EASTERN = ZoneInfo("America/New_York")
+
+
+def _hourly_usage(daily_totals: list[float], start: datetime = START) -> UsageSeries:
+    """Return hourly readings adding up to `daily_totals`, one day each."""
+    return UsageSeries(
+        (
+            int((start + timedelta(days=day, hours=hour)).timestamp())
+            for day in range(len(daily_totals))
+            for hour in range(24)
+        ),
+        (total / 24 for total in daily_totals for _ in range(24)),
+    )
+
+
+def test_daily_statistics() -> None:
+    """Test the running mean, variance and weekday baselines of complete days."""
+    totals = [float(10 + day % 7) for day in range(21)]
+    estimator = UsageEstimator(interval=UsageInterval.HOURLY)
+    estimator.update(_hourly_usage(totals))
+
+    assert estimator.mean == pytest.approx(statistics.mean(totals))
+    assert estimator.stddev == pytest.approx(statistics.stdev(totals))
+    assert estimator.weekday_baseline(0) == pytest.approx(10.0)
+    assert estimator.last_day_total == pytest.approx(totals[-1])
+    assert estimator.last_day_unusual is False
+
+    # A day is complete only once its last hour is in
+    estimator.update(_hourly_usage([100.0], START + timedelta(days=21))[:23])
+    assert estimator.last_day_total == pytest.approx(totals[-1])
+
+
+def test_daily_readings_complete_their_day() -> None:
+    """Test that a daily reading completes its day, as the rollups see it."""
+    usage = UsageSeries(
+        (int((START + timedelta(days=day, hours=5)).timestamp()) for day in range(3)),
+        (1.0, 2.0, 3.0),
+    )
+    estimator = UsageEstimator()
+    estimator.update(usage)
+
+    assert estimator.last_day_total == UsageRollup(usage).last_day_total() == 3.0  # noqa: PLR2004
+
+
+def test_unusual_day() -> None:
+    """Test that a day far from its weekday baseline is flagged."""
+    totals = [10.0 + day % 2 for day in range(28)] + [40.0]
+    estimator = UsageEstimator(interval=UsageInterval.HOURLY)
+    estimator.update(_hourly_usage(totals))
+    assert estimator.last_day_unusual is True
+
+    estimator.update(_hourly_usage([10.0], START + timedelta(days=29)))
+    assert estimator.last_day_unusual is False
+
+
+def test_incremental_updates_match_replay() -> None:
+    """Test that updating in steps, through a saved state, matches one pass."""
+    usage = _hourly_usage([float(day % 5) for day in range(40)])
+    whole = UsageEstimator(
+        tz=EASTERN, billing_cycle_day=15, interval=UsageInterval.HOURLY
+    )
+    whole.update(usage)
+
+    stepped = UsageEstimator(
+        tz=EASTERN, billing_cycle_day=15, interval=UsageInterval.HOURLY
+    )
+    for end in range(100, len(usage) + 100, 100):
+        stepped = UsageEstimator(
+            stepped.as_dict(),
+            tz=EASTERN,
+            billing_cycle_day=15,
+            interval=UsageInterval.HOURLY,
+        )
+        # Overlapping rows already seen are skipped
+        stepped.update(usage[max(end - 150, 0) : end])
+
+    assert stepped.as_dict() == pytest.approx(whole.as_dict())
+
+
+def test_cycle_total_and_projection() -> None:
+    """Test the rolling cycle total against the rollups."""
+    usage = _hourly_usage([24.0] * 30)
+    estimator = UsageEstimator(billing_cycle_day=10, interval=UsageInterval.HOURLY)
+    estimator.update(usage)
+
+    rollup = UsageRollup(usage, billing_cycle_day=10)
+    assert estimator.cycle_total == pytest.approx(rollup.current_cycle_total())
+    # 24 kWh a day over the 28 days from February 10 to March 10
+    assert estimator.projected_cycle_total == pytest.approx(24.0 * 28)
+
+
+def test_billing_cycle_day_change_resets_state() -> None:
+    """Test that state saved for another billing cycle day is discarded."""
+    estimator = UsageEstimator(billing_cycle_day=10, interval=UsageInterval.HOURLY)
+    estimator.update(_hourly_usage([24.0] * 3))
+
+    assert UsageEstimator(estimator.as_dict(), billing_cycle_day=10).mean is not None
+    assert UsageEstimator(estimator.as_dict(), billing_cycle_day=1).mean is None
+    assert UsageEstimator(interval=UsageInterval.HOURLY).projected_cycle_total is None
@@ -0,0 +1,220 @@
+"""Tests for streaming usage exports."""
+
+import csv
+import json
+from collections.abc import AsyncIterator, Callable
+from datetime import UTC, datetime, timedelta
+from pathlib import Path
+from typing import Any
+from unittest.mock import Mock
+
+import httpx
+import pytest
+from pytest_mock import MockerFixture
+
+from custom_components.talquin_electric.api import (
+    TalquinElectricApiClient,
+    TalquinElectricApiClientCommunicationError,
+)
+from custom_components.talquin_electric.const import BACKFILL_WINDOW
+from custom_components.talquin_electric.export import (
+    ExportFormat,
+    async_export_usage,
+    async_iter_export,
+)
+from custom_components.talquin_electric.usage_series import UsageSeries
+from tests.conftest import daily_usage
+
+START = datetime(2021, 1, 1, tzinfo=UTC)
+
+
+def _daily_usage(start: datetime, days: int) -> UsageSeries:
+    """Return one reading a day from `start`, valued by its day of the month."""
+    return daily_usage(start, days, lambda date: float(date.day))
+
+
+def _client(*, fail: bool = False, inclusive: bool = False) -> Mock:
+    """Return a client serving daily usage for any window, optionally its end."""
+    client = Mock()
+
+    async def _async_iter_usage(
+        account_id: str,  # noqa: ARG001
+        start_date: datetime,
+        end_date: datetime,
+        **_: Any,
+    ) -> AsyncIterator[UsageSeries]:
+        if fail:
+            msg = "Timeout"
+            raise TalquinElectricApiClientCommunicationError(msg)
+        yield _daily_usage(start_date, (end_date - start_date).days + inclusive)
+
+    client.async_iter_usage = Mock(side_effect=_async_iter_usage)
+    return client
+
+
+def _hass() -> Mock:
+    """Return a hass stand-in running executor jobs inline."""
+
+    async def _async_add_executor_job(target: Callable, *args: Any) -> Any:
+        return target(*args)
+
+    hass = Mock()
+    hass.async_add_executor_job = _async_add_executor_job
+    return hass
+
+
+@pytest.mark.asyncio
+async def test_iter_export_fetches_only_uncached_range() -> None:
+    """Test that dates before the stored series come from the API by window."""
+    stored = _daily_usage(START + timedelta(days=60), 30)
+    client = _client()
+
+    chunks = [
+        chunk
+        async for chunk in async_iter_export(
+            client,
+            stored,
+            "1234",
+            START,
+            START + timedelta(days=80),
+            chunk_size=7,
+        )
+    ]
+
+    usage = UsageSeries.concat(chunks)
+    assert usage == _daily_usage(START, 80)
+    windows = [call.args[1:3] for call in client.async_iter_usage.call_args_list]
+    assert windows[0] == (START, START + BACKFILL_WINDOW)
+    assert windows[-1][1] == START + timedelta(days=60)
+    assert all(len(chunk) <= 7 for chunk in chunks[len(windows) :])  # noqa: PLR2004
+
+
+@pytest.mark.asyncio
+async def test_iter_export_skips_repeated_window_ends() -> None:
+    """Test that a window's end, repeated by what follows it, is written once."""
+    stored = _daily_usage(START + timedelta(days=60), 30)
+
+    chunks = [
+        chunk
+        async for chunk in async_iter_export(
+            _client(inclusive=True),
+            stored,
+            "1234",
+            START,
+            START + timedelta(days=80),
+        )
+    ]
+
+    written = [timestamp for chunk in chunks for timestamp in chunk.timestamps]
+    assert written == list(_daily_usage(START, 80).timestamps)
+
+
+@pytest.mark.asyncio
+@pytest.mark.parametrize("export_format", [ExportFormat.CSV, ExportFormat.NDJSON])
+async def test_export_usage(tmp_path: Path, export_format: ExportFormat) -> None:
+    """Test writing the stored usage as CSV and NDJSON."""
+    path = tmp_path / f"usage.{export_format}"
+
+    rows = await async_export_usage(
+        _hass(),
+        _client(),
+        _daily_usage(START, 3),
+        "1234",
+        START,
+        START + timedelta(days=3),
+        path=path,
+        export_format=export_format,
+    )
+
+    assert rows == 3  # noqa: PLR2004
+    if export_format is ExportFormat.CSV:
+        with path.open(newline="") as file:
+            written = [(row["date_time"], row["value"]) for row in csv.DictReader(file)]
+    else:
+        written = [
+            (row["date_time"], str(row["value"]))
+            for row in map(json.loads, path.read_text().splitlines())
+        ]
+    assert written == [
+        ("2021-01-01T00:00:00+00:00", "1.0"),
+        ("2021-01-02T00:00:00+00:00", "2.0"),
+        ("2021-01-03T00:00:00+00:00", "3.0"),
+    ]
+    assert list(tmp_path.iterdir()) == [path]
+
+
+@pytest.mark.asyncio
+async def test_export_usage_parquet(tmp_path: Path) -> None:
+    """Test writing Parquet when pyarrow is installed."""
+    parquet = pytest.importorskip("pyarrow.parquet")
+    path = tmp_path / "usage.parquet"
+
+    await async_export_usage(
+        _hass(),
+        _client(),
+        _daily_usage(START, 3),
+        "1234",
+        START,
+        START + timedelta(days=3),
+        path=path,
+        export_format=ExportFormat.PARQUET,
+    )
+
+    assert parquet.read_table(path).column("value").to_pylist() == [1.0, 2.0, 3.0]
+
+
+@pytest.mark.asyncio
+async def test_export_usage_failure_leaves_no_file(tmp_path: Path) -> None:
+    """Test that a failed export removes its partial file."""
+    with pytest.raises(TalquinElectricApiClientCommunicationError):
+        await async_export_usage(
+            _hass(),
+            _client(fail=True),
+            UsageSeries(),
+            "1234",
+            START,
+            START + timedelta(days=3),
+            path=tmp_path / "usage.csv",
+        )
+
+    assert list(tmp_path.iterdir()) == []
+
+
+@pytest.mark.asyncio
+async def test_export_usage_ignores_validators(
+    tmp_path: Path, mocker: MockerFixture
+) -> None:
+    """Test that an export gets the rows even if a sync already revalidates them."""
+    requests: list[httpx.Request] = []
+
+    def _handler(request: httpx.Request) -> httpx.Response:
+        requests.append(request)
+        if request.headers.get("If-None-Match") == '"v1"':
+            return httpx.Response(304)
+        return httpx.Response(
+            200,
+            json=[{"date_time": "2021-01-01T00:00:00Z", "value": 1.0}],
+            headers={"ETag": '"v1"'},
+        )
+
+    client = TalquinElectricApiClient(
+        username="username",
+        password="password",
+        transport=httpx.MockTransport(_handler),
+    )
+    mocker.patch.object(client, "async_get_access_token", return_value="token")
+    end = START + timedelta(days=3)
+    await client.async_get_usage_data("1234", START, end, conditional=True)
+
+    for name in ("first.csv", "second.csv"):
+        rows = await async_export_usage(
+            _hass(), client, UsageSeries(), "1234", START, end, path=tmp_path / name
+        )
+        assert rows == 1
+    await client.async_close()
+
+    assert [request.headers.get("If-None-Match") for request in requests] == [
+        None,
+        None,
+        None,
+    ]
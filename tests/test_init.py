@@ -0,0 +1,162 @@
+"""Tests for setting up the integration."""
+
+import asyncio
+import subprocess
+import sys
+from datetime import datetime, timedelta
+from pathlib import Path
+from typing import Any
+from unittest.mock import AsyncMock, patch
+
+import pytest
+from homeassistant.config_entries import ConfigEntryState
+from homeassistant.const import CONF_PASSWORD, CONF_USERNAME
+from homeassistant.core import HomeAssistant
+from homeassistant.exceptions import ServiceValidationError
+from homeassistant.helpers import entity_registry as er
+from pytest_homeassistant_custom_component.common import MockConfigEntry
+
+from custom_components.talquin_electric.api import TalquinElectricApiClient
+from custom_components.talquin_electric.const import (
+    CONF_ACCOUNT_ID,
+    DOMAIN,
+    STORAGE_VERSION,
+)
+from custom_components.talquin_electric.usage_series import UsageSeries
+
+NOW = datetime.fromisoformat("2024-03-10T15:30:00+00:00")
+USAGE = UsageSeries(
+    (int((NOW - timedelta(days=day)).timestamp()) for day in (3, 2)), (1.0, 2.0)
+)
+
+pytestmark = pytest.mark.usefixtures(
+    "recorder_mock", "enable_custom_integrations", "mock_import_statistics"
+)
+
+
+@pytest.fixture
+def mock_get_usage_data() -> Any:
+    """Answer usage queries without calling the API."""
+    with patch.object(
+        TalquinElectricApiClient, "async_get_usage_data", AsyncMock(return_value=USAGE)
+    ) as mock_get:
+        yield mock_get
+
+
+def _entry(hass: HomeAssistant) -> MockConfigEntry:
+    """Add a config entry for one account."""
+    entry = MockConfigEntry(
+        domain=DOMAIN,
+        data={
+            CONF_USERNAME: "username",
+            CONF_PASSWORD: "password",
+            CONF_ACCOUNT_ID: "1234",
+        },
+    )
+    entry.add_to_hass(hass)
+    return entry
+
+
+def _store_snapshot(hass_storage: dict[str, Any], entry: MockConfigEntry) -> None:
+    """Store usage synced by a previous run of the entry."""
+    hass_storage[f"{DOMAIN}.{entry.entry_id}"] = {
+        "version": STORAGE_VERSION,
+        "key": f"{DOMAIN}.{entry.entry_id}",
+        "data": {
+            "accounts": {"1234": [[int(NOW.timestamp()) - 86400 * 5, 1.0]]},
+            "interval": "daily",
+        },
+    }
+
+
+def _usage_state(hass: HomeAssistant, entry: MockConfigEntry) -> Any:
+    """Return the state of the account's last day usage sensor."""
+    entity_id = er.async_get(hass).async_get_entity_id(
+        "sensor", DOMAIN, f"{entry.entry_id}_1234_last_day_usage"
+    )
+    assert entity_id is not None
+    return hass.states.get(entity_id)
+
+
+async def test_setup_with_snapshot_refreshes_in_background(
+    hass: HomeAssistant,
+    hass_storage: dict[str, Any],
+    mock_get_usage_data: AsyncMock,
+) -> None:
+    """Test that stored usage is shown as assumed while the refresh runs."""
+    entry = _entry(hass)
+    _store_snapshot(hass_storage, entry)
+    release = asyncio.Event()
+
+    async def _get_usage_data(**_kwargs: object) -> UsageSeries:
+        await release.wait()
+        return USAGE
+
+    mock_get_usage_data.side_effect = _get_usage_data
+
+    # Setup must not wait for the refresh, which is held until released.
+    async with asyncio.timeout(5):
+        assert await hass.config_entries.async_setup(entry.entry_id)
+
+    assert entry.state is ConfigEntryState.LOADED
+    assert entry.runtime_data.coordinator.stale
+    assert _usage_state(hass, entry).attributes.get("assumed_state")
+    mock_get_usage_data.assert_awaited()
+
+    release.set()
+    await hass.async_block_till_done(wait_background_tasks=True)
+
+    assert not entry.runtime_data.coordinator.stale
+    assert not _usage_state(hass, entry).attributes.get("assumed_state")
+
+
+async def test_setup_without_snapshot_awaits_first_refresh(
+    hass: HomeAssistant, mock_get_usage_data: AsyncMock
+) -> None:
+    """Test that setup waits for the first refresh when nothing is stored."""
+    entry = _entry(hass)
+
+    assert await hass.config_entries.async_setup(entry.entry_id)
+
+    mock_get_usage_data.assert_awaited()
+    assert entry.runtime_data.coordinator.data == {"1234": USAGE}
+    assert not entry.runtime_data.coordinator.stale
+    assert not _usage_state(hass, entry).attributes.get("assumed_state")
+
+
+@pytest.mark.usefixtures("mock_get_usage_data")
+async def test_export_service_rejects_empty_range(
+    hass: HomeAssistant, tmp_path: Path
+) -> None:
+    """Test that an export ending at or before its start writes no file."""
+    hass.config.config_dir = str(tmp_path)
+    entry = _entry(hass)
+    assert await hass.config_entries.async_setup(entry.entry_id)
+
+    with pytest.raises(ServiceValidationError):
+        await hass.services.async_call(
+            DOMAIN,
+            "export_usage",
+            {"account_id": "1234", "start": NOW, "end": NOW},
+            blocking=True,
+            return_response=True,
+        )
+
+    assert list(tmp_path.iterdir()) == []
+
+
+def test_import_defers_httpx() -> None:
+    """Test that importing the integration doesn't import httpx."""
+    result = subprocess.run(  # noqa: S603
+        [
+            sys.executable,
+            "-c",
+            "import sys, custom_components.talquin_electric; "
+            "assert 'httpx' not in sys.modules, 'httpx was imported'",
+        ],
+        capture_output=True,
+        check=False,
+        cwd=Path(__file__).parent.parent,
+        text=True,
+    )
+    assert result.returncode == 0, result.stderr
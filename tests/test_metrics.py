@@ -0,0 +1,46 @@
+"""Tests for the API client request metrics."""
+
+from unittest.mock import patch
+
+from custom_components.talquin_electric.metrics import ApiMetrics
+
+
+def test_record_request() -> None:
+    """Test counters, outcomes and the latency histogram of an endpoint."""
+    metrics = ApiMetrics()
+    metrics.record_request("usage", 0.2, "200")
+    metrics.record_request("usage", 3.0, "503")
+    metrics.record_request("usage", 60.0, "challenge")
+    metrics.record_bytes("usage", 1024)
+
+    usage = metrics.as_dict()["endpoints"]["usage"]
+    assert usage["requests"] == 3  # noqa: PLR2004
+    assert usage["outcomes"] == {"200": 1, "503": 1, "challenge": 1}
+    assert usage["bytes_received"] == 1024  # noqa: PLR2004
+    assert usage["last_duration"] == 60.0  # noqa: PLR2004
+    assert usage["latency_histogram"] == {
+        "le_0.1": 0,
+        "le_0.25": 1,
+        "le_0.5": 0,
+        "le_1.0": 0,
+        "le_2.5": 0,
+        "le_5.0": 1,
+        "le_10.0": 0,
+        "inf": 1,
+    }
+    assert metrics.challenges == 1
+
+
+def test_requests_in_window() -> None:
+    """Test that the request rate only counts the trailing day."""
+    metrics = ApiMetrics()
+    with patch("time.monotonic", return_value=0.0):
+        metrics.record_request("token", 0.1, "200")
+    with patch("time.monotonic", return_value=3600.0 * 12):
+        metrics.record_request("usage", 0.1, "200")
+        metrics.record_request("usage", 0.1, "200")
+        assert metrics.requests_in_window() == 3  # noqa: PLR2004
+    with patch("time.monotonic", return_value=3600.0 * 24):
+        assert metrics.requests_in_window() == 2  # noqa: PLR2004
+    with patch("time.monotonic", return_value=3600.0 * 36):
+        assert metrics.requests_in_window() == 0
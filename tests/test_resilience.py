@@ -0,0 +1,90 @@
+"""Tests for the retry policy and circuit breaker."""
+
+from datetime import UTC, datetime, timedelta
+from email.utils import format_datetime
+from unittest.mock import patch
+
+import pytest
+
+from custom_components.talquin_electric.resilience import (
+    CircuitBreaker,
+    CircuitState,
+    RetryPolicy,
+    parse_retry_after,
+)
+
+
+def test_retry_policy_backoff() -> None:
+    """Test exponential backoff capped at the maximum delay."""
+    policy = RetryPolicy(base_delay=1.0, max_delay=5.0, jitter=0.0)
+
+    assert [policy.delay(attempt) for attempt in range(1, 5)] == [1.0, 2.0, 4.0, 5.0]
+
+
+def test_retry_policy_jitter() -> None:
+    """Test that jitter stays within its share of the delay."""
+    policy = RetryPolicy(base_delay=10.0, max_delay=10.0, jitter=0.2)
+
+    for _ in range(100):
+        assert 8.0 <= policy.delay(1) <= 12.0  # noqa: PLR2004
+
+
+def test_parse_retry_after() -> None:
+    """Test Retry-After given in seconds or as an HTTP date."""
+    in_a_minute = datetime.now(UTC) + timedelta(minutes=1)
+
+    assert parse_retry_after(None) is None
+    assert parse_retry_after("120") == 120.0  # noqa: PLR2004
+    assert parse_retry_after("-5") == 0.0
+    assert parse_retry_after("soon") is None
+    assert 55 < parse_retry_after(format_datetime(in_a_minute, usegmt=True)) <= 60  # noqa: PLR2004
+
+
+def test_circuit_breaker_opens_after_threshold() -> None:
+    """Test that consecutive failures open the breaker until it cools down."""
+    breaker = CircuitBreaker(failure_threshold=2, cooldown=60.0)
+    with patch("time.monotonic", return_value=1000.0):
+        breaker.record_failure(TimeoutError("first"))
+        assert breaker.state is CircuitState.CLOSED
+        breaker.record_failure(TimeoutError("second"))
+        assert breaker.state is CircuitState.OPEN
+        assert not breaker.allow_request()
+        assert breaker.as_dict() == {
+            "state": CircuitState.OPEN,
+            "consecutive_failures": 2,
+            "cooldown_remaining": 60.0,
+            "last_error": "second",
+        }
+
+    with patch("time.monotonic", return_value=1061.0):
+        assert breaker.state is CircuitState.HALF_OPEN
+        assert breaker.allow_request()
+        breaker.record_success()
+        assert breaker.state is CircuitState.CLOSED
+        assert breaker.consecutive_failures == 0
+
+
+def test_circuit_breaker_half_open_failure_reopens() -> None:
+    """Test that a failed trial call re-opens the breaker."""
+    breaker = CircuitBreaker(failure_threshold=5, cooldown=60.0)
+    with patch("time.monotonic", return_value=1000.0):
+        breaker.trip(RuntimeError("challenge"))
+    with patch("time.monotonic", return_value=1061.0):
+        breaker.record_failure(TimeoutError("still down"))
+        assert breaker.state is CircuitState.OPEN
+        assert breaker.cooldown_remaining == pytest.approx(60.0)
+
+
+def test_circuit_breaker_half_open_allows_one_trial() -> None:
+    """Test that only one caller gets the trial call until it finishes."""
+    breaker = CircuitBreaker(failure_threshold=5, cooldown=60.0)
+    with patch("time.monotonic", return_value=1000.0):
+        breaker.trip(RuntimeError("challenge"))
+    with patch("time.monotonic", return_value=1061.0):
+        assert breaker.allow_request()
+        assert not breaker.allow_request()
+        breaker.end_trial()
+        assert breaker.allow_request()
+        breaker.record_success()
+        assert breaker.allow_request()
+        assert breaker.allow_request()
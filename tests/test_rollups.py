@@ -0,0 +1,87 @@
+"""Tests for the precomputed usage rollups."""
+
+from datetime import UTC, datetime, timedelta
+from zoneinfo import ZoneInfo
+
+import pytest
+
+from custom_components.talquin_electric.rollups import (
+    UsageRollup,
+    cycle_start,
+    cycle_starts,
+)
+from custom_components.talquin_electric.usage_series import UsageSeries
+
+START = datetime.fromisoformat("2021-01-30T00:00:00Z")
+EASTERN = ZoneInfo("America/New_York")
+
+
+def _hourly_usage(hours: int) -> UsageSeries:
+    """Return hourly readings whose value is their hour of the day."""
+    return UsageSeries(
+        (int((START + timedelta(hours=hour)).timestamp()) for hour in range(hours)),
+        (float(hour % 24) for hour in range(hours)),
+    )
+
+
+def test_total_and_peak() -> None:
+    """Test range totals and peaks against re-summing the rows."""
+    usage = _hourly_usage(24 * 5)
+    rollup = UsageRollup(usage)
+
+    for start_hour, end_hour in [(0, 120), (3, 4), (5, 77), (23, 49), (119, 120)]:
+        start = START + timedelta(hours=start_hour)
+        end = START + timedelta(hours=end_hour)
+        rows = usage.between(start, end).values
+        assert rollup.total(start, end) == pytest.approx(sum(rows))
+        assert rollup.peak(start, end) == max(rows)
+
+    assert rollup.total(START, START) == 0.0
+    assert rollup.peak(START - timedelta(days=1), START) is None
+    assert UsageRollup(UsageSeries()).peak() is None
+
+
+def test_daily_and_monthly_rollups() -> None:
+    """Test that daily and monthly buckets follow the local time zone."""
+    rollup = UsageRollup(_hourly_usage(24 * 3), tz=EASTERN)
+
+    daily = rollup.daily()
+    assert [entry.date.astimezone(EASTERN).day for entry in daily] == [29, 30, 31, 1]
+    assert list(daily.values) == [
+        sum(range(5)),
+        sum(range(24)),
+        sum(range(24)),
+        sum(range(5, 24)),
+    ]
+    monthly = rollup.monthly()
+    assert [entry.date.astimezone(EASTERN).month for entry in monthly] == [1, 2]
+    assert sum(monthly.values) == sum(daily.values)
+
+
+def test_billing_cycles() -> None:
+    """Test billing cycles starting mid-month, clamped to short months."""
+    assert cycle_start(
+        datetime(2021, 3, 10, tzinfo=UTC), UTC, billing_cycle_day=15
+    ) == datetime(2021, 2, 15, tzinfo=UTC)
+    assert cycle_start(
+        datetime(2021, 3, 10, tzinfo=UTC), UTC, billing_cycle_day=31
+    ) == datetime(2021, 2, 28, tzinfo=UTC)
+    assert list(
+        cycle_starts(
+            datetime(2021, 1, 20, tzinfo=UTC),
+            datetime(2021, 3, 1, tzinfo=UTC),
+            UTC,
+            billing_cycle_day=31,
+        )
+    ) == [
+        datetime(2021, 1, 31, tzinfo=UTC) - timedelta(days=31),
+        datetime(2021, 1, 31, tzinfo=UTC),
+        datetime(2021, 2, 28, tzinfo=UTC),
+        datetime(2021, 3, 31, tzinfo=UTC),
+    ]
+
+    rollup = UsageRollup(_hourly_usage(24 * 3), billing_cycle_day=31)
+    assert list(rollup.billing_cycles().values) == [sum(range(24)), 2 * sum(range(24))]
+    assert rollup.current_cycle_total() == 2 * sum(range(24))
+    assert rollup.current_cycle_peak() == 23.0  # noqa: PLR2004
+    assert rollup.last_day_total() == sum(range(24))
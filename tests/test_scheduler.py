@@ -0,0 +1,68 @@
+"""Tests for the adaptive poll scheduler."""
+
+from datetime import datetime, timedelta
+
+from custom_components.talquin_electric.const import (
+    POLL_INTERVAL_DEFAULT,
+    POLL_INTERVAL_DENSE,
+    POLL_INTERVAL_MAX,
+    POLL_JITTER,
+)
+from custom_components.talquin_electric.scheduler import PollScheduler
+
+DAY = datetime.fromisoformat("2021-01-10T00:00:00Z")
+
+
+def _learned_scheduler() -> PollScheduler:
+    """Return a scheduler that has seen data published at 08:00 UTC."""
+    scheduler = PollScheduler()
+    for day in range(5):
+        scheduler.record_poll(DAY - timedelta(days=day + 1, hours=-8), new_data=True)
+    return scheduler
+
+
+def test_default_interval_until_learned() -> None:
+    """Test that the default interval is used before publications are learned."""
+    scheduler = PollScheduler()
+    scheduler.record_poll(DAY, new_data=True)
+
+    assert scheduler.publication_hours() == set()
+    assert scheduler.next_interval(DAY) == POLL_INTERVAL_DEFAULT
+
+
+def test_dense_polling_in_publication_window() -> None:
+    """Test dense polls in the learned hour until that day's data arrives."""
+    scheduler = _learned_scheduler()
+    in_window = DAY + timedelta(hours=8, minutes=10)
+
+    assert scheduler.publication_hours() == {8}
+    assert scheduler.next_interval(in_window) == POLL_INTERVAL_DENSE
+
+    scheduler.record_poll(in_window, new_data=True)
+    interval = scheduler.next_interval(in_window)
+    assert interval > POLL_INTERVAL_DENSE
+    assert interval <= POLL_INTERVAL_DEFAULT * (1 + POLL_JITTER)
+
+
+def test_backoff_does_not_skip_window() -> None:
+    """Test that idle polls back off but wake up for the next window."""
+    scheduler = _learned_scheduler()
+    for _ in range(10):
+        scheduler.record_poll(DAY, new_data=False)
+
+    assert scheduler.next_interval(DAY + timedelta(hours=1)) <= POLL_INTERVAL_MAX * (
+        1 + POLL_JITTER
+    )
+    assert scheduler.next_interval(DAY + timedelta(hours=7, minutes=30)) == timedelta(
+        minutes=30
+    )
+
+
+def test_state_round_trip() -> None:
+    """Test that learned state survives a restart."""
+    scheduler = _learned_scheduler()
+
+    restored = PollScheduler(scheduler.as_dict())
+
+    assert restored.as_dict() == scheduler.as_dict()
+    assert restored.publication_hours() == {8}
@@ -0,0 +1,60 @@
+"""Tests for the long-term statistics import."""
+
+from datetime import datetime, timedelta
+
+from custom_components.talquin_electric.statistics import (
+    build_statistics,
+    usage_statistic_id,
+)
+from custom_components.talquin_electric.usage_entry import TalquinElectricUsageEntry
+from custom_components.talquin_electric.usage_series import UsageSeries
+
+
+def test_usage_statistic_id() -> None:
+    """Test that account IDs are turned into valid statistic IDs."""
+    assert (
+        usage_statistic_id("12-3456") == "talquin_electric:energy_consumption_12_3456"
+    )
+
+
+def test_build_statistics_continues_running_sum() -> None:
+    """Test that the running sum continues from the last imported statistic."""
+    usage = UsageSeries.from_entries(
+        [
+            TalquinElectricUsageEntry(
+                datetime.fromisoformat("2021-01-20T05:30:00Z"), 1.5
+            ),
+            TalquinElectricUsageEntry(
+                datetime.fromisoformat("2021-01-21T05:00:00Z"), 2.0
+            ),
+        ]
+    )
+
+    statistics = build_statistics(usage, base_sum=10.0)
+
+    assert [stat["start"] for stat in statistics] == [
+        datetime.fromisoformat("2021-01-20T05:00:00Z"),
+        datetime.fromisoformat("2021-01-21T05:00:00Z"),
+    ]
+    assert [stat["state"] for stat in statistics] == [1.5, 2.0]
+    assert [stat["sum"] for stat in statistics] == [11.5, 13.5]
+
+
+def test_build_statistics_aggregates_to_hours() -> None:
+    """Test that readings finer than an hour are summed into their hour."""
+    usage = UsageSeries.from_entries(
+        TalquinElectricUsageEntry(
+            datetime.fromisoformat("2021-01-20T05:00:00Z") + timedelta(minutes=15 * i),
+            0.25 * (i + 1),
+        )
+        for i in range(6)
+    )
+
+    statistics = build_statistics(usage, base_sum=0.0)
+
+    assert [stat["start"] for stat in statistics] == [
+        datetime.fromisoformat("2021-01-20T05:00:00Z"),
+        datetime.fromisoformat("2021-01-20T06:00:00Z"),
+    ]
+    assert [stat["state"] for stat in statistics] == [2.5, 2.75]
+    assert [stat["sum"] for stat in statistics] == [2.5, 5.25]
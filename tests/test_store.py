@@ -0,0 +1,111 @@
+"""Tests for the persistent usage store."""
+
+from datetime import datetime
+from unittest.mock import AsyncMock, Mock, patch
+
+import pytest
+
+from custom_components.talquin_electric.const import STORAGE_SAVE_DELAY, UsageInterval
+from custom_components.talquin_electric.store import (
+    StoredUsage,
+    TalquinElectricUsageStore,
+)
+from custom_components.talquin_electric.usage_entry import TalquinElectricUsageEntry
+from custom_components.talquin_electric.usage_series import UsageSeries
+
+USAGE = {
+    "1234": UsageSeries.from_entries(
+        [
+            TalquinElectricUsageEntry(
+                datetime.fromisoformat("2021-01-20T05:00:00Z"), 1.5
+            ),
+            TalquinElectricUsageEntry(
+                datetime.fromisoformat("2021-01-21T05:00:00Z"), 2.0
+            ),
+        ]
+    ),
+}
+SCHEDULER = {"idle_polls": 2}
+ESTIMATORS = {"1234": {"last_timestamp": 1611205200, "days": 1}}
+STORED = {
+    "accounts": {"1234": [[1611118800, 1.5], [1611205200, 2.0]]},
+    "scheduler": SCHEDULER,
+    "interval": "hourly",
+    "estimators": ESTIMATORS,
+}
+
+
+@patch("custom_components.talquin_electric.store.Store")
+def test_store_schedule_save(mock_store_class: Mock) -> None:
+    """Test that saves are batched and written as compact rows."""
+    store = TalquinElectricUsageStore(Mock(), "entry_id")
+
+    store.async_schedule_save(
+        StoredUsage(
+            usage=USAGE,
+            scheduler=SCHEDULER,
+            interval=UsageInterval.HOURLY,
+            estimators=ESTIMATORS,
+        )
+    )
+
+    data_func, delay = mock_store_class.return_value.async_delay_save.call_args.args
+    assert delay == STORAGE_SAVE_DELAY
+    assert data_func() == STORED
+
+
+@pytest.mark.asyncio
+@patch("custom_components.talquin_electric.store.Store")
+async def test_store_load(mock_store_class: Mock) -> None:
+    """Test that stored rows load back into usage entries."""
+    mock_store_class.return_value.async_load = AsyncMock(return_value=STORED)
+    store = TalquinElectricUsageStore(Mock(), "entry_id")
+
+    assert await store.async_load() == StoredUsage(
+        usage=USAGE,
+        scheduler=SCHEDULER,
+        interval=UsageInterval.HOURLY,
+        estimators=ESTIMATORS,
+    )
+    assert mock_store_class.call_args.args[2] == "talquin_electric.entry_id"
+
+    mock_store_class.return_value.async_load.return_value = None
+    assert await store.async_load() == StoredUsage()
+
+
+@pytest.mark.asyncio
+@patch("custom_components.talquin_electric.store.Store")
+async def test_store_load_without_interval(mock_store_class: Mock) -> None:
+    """Test that usage stored before intervals were selectable loads as daily."""
+    mock_store_class.return_value.async_load = AsyncMock(
+        return_value={"accounts": STORED["accounts"]}
+    )
+    store = TalquinElectricUsageStore(Mock(), "entry_id")
+
+    assert await store.async_load() == StoredUsage(
+        usage=USAGE, interval=UsageInterval.DAILY
+    )
+
+
+@pytest.mark.asyncio
+@patch("custom_components.talquin_electric.store.Store")
+async def test_store_flush(mock_store_class: Mock) -> None:
+    """Test that a flush writes the pending save right away, once."""
+    mock_store_class.return_value.async_save = AsyncMock()
+    store = TalquinElectricUsageStore(Mock(), "entry_id")
+
+    await store.async_flush()
+    mock_store_class.return_value.async_save.assert_not_awaited()
+
+    store.async_schedule_save(
+        StoredUsage(
+            usage=USAGE,
+            scheduler=SCHEDULER,
+            interval=UsageInterval.HOURLY,
+            estimators=ESTIMATORS,
+        )
+    )
+    await store.async_flush()
+    await store.async_flush()
+
+    mock_store_class.return_value.async_save.assert_awaited_once_with(STORED)
@@ -0,0 +1,91 @@
+"""Tests for the tariff and cost engine."""
+
+from datetime import UTC, datetime
+
+import pytest
+
+from custom_components.talquin_electric.const import (
+    CONF_CUSTOMER_CHARGE,
+    CONF_ENERGY_RATE,
+    CONF_SUMMER_ENERGY_RATE,
+    CONF_TIER_RATE,
+    CONF_TIER_THRESHOLD,
+)
+from custom_components.talquin_electric.rollups import UsageRollup
+from custom_components.talquin_electric.tariff import (
+    Tariff,
+    TariffSeason,
+    TariffTier,
+    UsageCost,
+)
+from custom_components.talquin_electric.usage_series import UsageSeries
+from tests.conftest import daily_usage
+
+TIERED = Tariff(
+    tiers=(TariffTier(0.10, 1000.0), TariffTier(0.15)),
+    customer_charge=30.0,
+    seasons=(
+        TariffSeason(frozenset({6, 7, 8}), (TariffTier(0.12, 1000.0), TariffTier(0.2))),
+    ),
+)
+
+
+def test_energy_cost_tiers_and_seasons() -> None:
+    """Test that tiers apply to the cycle's usage and follow the season."""
+    assert TIERED.energy_cost(0.0, 1) == 0.0
+    assert TIERED.energy_cost(500.0, 1) == pytest.approx(50.0)
+    assert TIERED.energy_cost(1500.0, 1) == pytest.approx(100.0 + 75.0)
+    assert TIERED.energy_cost(1500.0, 7) == pytest.approx(120.0 + 100.0)
+
+
+def test_from_options() -> None:
+    """Test building the tariff from the options flow's fields."""
+    assert Tariff.from_options({}) is None
+    assert Tariff.from_options({CONF_ENERGY_RATE: 0.1}) == Tariff(
+        tiers=(TariffTier(0.1),)
+    )
+    tariff = Tariff.from_options(
+        {
+            CONF_CUSTOMER_CHARGE: 30.0,
+            CONF_ENERGY_RATE: 0.1,
+            CONF_TIER_THRESHOLD: 1000.0,
+            CONF_TIER_RATE: 0.15,
+            CONF_SUMMER_ENERGY_RATE: 0.12,
+        }
+    )
+    assert tariff is not None
+    assert tariff.customer_charge == 30.0  # noqa: PLR2004
+    assert tariff.tiers_for(1) == (TariffTier(0.1, 1000.0), TariffTier(0.15))
+    assert tariff.tiers_for(7) == (TariffTier(0.12, 1000.0), TariffTier(0.15))
+
+
+def test_daily_and_cycle_costs() -> None:
+    """Test that days crossing a tier breakpoint are priced at both tiers."""
+    # 40 kWh a day from January 1 through February 10
+    cost = UsageCost(
+        UsageRollup(daily_usage(datetime(2021, 1, 1, tzinfo=UTC), 41, 40.0)), TIERED
+    )
+
+    daily = list(cost.daily().values)
+    assert len(daily) == 41  # noqa: PLR2004
+    # 1000 kWh are reached on day 25; day 26 onwards is at the second tier
+    assert daily[:25] == pytest.approx([4.0] * 25)
+    assert daily[25:31] == pytest.approx([6.0] * 6)
+    assert daily[31:] == pytest.approx([4.0] * 10)
+
+    cycles = list(cost.billing_cycles().values)
+    assert cycles == pytest.approx([30.0 + 100.0 + 36.0, 30.0 + 40.0])
+    assert cost.current_cycle_cost() == pytest.approx(70.0)
+    assert cost.last_day_cost() == pytest.approx(4.0)
+    # 400 kWh in 10 days projects to 1120 kWh over February's 28 days
+    assert cost.projected_cycle_cost() == pytest.approx(30.0 + 100.0 + 18.0)
+
+
+def test_costs_of_empty_usage() -> None:
+    """Test that there is nothing to price without usage."""
+    cost = UsageCost(UsageRollup(UsageSeries()), TIERED)
+    assert not cost.daily()
+    assert not cost.billing_cycles()
+    assert cost.last_day_cost() is None
+    assert cost.current_cycle_cost() is None
+    assert cost.projected_cycle_cost() is None
@@ -0,0 +1,39 @@
+"""Tests for the bulk timestamp parser."""
+
+from datetime import datetime
+
+import pytest
+
+from custom_components.talquin_electric.timestamps import parse_timestamps
+
+
+def test_parse_timestamps_matches_fromisoformat() -> None:
+    """Test the fast path and fallbacks against `datetime.fromisoformat`."""
+    date_times = [
+        "2021-01-20T17:00:00Z",
+        "2021-01-20T18:15:00Z",
+        "2021-01-21T17:00:00Z",
+        "2020-02-29T23:59:59Z",
+        "1969-12-31T23:00:00Z",
+        "2021-01-20T17:00:00+00:00",
+        "2021-01-20T12:00:00-05:00",
+        "2021-03-14T07:30:00+05:30",
+        "2021-01-20 17:00:00Z",
+        "2021-01-20T17:00:00.500Z",
+        "2021-01-20T17:00Z",
+        "2021-01-20T17:00:00+0000",
+    ]
+
+    assert parse_timestamps(date_times) == [
+        int(datetime.fromisoformat(date_time).timestamp()) for date_time in date_times
+    ]
+
+
+@pytest.mark.parametrize(
+    "date_time",
+    ["2021-02-30T17:00:00Z", "2021-01-20T24:00:00Z", "not a date at all!!!", ""],
+)
+def test_parse_timestamps_rejects_invalid(date_time: str) -> None:
+    """Test that malformed date-times raise like `datetime.fromisoformat`."""
+    with pytest.raises(ValueError, match="."):
+        parse_timestamps(["2021-01-20T17:00:00Z", date_time])
@@ -0,0 +1,44 @@
+"""Tests for the opt-in refresh tracing."""
+
+from custom_components.talquin_electric.tracing import Tracer
+
+
+def test_disabled_tracer_records_nothing() -> None:
+    """Test that spans are shared no-ops while tracing is off."""
+    tracer = Tracer()
+    tracer.start_trace()
+
+    assert tracer.span("refresh") is tracer.span("login")
+    with tracer.span("refresh"):
+        pass
+    tracer.finish_trace()
+    assert tracer.last_trace == []
+
+
+def test_enabled_tracer_records_spans() -> None:
+    """Test that spans are recorded between the start and end of a trace."""
+    tracer = Tracer()
+    tracer.enabled = True
+    with tracer.span("before"):
+        pass
+
+    tracer.start_trace()
+    with tracer.span("refresh"):
+        with tracer.span("login"):
+            pass
+        with tracer.span("usage_parse"):
+            pass
+    tracer.finish_trace()
+
+    assert [span.name for span in tracer.last_trace] == [
+        "login",
+        "usage_parse",
+        "refresh",
+    ]
+    refresh = tracer.last_trace[-1]
+    assert all(
+        refresh.start <= span.start
+        and span.start + span.duration <= refresh.start + refresh.duration
+        for span in tracer.last_trace
+    )
+    assert tracer.as_dict()["last_trace"][0]["name"] == "login"
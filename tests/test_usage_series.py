@@ -0,0 +1,84 @@
+"""Tests for the compact usage series."""
+
+from datetime import datetime
+
+import pytest
+
+from custom_components.talquin_electric.usage_entry import TalquinElectricUsageEntry
+from custom_components.talquin_electric.usage_series import UsageSeries
+
+
+def _entry(day: int, usage: float) -> TalquinElectricUsageEntry:
+    return TalquinElectricUsageEntry(
+        datetime.fromisoformat(f"2021-01-{day:02d}T05:00:00Z"), usage
+    )
+
+
+def _series(*entries: TalquinElectricUsageEntry) -> UsageSeries:
+    return UsageSeries.from_entries(entries)
+
+
+def test_series_materializes_entries() -> None:
+    """Test that entries are built from the arrays on demand."""
+    series = _series(_entry(2, 2.0), _entry(1, 1.0))
+
+    assert list(series) == [_entry(1, 1.0), _entry(2, 2.0)]
+    assert series[-1] == _entry(2, 2.0)
+    assert series.first_date == _entry(1, 1.0).date
+    assert series.last_date == _entry(2, 2.0).date
+    assert UsageSeries().last_date is None
+
+
+def test_series_rejects_unsorted_timestamps() -> None:
+    """Test that the sorted-order invariant is enforced."""
+    with pytest.raises(ValueError, match="strictly increasing"):
+        UsageSeries([2, 1], [1.0, 2.0])
+    with pytest.raises(ValueError, match="one value per timestamp"):
+        UsageSeries([1, 2], [1.0])
+
+
+def test_series_between_is_a_view() -> None:
+    """Test that date range slicing returns a zero-copy view."""
+    series = _series(*(_entry(day, float(day)) for day in range(1, 11)))
+
+    window = series.between(_entry(3, 0).date, _entry(6, 0).date)
+
+    assert list(window) == [_entry(3, 3.0), _entry(4, 4.0), _entry(5, 5.0)]
+    assert window.values.obj is series.values.obj
+    assert list(series.between(_entry(9, 0).date)) == [_entry(9, 9.0), _entry(10, 10.0)]
+
+
+def test_merge_appends_new_days() -> None:
+    """Test that entries past the watermark are appended in date order."""
+    existing = _series(_entry(1, 1.0), _entry(2, 2.0))
+
+    merged = existing.merge(_series(_entry(4, 4.0), _entry(3, 3.0)))
+
+    assert merged == _series(
+        _entry(1, 1.0), _entry(2, 2.0), _entry(3, 3.0), _entry(4, 4.0)
+    )
+
+
+def test_merge_overlap_corrections_win() -> None:
+    """Test that re-fetched overlap days replace the stored values."""
+    existing = _series(_entry(1, 1.0), _entry(2, 2.0), _entry(3, 3.0))
+
+    merged = existing.merge(_series(_entry(2, 2.5), _entry(3, 3.0)))
+
+    assert merged == _series(_entry(1, 1.0), _entry(2, 2.5), _entry(3, 3.0))
+    assert existing == _series(_entry(1, 1.0), _entry(2, 2.0), _entry(3, 3.0))
+
+
+def test_merge_no_new_rows() -> None:
+    """Test that an empty fetch leaves the series untouched."""
+    existing = _series(_entry(1, 1.0))
+
+    assert existing.merge(UsageSeries()) is existing
+
+
+def test_merge_unchanged_overlap() -> None:
+    """Test that re-fetching the overlap unchanged returns the same series."""
+    existing = _series(_entry(1, 1.0), _entry(2, 2.0), _entry(3, 3.0))
+
+    assert existing.merge(_series(_entry(2, 2.0), _entry(3, 3.0))) is existing
+    assert existing.merge(_series(_entry(3, 3.0), _entry(4, 4.0))) is not existing